@@ -27,8 +27,24 @@ UNDERSTAT_LEAGUE_MAP = {
     "PPL": "RFPL"     # Russian Premier League
 }
 
+# TheSportsDB idLeague of each competition, used to scope its score rows to one competition's teams
+SPORTSDB_LEAGUE_MAP = {
+    "CL": "4480",   # UEFA Champions League
+    "PL": "4328",   # English Premier League
+    "PPL": "4344",  # Portuguese Primeira Liga
+    "DED": "4337",  # Dutch Eredivisie
+    "BL1": "4331",  # German Bundesliga
+    "FL1": "4334",  # French Ligue 1
+    "SA": "4332",   # Italian Serie A
+    "PD": "4335",   # Spanish La Liga
+    "BSA": "4351",  # Brazilian Serie A
+    "ELC": "4329",  # English League Championship
+}
+
 DEFAULT_SEASONS = [str(x) for x in range(2021, 2025)]
 
+FOOTBALL_DATA_BASE_URL = "https://api.football-data.org/v4/"
+
 
 @dataclass(frozen=True)
 class PipelineSettings:
@@ -36,6 +52,19 @@ class PipelineSettings:
     training_seasons: list[str]
     prediction_days: int
     site_export_days: int
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800
+    query_cache_enabled: bool = True
+    prediction_cache_enabled: bool = True
+    http_cache_enabled: bool = True
+    http_cache_dir: str = ".cache/http"
+    payload_archive_enabled: bool = True
+    payload_archive_dir: str = "archive"
+    replay: bool = False
+    football_data_base_url: str = FOOTBALL_DATA_BASE_URL
+    football_data_rate_limit: int = 10
 
 
 def _parse_seasons(raw: str | None) -> list[str]:
@@ -65,12 +94,44 @@ def _parse_positive_int(raw: str | None, default: int) -> int:
     return value if value > 0 else default
 
 
+def _parse_non_negative_int(raw: str | None, default: int) -> int:
+    if raw is None or raw.strip() == "":
+        return default
+    value = int(raw)
+    return value if value >= 0 else default
+
+
+def _parse_bool(raw: str | None, default: bool) -> bool:
+    if raw is None or raw.strip() == "":
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _parse_base_url(raw: str | None, default: str) -> str:
+    if raw is None or raw.strip() == "":
+        return default
+    return raw.strip().rstrip("/") + "/"
+
+
 def load_settings() -> PipelineSettings:
     return PipelineSettings(
         competitions_map=_parse_competitions(os.getenv("SOCCER_ANALYTICS_COMPETITIONS")),
         training_seasons=_parse_seasons(os.getenv("SOCCER_ANALYTICS_TRAINING_SEASONS")),
         prediction_days=_parse_positive_int(os.getenv("SOCCER_ANALYTICS_PREDICTION_DAYS"), 3),
         site_export_days=_parse_positive_int(os.getenv("SOCCER_ANALYTICS_SITE_EXPORT_DAYS"), 1),
+        db_pool_size=_parse_positive_int(os.getenv("SOCCER_ANALYTICS_DB_POOL_SIZE"), 5),
+        db_max_overflow=_parse_non_negative_int(os.getenv("SOCCER_ANALYTICS_DB_MAX_OVERFLOW"), 10),
+        db_pool_pre_ping=_parse_bool(os.getenv("SOCCER_ANALYTICS_DB_POOL_PRE_PING"), True),
+        db_pool_recycle=_parse_positive_int(os.getenv("SOCCER_ANALYTICS_DB_POOL_RECYCLE"), 1800),
+        query_cache_enabled=_parse_bool(os.getenv("SOCCER_ANALYTICS_QUERY_CACHE"), True),
+        prediction_cache_enabled=_parse_bool(os.getenv("SOCCER_ANALYTICS_PREDICTION_CACHE"), True),
+        http_cache_enabled=_parse_bool(os.getenv("SOCCER_ANALYTICS_HTTP_CACHE"), True),
+        http_cache_dir=os.getenv("SOCCER_ANALYTICS_HTTP_CACHE_DIR") or ".cache/http",
+        payload_archive_enabled=_parse_bool(os.getenv("SOCCER_ANALYTICS_PAYLOAD_ARCHIVE"), True),
+        payload_archive_dir=os.getenv("SOCCER_ANALYTICS_PAYLOAD_ARCHIVE_DIR") or "archive",
+        replay=_parse_bool(os.getenv("SOCCER_ANALYTICS_REPLAY"), False),
+        football_data_base_url=_parse_base_url(os.getenv("FOOTBALL_DATA_BASE_URL"), FOOTBALL_DATA_BASE_URL),
+        football_data_rate_limit=_parse_positive_int(os.getenv("SOCCER_ANALYTICS_FOOTBALL_DATA_RATE_LIMIT"), 10),
     )
 
 
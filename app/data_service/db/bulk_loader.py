@@ -0,0 +1,224 @@
+import csv
+import io
+import itertools
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from sqlalchemy import JSON, Table, insert
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+# Rows per executemany call on the SQLite fallback
+BATCH_SIZE = 10_000
+
+# Size of the CSV chunks handed to COPY FROM STDIN
+_COPY_CHUNK = 256 * 1024
+
+_NULL = r"\N"
+
+@dataclass
+class BulkLoadResult:
+    table: str
+    rows: int
+    seconds: float
+    method: str
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+    def __str__(self) -> str:
+        return (f"{self.table}: {self.rows} rows in {self.seconds:.2f}s "
+                f"({self.rows_per_second:,.0f} rows/s via {self.method})")
+
+def bulk_upsert(
+    conn: Connection,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    key_columns: Sequence[str] = ("id",),
+    update_columns: Optional[Sequence[str]] = None,
+    batch_size: int = BATCH_SIZE
+) -> BulkLoadResult:
+    """
+    Inserts rows, updating the stored row on a key conflict.
+    update_columns defaults to every loaded non-key column; an empty list
+    keeps existing rows untouched (insert-if-missing). When a key appears
+    more than once, the last row wins. Every row must carry the keys of
+    the first one.
+    """
+    return _load(conn, table, rows, list(key_columns), update_columns, batch_size)
+
+def bulk_insert(
+    conn: Connection,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = BATCH_SIZE
+) -> BulkLoadResult:
+    """Appends rows, for tables that are replaced per scope (standings, player form)."""
+    return _load(conn, table, rows, None, None, batch_size)
+
+def _load(
+    conn: Connection,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    keys: Optional[List[str]],
+    updates: Optional[Sequence[str]],
+    batch_size: int
+) -> BulkLoadResult:
+    started = time.perf_counter()
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return BulkLoadResult(table.name, 0, 0.0, "none")
+
+    columns = list(first)
+    if keys is not None and updates is None:
+        updates = [c for c in columns if c not in keys]
+    rows = itertools.chain([first], rows)
+
+    if conn.dialect.name == "postgresql":
+        count = _copy_load(conn, table, rows, columns, keys, updates)
+        method = "COPY"
+    else:
+        count = _executemany_load(conn, table, rows, keys, updates, batch_size)
+        method = "executemany"
+
+    result = BulkLoadResult(table.name, count, time.perf_counter() - started, method)
+    logger.info(f"Bulk loaded {result}")
+    return result
+
+def _copy_load(
+    conn: Connection,
+    table: Table,
+    rows: Iterator[Dict[str, Any]],
+    columns: List[str],
+    keys: Optional[List[str]],
+    updates: Sequence[str]
+) -> int:
+    """
+    Streams rows into Postgres with COPY FROM STDIN. Appends go straight
+    into the table; upserts go through a temporary staging table that is
+    merged with a single INSERT ... ON CONFLICT.
+    """
+    preparer = conn.dialect.identifier_preparer
+    quote = lambda names: ", ".join(preparer.quote(name) for name in names)
+    target = preparer.format_table(table)
+    stage = preparer.quote(f"_stage_{table.name}")
+
+    if keys is not None:
+        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {stage}")
+        conn.exec_driver_sql(f"CREATE TEMP TABLE {stage} (LIKE {target} INCLUDING DEFAULTS)")
+        # Load order, so a repeated key resolves to its last row
+        conn.exec_driver_sql(f"ALTER TABLE {stage} ADD COLUMN _load_seq BIGSERIAL")
+
+    stream = _CsvStream(rows, [_copy_encoder(table.c[name]) for name in columns], columns)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {stage if keys is not None else target} ({quote(columns)}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{_NULL}')",
+            stream
+        )
+    finally:
+        cursor.close()
+
+    if keys is not None:
+        if updates:
+            action = "DO UPDATE SET " + ", ".join(
+                f"{preparer.quote(c)} = EXCLUDED.{preparer.quote(c)}" for c in updates
+            )
+        else:
+            action = "DO NOTHING"
+        conn.exec_driver_sql(
+            f"INSERT INTO {target} ({quote(columns)}) "
+            f"SELECT DISTINCT ON ({quote(keys)}) {quote(columns)} FROM {stage} "
+            f"ORDER BY {quote(keys)}, _load_seq DESC "
+            f"ON CONFLICT ({quote(keys)}) {action}"
+        )
+        conn.exec_driver_sql(f"DROP TABLE {stage}")
+    return stream.rows
+
+def _executemany_load(
+    conn: Connection,
+    table: Table,
+    rows: Iterator[Dict[str, Any]],
+    keys: Optional[List[str]],
+    updates: Sequence[str],
+    batch_size: int
+) -> int:
+    if keys is None:
+        statement = insert(table)
+    else:
+        statement = sqlite.insert(table)
+        if updates:
+            statement = statement.on_conflict_do_update(
+                index_elements=keys, set_={c: statement.excluded[c] for c in updates}
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=keys)
+
+    count = 0
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return count
+        conn.execute(statement, batch)
+        count += len(batch)
+
+def _copy_encoder(column) -> Callable[[Any], Any]:
+    if isinstance(column.type, JSON):
+        return lambda value: _NULL if value is None else json.dumps(value)
+
+    def encode(value: Any) -> Any:
+        if value is None:
+            return _NULL
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        if isinstance(value, datetime):
+            return value.isoformat(sep=" ")
+        if isinstance(value, date):
+            return value.isoformat()
+        return value
+    return encode
+
+class _CsvStream(io.TextIOBase):
+    """File-like view of rows as CSV, produced lazily as COPY reads it."""
+    def __init__(self, rows: Iterator[Dict[str, Any]], encoders: List[Callable], columns: List[str]):
+        self.rows = 0
+        self._chunks = self._encode(rows, encoders, columns)
+        self._buffer = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        while size is None or size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size is None or size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def _encode(self, rows, encoders, columns) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        pairs = list(zip(columns, encoders))
+        for row in rows:
+            writer.writerow([encode(row[name]) for name, encode in pairs])
+            self.rows += 1
+            if buffer.tell() >= _COPY_CHUNK:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
@@ -1,10 +1,14 @@
 import json
+import pickle
+import threading
+import time
+import zlib
 import redis
 from redis.connection import ConnectionPool
 import os
 from dotenv import load_dotenv
 from datetime import timedelta
-from typing import Optional, Any, cast
+from typing import Optional, Any, Dict, Iterable, List, cast
 
 load_dotenv()
 # Connect to Redis
@@ -20,25 +24,77 @@ redis_pool = ConnectionPool(
     decode_responses=True,
     max_connections=10
 )
+# Binary values (pickled/compressed payloads) need a pool without decoding.
+redis_binary_pool = ConnectionPool(
+    host=redis_host,
+    port=redis_port,
+    password=redis_password,
+    db=redis_db,
+    decode_responses=False,
+    max_connections=10
+)
 # 5-minute cache
-TTL = timedelta(minutes=5).seconds 
+TTL = timedelta(minutes=5).seconds
+# Health is re-checked at most this often instead of on every call
+HEALTH_CHECK_INTERVAL = 5
+# Payloads larger than this are zlib-compressed
+COMPRESS_THRESHOLD = 1024
+SCAN_BATCH_SIZE = 500
+
+_RAW = b"P"
+_COMPRESSED = b"Z"
+
+_health_lock = threading.Lock()
+_health = {"ok": True, "checked_at": float("-inf")}
 
 def get_redis_client():
     return redis.Redis(connection_pool=redis_pool)
 
+def get_binary_redis_client():
+    return redis.Redis(connection_pool=redis_binary_pool)
+
 def check_redis_health() -> bool:
     """Check if Redis is available"""
     try:
         client = get_redis_client()
         client.ping()
+        _record_health(True)
         return True
     except Exception as e:
         print(f"Redis health check failed: {e}")
+        _record_health(False)
         return False
 
+def redis_is_healthy() -> bool:
+    """Cached health status; only pings when the last check is older than HEALTH_CHECK_INTERVAL."""
+    with _health_lock:
+        if time.monotonic() - _health["checked_at"] < HEALTH_CHECK_INTERVAL:
+            return bool(_health["ok"])
+    return check_redis_health()
+
+def _record_health(ok: bool):
+    with _health_lock:
+        _health["ok"] = ok
+        _health["checked_at"] = time.monotonic()
+
+def serialize(value: Any, compress_threshold: int = COMPRESS_THRESHOLD) -> bytes:
+    """Pickle a value, compressing it when the pickle is larger than compress_threshold bytes."""
+    payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(payload) > compress_threshold:
+        return _COMPRESSED + zlib.compress(payload, 6)
+    return _RAW + payload
+
+def deserialize(data: bytes) -> Any:
+    header, payload = data[:1], data[1:]
+    if header == _COMPRESSED:
+        payload = zlib.decompress(payload)
+    elif header != _RAW:
+        raise ValueError(f"Unknown cache payload header: {header!r}")
+    return pickle.loads(payload)
+
 def get_cache(key: str) -> Optional[Any]:
     """Retrieve JSON value from cache."""
-    try: 
+    try:
         redis_client = get_redis_client()
         value = redis_client.get(key)
         if value is not None:
@@ -49,16 +105,62 @@ def get_cache(key: str) -> Optional[Any]:
 
 def set_cache(key: str, value, ttl: int = TTL) -> bool:
     """Store Python object as JSON in cache."""
-    if not check_redis_health():
+    if not redis_is_healthy():
         return False
     try:
         redis_client = get_redis_client()
         redis_client.setex(key, ttl, json.dumps(value))
         return True
     except (redis.RedisError, json.JSONDecodeError) as e:
+        _record_health(False)
         print(f"Cache set error, key: '{key}'. Error:'{e}'")
     return False
 
+def get_binary(key: str) -> Optional[Any]:
+    """Retrieve a value stored with set_binary/set_many."""
+    return get_many([key]).get(key)
+
+def set_binary(key: str, value: Any, ttl: int = TTL) -> bool:
+    """Store any picklable object (DataFrames, numpy arrays, ...) in its compact binary form."""
+    return set_many({key: value}, ttl) == 1
+
+def get_many(keys: Iterable[str]) -> Dict[str, Any]:
+    """Fetch several binary values with a single MGET; missing keys are left out."""
+    keys_list = list(keys)
+    if not keys_list or not redis_is_healthy():
+        return {}
+    try:
+        values = cast(List[Optional[bytes]], get_binary_redis_client().mget(keys_list))
+    except redis.RedisError as e:
+        _record_health(False)
+        print(f"Cache multi-get error, {len(keys_list)} keys. Error:'{e}'")
+        return {}
+
+    found = {}
+    for key, raw in zip(keys_list, values):
+        if raw is None:
+            continue
+        try:
+            found[key] = deserialize(raw)
+        except Exception as e:
+            print(f"Cache decode error, key: '{key}'. Error:'{e}'")
+    return found
+
+def set_many(values: Dict[str, Any], ttl: int = TTL) -> int:
+    """Store several binary values in one pipelined round trip. Returns how many were written."""
+    if not values or not redis_is_healthy():
+        return 0
+    try:
+        pipeline = get_binary_redis_client().pipeline(transaction=False)
+        for key, value in values.items():
+            pipeline.set(key, serialize(value), ex=ttl)
+        return sum(1 for ok in pipeline.execute() if ok)
+    except (redis.RedisError, pickle.PicklingError, TypeError) as e:
+        if isinstance(e, redis.RedisError):
+            _record_health(False)
+        print(f"Cache multi-set error, {len(values)} keys. Error:'{e}'")
+        return 0
+
 def delete_cache(key: str) -> bool:
     '''delete a specific cache key'''
     try:
@@ -69,16 +171,20 @@ def delete_cache(key: str) -> bool:
         print(f"Cache delete error, key: '{key}'. Error:'{e}'")
         return False
 
-def clear_all_pattern(pattern: str) -> int:
-    '''delete all the keys matching the pattern'''
+def clear_all_pattern(pattern: str, batch_size: int = SCAN_BATCH_SIZE) -> int:
+    '''delete all the keys matching the pattern, using incremental SCAN instead of blocking KEYS'''
     try:
         redis_client = get_redis_client()
-        keys = redis_client.keys(pattern)
-        keys_list = cast(list, keys) or []
-        if keys_list:
-            result = redis_client.delete(*keys_list)
-            return int(cast(int, result)) if result else 0
-        return 0
+        deleted = 0
+        batch = []
+        for key in redis_client.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += int(cast(int, redis_client.unlink(*batch)))
+                batch = []
+        if batch:
+            deleted += int(cast(int, redis_client.unlink(*batch)))
+        return deleted
     except redis.RedisError as e:
         print(f"Cache delete pattern error, pattern: '{pattern}'. Error:'{e}'")
         return 0
@@ -91,4 +197,3 @@ def cache_exist(key: str) -> bool:
     except redis.RedisError as e:
         print(f"Cache exists check error for key '{key}': {e}")
         return False
-
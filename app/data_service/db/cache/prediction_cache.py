@@ -0,0 +1,99 @@
+import hashlib
+import logging
+import threading
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.config import load_settings
+from app.data_service.db.cache.tiered_cache import LocalCache, TieredCache, make_key
+
+logger = logging.getLogger(__name__)
+
+# Keys embed the model fingerprint, so a retrained model never reads old
+# entries; the TTL only bounds entries of models that were replaced.
+PREDICTION_TTL = int(timedelta(days=2).total_seconds())
+# Scores never change for a given key, so the local tier can hold them as long as Redis does
+PREDICTION_LOCAL_TTL = PREDICTION_TTL
+PREDICTION_LOCAL_ENTRIES = 20_000
+
+
+def model_fingerprint(path: str) -> str:
+    """Content hash of a model file; changes whenever the model is retrained."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def feature_digests(rows: np.ndarray) -> List[str]:
+    """One hash per feature row, over the exact float64 values in model column order."""
+    rows = np.ascontiguousarray(rows, dtype=np.float64)
+    return [hashlib.blake2b(row.tobytes(), digest_size=16).hexdigest() for row in rows]
+
+
+class PredictionCache:
+    """
+    Scored probabilities on a dedicated two-tier cache (in-process LRU in
+    front of Redis), keyed by model fingerprint plus feature-row hash. Its
+    own tiers keep the hit ratios separate from the query cache's.
+    """
+    def __init__(self, ttl: int = PREDICTION_TTL, enabled: bool = True, tiers: Optional[TieredCache] = None):
+        self.ttl = ttl
+        self.enabled = enabled
+        self.tiers = tiers if tiers is not None else TieredCache(
+            local=LocalCache(max_entries=PREDICTION_LOCAL_ENTRIES), local_ttl=PREDICTION_LOCAL_TTL
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(fingerprint: str, digest: str) -> str:
+        return make_key("prediction", fingerprint, digest)
+
+    def get_many(self, fingerprint: str, digests: Iterable[str]) -> Dict[str, Dict[str, float]]:
+        digests = list(digests)
+        if not self.enabled or not digests:
+            return {}
+        keys = {self._key(fingerprint, digest): digest for digest in digests}
+        try:
+            found = {keys[key]: value for key, value in self.tiers.get_many(list(keys)).items()}
+        except Exception as e:
+            logger.warning(f"Prediction cache read failed: {e}")
+            found = {}
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(digests) - len(found)
+        return found
+
+    def set_many(self, fingerprint: str, scored: Dict[str, Dict[str, float]]):
+        if not self.enabled or not scored:
+            return
+        try:
+            self.tiers.set_many({self._key(fingerprint, digest): value for digest, value in scored.items()}, self.ttl)
+        except Exception as e:
+            logger.warning(f"Prediction cache write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        tiers = self.tiers.stats()
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "local_hit_ratio": tiers["local"]["hit_ratio"],
+            "redis_hit_ratio": tiers["redis"]["hit_ratio"],
+            "degraded_calls": tiers["degraded_calls"],
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+def default_prediction_cache() -> PredictionCache:
+    return PredictionCache(enabled=load_settings().prediction_cache_enabled)
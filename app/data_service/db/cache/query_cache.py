@@ -0,0 +1,150 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import redis
+
+from app.config import load_settings
+from app.data_service.db.cache.tiered_cache import TieredCache, make_key, tiered_cache
+
+logger = logging.getLogger(__name__)
+
+# Keys embed a data version, so entries are invalidated by bumping the
+# version rather than by expiry; the TTL only bounds abandoned versions.
+QUERY_TTL = int(timedelta(hours=12).total_seconds())
+VERSION_PREFIX = "query_version"
+# How long a process trusts its last-read version before asking Redis again
+VERSION_TTL = 5
+
+
+def competition_scope(competition_id: int) -> str:
+    return f"competition:{competition_id}"
+
+
+MATCHES_SCOPE = "matches"
+TEAMS_SCOPE = "teams"
+COMPETITIONS_SCOPE = "competitions"
+
+
+class QueryCache:
+    """
+    Read-through cache for repository reads on top of the two-tier cache.
+    Keys combine the query name, its parameters and the current version of
+    the data scope they read from (usually a competition). Writes bump the
+    version, which makes every older key unreachable at once. Versions are
+    re-read from Redis at most every VERSION_TTL seconds; when Redis is down
+    the process keeps its own versions and serves from the local tier.
+    Cached values are shared between callers and must be treated as read-only.
+    """
+    def __init__(
+        self,
+        ttl: int = QUERY_TTL,
+        enabled: bool = True,
+        tiers: Optional[TieredCache] = None,
+        version_ttl: float = VERSION_TTL
+    ):
+        self.ttl = ttl
+        self.enabled = enabled
+        self.tiers = tiers if tiers is not None else tiered_cache
+        self.version_ttl = version_ttl
+        self._lock = threading.Lock()
+        self._versions: Dict[str, Tuple[int, float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(
+        self,
+        name: str,
+        scope: str,
+        params: Dict[str, Any],
+        loader: Callable[[], Any],
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda payload: payload
+    ) -> Any:
+        if not self.enabled:
+            return loader()
+
+        key = self._key(name, scope, self._version(scope), params)
+        found = self.tiers.get_many([key])
+        if key in found:
+            self._count("hits")
+            return decode(found[key])
+
+        self._count("misses")
+        value = loader()
+        self.tiers.set(key, encode(value), self.ttl)
+        return value
+
+    def bump(self, *scopes: str):
+        """Invalidate every cached read of the given scopes."""
+        if not self.enabled:
+            return
+        for scope in dict.fromkeys(scopes):
+            local_version = self._version(scope) + 1
+            version = local_version
+            if self.tiers.remote.healthy():
+                try:
+                    version = max(self.tiers.remote.incr(self._version_key(scope)), local_version)
+                except redis.RedisError as e:
+                    logger.warning(f"Could not bump cache version for '{scope}': {e}")
+            with self._lock:
+                self._versions[scope] = (version, time.monotonic())
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "tiers": self.tiers.stats(),
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def _version(self, scope: str) -> int:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._versions.get(scope)
+        if cached and now - cached[1] < self.version_ttl:
+            return cached[0]
+
+        version = cached[0] if cached else 0
+        if self.tiers.remote.healthy():
+            try:
+                version = max(self.tiers.remote.get_int(self._version_key(scope)), version)
+            except redis.RedisError as e:
+                logger.warning(f"Could not read cache version for '{scope}': {e}")
+        with self._lock:
+            self._versions[scope] = (version, now)
+        return version
+
+    @staticmethod
+    def _version_key(scope: str) -> str:
+        return make_key(VERSION_PREFIX, scope)
+
+    @staticmethod
+    def _key(name: str, scope: str, version: int, params: Dict[str, Any]) -> str:
+        digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        return make_key("query", name, scope, f"v{version}", digest)
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+query_cache = QueryCache(enabled=load_settings().query_cache_enabled)
+
+
+def model_to_payload(obj) -> Optional[Dict[str, Any]]:
+    return obj.to_dict() if obj is not None else None
+
+
+def payload_to_model(model, payload: Optional[Dict[str, Any]]):
+    """Rebuild a detached ORM instance from a cached row."""
+    return model(**payload) if payload is not None else None
@@ -0,0 +1,282 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import redis
+
+from app.data_service.db.cache import cache_management
+
+logger = logging.getLogger(__name__)
+
+LOCAL_MAX_ENTRIES = 2048
+LOCAL_TTL = 60
+STALE_TTL = 300
+KEY_SEPARATOR = ":"
+
+
+def make_key(namespace: str, *parts: Any) -> str:
+    """Single key format shared by every cache tier: namespace:part1:part2..."""
+    return KEY_SEPARATOR.join([namespace, *(str(part) for part in parts)])
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    stale_until: float
+
+
+class LocalCache:
+    """
+    Bounded, thread-safe in-process LRU. Entries expire after their TTL but
+    are kept for an extra stale window so callers can serve them while a
+    fresh value is loaded. Expired entries are evicted before live ones
+    when the cache is full.
+    """
+    def __init__(self, max_entries: int = LOCAL_MAX_ENTRIES, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, key: str) -> Tuple[bool, Any, bool]:
+        """Returns (found, value, is_stale)."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.stale_until:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None, False
+            self._entries.move_to_end(key)
+            if now < entry.expires_at:
+                self.hits += 1
+                return True, entry.value, False
+            self.stale_hits += 1
+            return True, entry.value, True
+
+    def set(self, key: str, value: Any, ttl: float, stale_ttl: float = 0):
+        now = self._clock()
+        with self._lock:
+            self._entries[key] = _Entry(value, now + ttl, now + ttl + stale_ttl)
+            self._entries.move_to_end(key)
+            self._evict(now)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float):
+        if len(self._entries) <= self.max_entries:
+            return
+        for key in [k for k, e in self._entries.items() if now >= e.stale_until]:
+            del self._entries[key]
+            self.evictions += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else None,
+        }
+
+
+class RedisTier:
+    """Shared tier backed by the batched binary helpers in cache_management."""
+    def healthy(self) -> bool:
+        return cache_management.redis_is_healthy()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        return cache_management.get_many(keys)
+
+    def set_many(self, values: Dict[str, Any], ttl: int) -> int:
+        return cache_management.set_many(values, ttl)
+
+    def delete(self, key: str) -> bool:
+        return cache_management.delete_cache(key)
+
+    def get_int(self, key: str) -> int:
+        return int(cache_management.get_redis_client().get(key) or 0)
+
+    def incr(self, key: str) -> int:
+        return int(cache_management.get_redis_client().incr(key))
+
+
+class TieredCache:
+    """
+    In-process LRU in front of Redis.
+    Reads check the local tier first, then Redis, and populate the local tier
+    on the way back. When Redis is unhealthy the cache runs in degraded mode
+    on the local tier alone instead of failing every call.
+    """
+    def __init__(
+        self,
+        local: Optional[LocalCache] = None,
+        remote: Optional[RedisTier] = None,
+        local_ttl: float = LOCAL_TTL,
+        stale_ttl: float = STALE_TTL
+    ):
+        self.local = local if local is not None else LocalCache()
+        self.remote = remote if remote is not None else RedisTier()
+        self.local_ttl = local_ttl
+        self.stale_ttl = stale_ttl
+        self._lock = threading.Lock()
+        self._refreshing: set = set()
+        self.remote_hits = 0
+        self.remote_misses = 0
+        self.remote_errors = 0
+        self.degraded_calls = 0
+
+    @property
+    def degraded(self) -> bool:
+        return not self.remote.healthy()
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        found: Dict[str, Any] = {}
+        stale: Dict[str, Any] = {}
+        missing = []
+        for key in keys:
+            hit, value, is_stale = self.local.lookup(key)
+            if hit and not is_stale:
+                found[key] = value
+            else:
+                missing.append(key)
+                if hit:
+                    stale[key] = value
+
+        if missing:
+            remote_values = self._remote_get(missing)
+            for key, value in remote_values.items():
+                self.local.set(key, value, self.local_ttl, self.stale_ttl)
+            found.update(remote_values)
+            if stale and self.degraded:
+                # Redis is down: an expired local copy beats no value at all.
+                found.update({k: v for k, v in stale.items() if k not in found})
+        return found
+
+    def set(self, key: str, value: Any, ttl: int = cache_management.TTL):
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, values: Dict[str, Any], ttl: int = cache_management.TTL):
+        local_ttl = min(self.local_ttl, ttl)
+        for key, value in values.items():
+            self.local.set(key, value, local_ttl, self.stale_ttl)
+        if not self._remote_available():
+            return
+        try:
+            self.remote.set_many(values, ttl)
+        except redis.RedisError as e:
+            self._remote_error(e)
+
+    def delete(self, key: str):
+        self.local.delete(key)
+        if self._remote_available():
+            try:
+                self.remote.delete(key)
+            except redis.RedisError as e:
+                self._remote_error(e)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: int = cache_management.TTL) -> Any:
+        """
+        Read-through with stale-while-revalidate: a local entry past its TTL
+        but inside the stale window is returned immediately while a single
+        background thread reloads it.
+        """
+        hit, value, stale = self.local.lookup(key)
+        if hit:
+            if stale:
+                self._refresh_in_background(key, loader, ttl)
+            return value
+
+        remote_values = self._remote_get([key])
+        if key in remote_values:
+            value = remote_values[key]
+            self.local.set(key, value, min(self.local_ttl, ttl), self.stale_ttl)
+            return value
+
+        value = loader()
+        self.set(key, value, ttl)
+        return value
+
+    def _refresh_in_background(self, key: str, loader: Callable[[], Any], ttl: int):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self.set(key, loader(), ttl)
+            except Exception as e:
+                logger.warning(f"Background refresh failed for '{key}': {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name=f"cache-refresh:{key}", daemon=True).start()
+
+    def _remote_available(self) -> bool:
+        if self.remote.healthy():
+            return True
+        with self._lock:
+            self.degraded_calls += 1
+        return False
+
+    def _remote_get(self, keys: List[str]) -> Dict[str, Any]:
+        if not self._remote_available():
+            return {}
+        try:
+            values = self.remote.get_many(keys)
+        except redis.RedisError as e:
+            self._remote_error(e)
+            return {}
+        with self._lock:
+            self.remote_hits += len(values)
+            self.remote_misses += len(keys) - len(values)
+        return values
+
+    def _remote_error(self, error: Exception):
+        with self._lock:
+            self.remote_errors += 1
+        logger.warning(f"Redis tier error, continuing on local cache: {error}")
+
+    def stats(self) -> Dict[str, Any]:
+        remote_lookups = self.remote_hits + self.remote_misses
+        return {
+            "local": self.local.stats(),
+            "redis": {
+                "hits": self.remote_hits,
+                "misses": self.remote_misses,
+                "errors": self.remote_errors,
+                "hit_ratio": round(self.remote_hits / remote_lookups, 4) if remote_lookups else None,
+            },
+            "degraded_calls": self.degraded_calls,
+        }
+
+
+tiered_cache = TieredCache()
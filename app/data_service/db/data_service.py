@@ -1,11 +1,19 @@
 from sqlalchemy.orm import Session
+from app.data_service.db.cache.query_cache import query_cache
 from app.data_service.db.repositories.match_repository import MatchRepository
 from app.data_service.db.repositories.team_repository import TeamRepository
 from app.data_service.db.repositories.competition_repository import CompetitionRepository
+from app.data_service.db.repositories.sync_repository import SyncStateRepository
+from app.data_service.db.repositories.checkpoint_repository import SeedCheckpointRepository
+from app.data_service.db.repositories.fixture_repository import FixtureRepository
 
 class DataService:
     def __init__(self, session: Session):
         self.session = session
-        self.matches = MatchRepository(session)
-        self.teams = TeamRepository(session)
-        self.competitions = CompetitionRepository(session)
\ No newline at end of file
+        self.cache = query_cache
+        self.matches = MatchRepository(session, query_cache)
+        self.teams = TeamRepository(session, query_cache)
+        self.competitions = CompetitionRepository(session, query_cache)
+        self.sync = SyncStateRepository(session)
+        self.checkpoints = SeedCheckpointRepository(session)
+        self.fixtures = FixtureRepository(session)
\ No newline at end of file
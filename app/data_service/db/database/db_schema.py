@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, JSON
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Float, JSON, Index
 from sqlalchemy.orm import declarative_base, relationship
 from datetime import datetime
 
@@ -71,8 +71,17 @@ class Match(Base):
     referees = Column(JSON, nullable=True)
 
     competition = relationship("Competition", back_populates="matches")
+    home_team = relationship("Team", foreign_keys=[home_team_id], viewonly=True)
+    away_team = relationship("Team", foreign_keys=[away_team_id], viewonly=True)
     player_stats = relationship("PlayerStat", back_populates="match")
 
+    __table_args__ = (
+        Index("ix_matches_competition_season_status", "competition_id", "season_year", "status"),
+        Index("ix_matches_home_team_date", "home_team_id", "utc_date"),
+        Index("ix_matches_away_team_date", "away_team_id", "utc_date"),
+        Index("ix_matches_utc_date", "utc_date"),
+    )
+
 class Player(Base):
     __tablename__ = "players"
     id = Column(Integer, primary_key=True)
@@ -85,6 +94,10 @@ class Player(Base):
     stats = relationship("PlayerStat", back_populates="player")
     top_scorers = relationship("TopScorer", back_populates="player")
 
+    __table_args__ = (
+        Index("ix_players_team_id", "team_id"),
+    )
+
 class TeamStanding(Base):
     __tablename__ = "standings"
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -102,6 +115,10 @@ class TeamStanding(Base):
     goal_difference = Column(Integer)
     competition = relationship("Competition", back_populates="standings")
 
+    __table_args__ = (
+        Index("ix_standings_competition_season", "competition_id", "season_year"),
+    )
+
 class TopScorer(Base):
     __tablename__ = "top_scorers"
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -115,6 +132,10 @@ class TopScorer(Base):
     competition = relationship("Competition", back_populates="top_scorers")
     player = relationship("Player", back_populates="top_scorers")
 
+    __table_args__ = (
+        Index("ix_top_scorers_competition_season", "competition_id", "season_year"),
+    )
+
 class PlayerStat(Base):
     __tablename__ = "player_stats"
     id = Column(Integer, primary_key=True)
@@ -147,4 +168,59 @@ class PlayerForm(Base):
     xg_chain = Column(Float, default=0.0)
     xg_buildup = Column(Float, default=0.0)
     minutes_played = Column(Integer, default=0)
-    games_played = Column(Integer, default=0)
\ No newline at end of file
+    games_played = Column(Integer, default=0)
+
+    __table_args__ = (
+        Index("ix_player_form_period_label", "period_label"),
+    )
+
+class TeamAlias(Base):
+    __tablename__ = "team_aliases"
+    source = Column(String(30), primary_key=True)
+    alias = Column(String(150), primary_key=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    score = Column(Float, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class SyncState(Base):
+    __tablename__ = "sync_state"
+    competition_id = Column(Integer, ForeignKey("competitions.id"), primary_key=True)
+    high_water_mark = Column(DateTime, nullable=True)
+    last_synced_at = Column(DateTime, default=datetime.utcnow)
+
+class SeedCheckpoint(Base):
+    __tablename__ = "seed_checkpoints"
+    step = Column(String(30), primary_key=True)
+    competition = Column(String(10), primary_key=True, default="")
+    season = Column(String(10), primary_key=True, default="")
+    team_id = Column(Integer, primary_key=True, default=0)
+    rows = Column(Integer, nullable=True)
+    completed_at = Column(DateTime, default=datetime.utcnow)
+
+class Fixture(Base):
+    """Short-lived copy of upcoming match payloads, shared by the predictors and the site export."""
+    __tablename__ = "fixtures"
+    id = Column(Integer, primary_key=True)
+    competition_code = Column(String(10), nullable=False)
+    utc_date = Column(DateTime, nullable=False)
+    status = Column(String(20))
+    payload = Column(JSON, nullable=False)
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_fixtures_competition_date", "competition_code", "utc_date"),
+    )
+
+class FixtureWindow(Base):
+    """Date range of the last fixture fetch per competition; the fixtures inside it are complete as of fetched_at."""
+    __tablename__ = "fixture_windows"
+    competition_code = Column(String(10), primary_key=True)
+    date_from = Column(Date, nullable=False)
+    date_to = Column(Date, nullable=False)
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+
+class SchemaMigration(Base):
+    __tablename__ = "schema_migrations"
+    version = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False)
+    applied_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
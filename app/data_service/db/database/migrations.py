@@ -0,0 +1,94 @@
+import logging
+from dataclasses import dataclass
+from typing import Callable, List
+
+from sqlalchemy import Index, select
+from sqlalchemy.engine import Connection, Engine
+
+from app.data_service.db.database.db_schema import (
+    Base, Match, Player, PlayerForm, SchemaMigration, TeamStanding, TopScorer
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+def _index(model, name: str) -> Index:
+    for index in model.__table__.indexes:
+        if index.name == name:
+            return index
+    raise KeyError(f"Index {name} is not declared on {model.__tablename__}")
+
+
+def _create_indexes(*indexes: Index) -> Callable[[Connection], None]:
+    def upgrade(conn: Connection):
+        for index in indexes:
+            index.create(conn, checkfirst=True)
+    return upgrade
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        version=1,
+        name="match_access_path_indexes",
+        upgrade=_create_indexes(
+            _index(Match, "ix_matches_competition_season_status"),
+            _index(Match, "ix_matches_home_team_date"),
+            _index(Match, "ix_matches_away_team_date"),
+            _index(Match, "ix_matches_utc_date"),
+        ),
+    ),
+    Migration(
+        version=2,
+        name="context_table_indexes",
+        upgrade=_create_indexes(
+            _index(TeamStanding, "ix_standings_competition_season"),
+            _index(TopScorer, "ix_top_scorers_competition_season"),
+            _index(Player, "ix_players_team_id"),
+            _index(PlayerForm, "ix_player_form_period_label"),
+        ),
+    ),
+]
+
+
+def applied_versions(engine: Engine) -> List[int]:
+    with engine.connect() as conn:
+        SchemaMigration.__table__.create(conn, checkfirst=True)
+        conn.commit()
+        return list(conn.execute(select(SchemaMigration.version).order_by(SchemaMigration.version)).scalars())
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """
+    Applies every migration newer than the database's recorded version.
+    create_all only creates missing tables, so schema changes to existing
+    tables (such as new indexes) are shipped here. Each migration runs in its
+    own transaction and is recorded in schema_migrations.
+    """
+    applied = set(applied_versions(engine))
+    newly_applied = []
+
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        if migration.version in applied:
+            continue
+        with engine.begin() as conn:
+            migration.upgrade(conn)
+            conn.execute(
+                SchemaMigration.__table__.insert().values(version=migration.version, name=migration.name)
+            )
+        logger.info(f"Applied migration {migration.version:04d} ({migration.name})")
+        newly_applied.append(migration.version)
+
+    return newly_applied
+
+
+def init_schema(engine: Engine) -> List[int]:
+    """Creates missing tables and brings existing ones up to the latest migration."""
+    Base.metadata.create_all(engine)
+    return run_migrations(engine)
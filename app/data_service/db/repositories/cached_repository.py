@@ -0,0 +1,27 @@
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, Optional
+from app.data_service.db.cache.query_cache import QueryCache
+
+
+class CachedRepository:
+    """Base for repositories whose reads go through an optional QueryCache."""
+    def __init__(self, session: Session, cache: Optional[QueryCache] = None):
+        self.session = session
+        self.cache = cache
+
+    def _cached(
+        self,
+        name: str,
+        scope: str,
+        params: Dict[str, Any],
+        loader: Callable[[], Any],
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda payload: payload
+    ) -> Any:
+        if self.cache is None:
+            return loader()
+        return self.cache.get_or_load(name, scope, params, loader, encode, decode)
+
+    def _invalidate(self, *scopes: str):
+        if self.cache is not None:
+            self.cache.bump(*scopes)
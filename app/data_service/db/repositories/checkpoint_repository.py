@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.data_service.db.database.db_schema import SeedCheckpoint
+
+# (competition, season, team_id); unused parts are "" / 0
+Unit = Tuple[str, str, int]
+
+
+class SeedCheckpointRepository:
+    """Completed units of the seed steps, so an interrupted run can resume."""
+    def __init__(self, session: Session):
+        self.session = session
+
+    def completed(self, step: str) -> Dict[Unit, datetime]:
+        rows = self.session.query(
+            SeedCheckpoint.competition, SeedCheckpoint.season, SeedCheckpoint.team_id, SeedCheckpoint.completed_at
+        ).filter(SeedCheckpoint.step == step).all()
+        return {(competition, season, team_id): completed_at for competition, season, team_id, completed_at in rows}
+
+    def mark_done(self, step: str, unit: Unit, rows: Optional[int] = None):
+        competition, season, team_id = unit
+        self.session.merge(SeedCheckpoint(
+            step=step, competition=competition, season=season, team_id=team_id,
+            rows=rows, completed_at=datetime.utcnow()
+        ))
+        self.session.commit()
+
+    def clear(self, step: str) -> int:
+        deleted = self.session.query(SeedCheckpoint).filter(SeedCheckpoint.step == step).delete()
+        self.session.commit()
+        return deleted
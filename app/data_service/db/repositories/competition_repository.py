@@ -1,16 +1,22 @@
-from sqlalchemy.orm import Session
 from typing import List, Dict, Optional
+from app.data_service.db.bulk_loader import bulk_insert
+from app.data_service.db.cache.query_cache import (
+    COMPETITIONS_SCOPE, TEAMS_SCOPE, competition_scope, model_to_payload, payload_to_model
+)
 from app.data_service.db.database.db_schema import Competition, TeamStanding, TopScorer
+from app.data_service.db.repositories.cached_repository import CachedRepository
 import logging
 
 logger = logging.getLogger(__name__)
 
-class CompetitionRepository:
-    def __init__(self, session: Session):
-        self.session = session
-
+class CompetitionRepository(CachedRepository):
     def get_by_code(self, code: str) -> Optional[Competition]:
-        return self.session.query(Competition).filter(Competition.code == code).first()
+        return self._cached(
+            'competition_by_code', COMPETITIONS_SCOPE, {'code': code},
+            lambda: self.session.query(Competition).filter(Competition.code == code).first(),
+            encode=model_to_payload,
+            decode=lambda row: payload_to_model(Competition, row)
+        )
 
     def save_competition(self, comp_data: Dict):
         """Save competition metadata."""
@@ -31,41 +37,46 @@ class CompetitionRepository:
             else:
                 self.session.add(Competition(**c_info))
             self.session.commit()
+            self._invalidate(COMPETITIONS_SCOPE, competition_scope(c_info['id']))
             logger.info(f"Competition saved: {c_info['name']}")
         except Exception as e:
             self.session.rollback()
             logger.error(f"Error saving competition: {e}")
 
-    def save_standings(self, competition_id: int, season: str, table_data: List[Dict]):
-        """Save league table."""
+    def save_standings(self, competition_id: int, season: str, table_data: List[Dict]) -> bool:
+        """Save league table. Returns False if the write failed and was rolled back."""
         try:
             self.session.query(TeamStanding).filter_by(
                 competition_id=competition_id, season_year=season
             ).delete()
             
-            for row in table_data:
-                standing = TeamStanding(
-                    competition_id=competition_id,
-                    season_year=season,
-                    position=row['position'],
-                    team_id=row['team']['id'],
-                    points=row['points'],
-                    won=row['won'],
-                    draw=row['draw'],
-                    lost=row['lost'],
-                    goals_for=row['goalsFor'],
-                    goals_against=row['goalsAgainst'],
-                    goal_difference=row['goalDifference']
-                )
-                self.session.add(standing)
+            bulk_insert(self.session.connection(), TeamStanding.__table__, [
+                {
+                    'competition_id': competition_id,
+                    'season_year': season,
+                    'position': row['position'],
+                    'team_id': row['team']['id'],
+                    'points': row['points'],
+                    'won': row['won'],
+                    'draw': row['draw'],
+                    'lost': row['lost'],
+                    'goals_for': row['goalsFor'],
+                    'goals_against': row['goalsAgainst'],
+                    'goal_difference': row['goalDifference']
+                }
+                for row in table_data
+            ])
             self.session.commit()
+            self._invalidate(competition_scope(competition_id))
             logger.info(f"Standings saved for Comp {competition_id} Season {season}")
+            return True
         except Exception as e:
             self.session.rollback()
             logger.error(f"Error saving standings: {e}")
+            return False
 
-    def save_top_scorers(self, competition_id: int, season: str, scorers_data: List[Dict]):
-        """Save top scorers list."""
+    def save_top_scorers(self, competition_id: int, season: str, scorers_data: List[Dict]) -> bool:
+        """Save top scorers list. Returns False if the write failed and was rolled back."""
         from app.data_service.db.database.db_schema import Player, TopScorer
 
         try:
@@ -97,8 +108,10 @@ class CompetitionRepository:
                 self.session.add(scorer)
             
             self.session.commit()
+            self._invalidate(competition_scope(competition_id), TEAMS_SCOPE)
             logger.info(f"Top Scorers saved for Comp {competition_id} Season {season}")
-            
+            return True
         except Exception as e:
             self.session.rollback()
-            logger.error(f"Error saving scorers: {e}")
\ No newline at end of file
+            logger.error(f"Error saving scorers: {e}")
+            return False
\ No newline at end of file
@@ -0,0 +1,52 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List
+from sqlalchemy.orm import Session
+from app.data_service.db.database.db_schema import Fixture, FixtureWindow
+
+
+class FixtureRepository:
+    """Upcoming fixtures per competition, with the date window and time of the fetch that produced them."""
+    def __init__(self, session: Session):
+        self.session = session
+
+    def fresh_codes(self, codes: Iterable[str], date_from: date, date_to: date, max_age: timedelta) -> List[str]:
+        """Competitions whose stored window covers date_from..date_to and was fetched within max_age."""
+        cutoff = datetime.utcnow() - max_age
+        rows = self.session.query(FixtureWindow).filter(FixtureWindow.competition_code.in_(list(codes))).all()
+        return [
+            window.competition_code for window in rows
+            if window.date_from <= date_from and window.date_to >= date_to and window.fetched_at >= cutoff
+        ]
+
+    def get(self, codes: Iterable[str], date_from: date, date_to: date) -> Dict[str, List[Dict]]:
+        rows = self.session.query(Fixture).filter(
+            Fixture.competition_code.in_(list(codes)),
+            Fixture.utc_date >= datetime.combine(date_from, datetime.min.time()),
+            Fixture.utc_date < datetime.combine(date_to + timedelta(days=1), datetime.min.time()),
+        ).order_by(Fixture.utc_date, Fixture.id).all()
+        fixtures: Dict[str, List[Dict]] = {}
+        for row in rows:
+            fixtures.setdefault(row.competition_code, []).append(row.payload)
+        return fixtures
+
+    def replace(self, codes: Iterable[str], date_from: date, date_to: date, matches: Dict[str, List[Dict]]):
+        """Swaps the stored fixtures of codes in date_from..date_to for a fresh fetch and records the window."""
+        codes = list(codes)
+        now = datetime.utcnow()
+        self.session.query(Fixture).filter(
+            Fixture.competition_code.in_(codes),
+            Fixture.utc_date >= datetime.combine(date_from, datetime.min.time()),
+            Fixture.utc_date < datetime.combine(date_to + timedelta(days=1), datetime.min.time()),
+        ).delete(synchronize_session=False)
+        for code in codes:
+            for match in matches.get(code, []):
+                self.session.merge(Fixture(
+                    id=match['id'],
+                    competition_code=code,
+                    utc_date=datetime.strptime(match['utcDate'], "%Y-%m-%dT%H:%M:%SZ"),
+                    status=match.get('status'),
+                    payload=match,
+                    fetched_at=now,
+                ))
+            self.session.merge(FixtureWindow(competition_code=code, date_from=date_from, date_to=date_to, fetched_at=now))
+        self.session.commit()
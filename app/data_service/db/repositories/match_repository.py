@@ -1,33 +1,98 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import List, Dict, Optional, Any
+from sqlalchemy import and_, case, column, func, or_, select, values, DateTime, Integer
+from sqlalchemy.orm import selectinload
+from typing import Iterable, List, Dict, Optional, Any, Tuple
 from datetime import datetime
 import logging
+from app.data_service.db.cache.query_cache import MATCHES_SCOPE, TEAMS_SCOPE, competition_scope
+from app.data_service.db.bulk_loader import BulkLoadResult, bulk_upsert
 from app.data_service.db.database.db_schema import Match, Team
+from app.data_service.db.repositories.cached_repository import CachedRepository
 
 logger = logging.getLogger(__name__)
 
-class MatchRepository:
-    def __init__(self, session: Session):
-        self.session = session
+ODDS_FIELDS = ('odds_home', 'odds_draw', 'odds_away')
+# Fields compared by upsert_changed; anything else is fixed once a match exists
+SYNC_FIELDS = (
+    'utc_date', 'status', 'matchday', 'stage', 'score_home', 'score_away',
+    'halftime_home', 'halftime_away', 'winner', *ODDS_FIELDS
+)
 
+class MatchRepository(CachedRepository):
     def get_by_competition(self, competition_id: int, season: str) -> List[Match]:
-        """Fetch all finished matches for a competition/season."""
-        return self.session.query(Match).filter(
+        """
+        Fetch all finished matches for a competition/season, with both teams
+        loaded. Not cached: callers get live, session-bound rows.
+        """
+        return self.session.query(Match).options(
+            selectinload(Match.home_team), selectinload(Match.away_team)
+        ).filter(
             Match.competition_id == competition_id,
             Match.season_year == str(season),
             Match.status == 'FINISHED'
         ).all()
 
+    def get_training_columns(self, competition_id: int, seasons: List[str], batch_size: int = 5000) -> Dict[str, List[Any]]:
+        """
+        Load finished matches for every requested season in a single query.
+        Only the columns needed for training are selected and rows are streamed
+        straight into per-column lists, so no ORM objects are materialized.
+        The lists are cached per competition and season set until the
+        competition's data changes; callers must not mutate them.
+        """
+        seasons = sorted({str(s) for s in seasons})
+        return self._cached(
+            'training_columns',
+            competition_scope(competition_id),
+            {'competition_id': competition_id, 'seasons': seasons},
+            lambda: self._load_training_columns(competition_id, seasons, batch_size)
+        )
+
+    def _load_training_columns(self, competition_id: int, seasons: List[str], batch_size: int) -> Dict[str, List[Any]]:
+        stmt = select(
+            Match.id,
+            Match.utc_date,
+            Match.season_year,
+            Match.home_team_id,
+            Match.away_team_id,
+            Match.winner,
+            Match.score_home,
+            Match.score_away,
+            Match.home_xg,
+            Match.away_xg,
+            Match.odds_home,
+            Match.odds_draw,
+            Match.odds_away,
+        ).where(
+            Match.competition_id == competition_id,
+            Match.season_year.in_(seasons),
+            Match.status == 'FINISHED',
+            Match.score_home.isnot(None)
+        ).order_by(Match.season_year, Match.utc_date, Match.id)
+
+        result = self.session.execute(stmt.execution_options(yield_per=batch_size))
+        columns: Dict[str, List[Any]] = {key: [] for key in result.keys()}
+        for partition in result.partitions():
+            for column_values, out in zip(zip(*partition), columns.values()):
+                out.extend(column_values)
+        return columns
+
     def get_recent_form(self, team_id: int, match_date: datetime, limit: int = 5) -> Dict:
         """Calculate recent form (wins/losses/goals) for a team before a specific date."""
+        return self._cached(
+            'recent_form',
+            MATCHES_SCOPE,
+            {'team_id': team_id, 'match_date': match_date, 'limit': limit},
+            lambda: self._load_recent_form(team_id, match_date, limit)
+        )
+
+    def _load_recent_form(self, team_id: int, match_date: datetime, limit: int) -> Dict:
         matches = self.session.query(Match).filter(
             or_(Match.home_team_id == team_id, Match.away_team_id == team_id),
             Match.utc_date < match_date,
             Match.status == 'FINISHED'
-        ).order_by(Match.utc_date.desc()).limit(limit).all()
+        ).order_by(Match.utc_date.desc(), Match.id.desc()).limit(limit).all()
 
-        stats = {'wins': 0, 'draws': 0, 'losses': 0, 'goals_scored': 0, 'goals_conceded': 0}
+        stats = self._empty_form()
         
         for m in matches:
             if m.home_team_id == team_id:
@@ -50,6 +115,105 @@ class MatchRepository:
             
         return stats
 
+    def get_recent_form_batch(
+        self, team_dates: Iterable[Tuple[int, datetime]], limit: int = 5, chunk_size: int = 300
+    ) -> Dict[Tuple[int, datetime], Dict]:
+        """
+        Recent form for many (team_id, as_of_date) pairs at once.
+        Each chunk of pairs is answered by one statement that ranks every team's
+        prior finished matches with ROW_NUMBER() and aggregates the top `limit`
+        in SQL. Falls back to get_recent_form per pair on SQLite builds without
+        window function support (< 3.25).
+        """
+        pairs = list(dict.fromkeys((int(team_id), as_of) for team_id, as_of in team_dates))
+        if not pairs:
+            return {}
+        return self._cached(
+            'recent_form_batch',
+            MATCHES_SCOPE,
+            {'pairs': pairs, 'limit': limit},
+            lambda: self._load_recent_form_batch(pairs, limit, chunk_size),
+            encode=lambda forms: [[team_id, as_of, form] for (team_id, as_of), form in forms.items()],
+            decode=lambda rows: {(team_id, as_of): form for team_id, as_of, form in rows}
+        )
+
+    def _load_recent_form_batch(
+        self, pairs: List[Tuple[int, datetime]], limit: int, chunk_size: int
+    ) -> Dict[Tuple[int, datetime], Dict]:
+        forms = {pair: self._empty_form() for pair in pairs}
+
+        if not self._supports_window_functions():
+            for team_id, as_of in pairs:
+                forms[(team_id, as_of)] = self.get_recent_form(team_id, as_of, limit)
+            return forms
+
+        for start in range(0, len(pairs), chunk_size):
+            chunk = pairs[start:start + chunk_size]
+            for row in self.session.execute(self._recent_form_statement(chunk, limit)):
+                wins, losses = int(row.wins), int(row.losses)
+                forms[chunk[row.req_id]] = {
+                    'wins': wins,
+                    'draws': int(row.played) - wins - losses,
+                    'losses': losses,
+                    'goals_scored': int(row.goals_scored),
+                    'goals_conceded': int(row.goals_conceded),
+                }
+        return forms
+
+    @staticmethod
+    def _recent_form_statement(pairs: List[Tuple[int, datetime]], limit: int):
+        form_requests = values(
+            column('req_id', Integer), column('team_id', Integer), column('as_of', DateTime),
+            name='form_requests'
+        ).data([(idx, team_id, as_of) for idx, (team_id, as_of) in enumerate(pairs)]).cte('form_requests')
+
+        is_home = Match.home_team_id == form_requests.c.team_id
+        ranked = select(
+            form_requests.c.req_id,
+            case((is_home, Match.score_home), else_=Match.score_away).label('goals_for'),
+            case((is_home, Match.score_away), else_=Match.score_home).label('goals_against'),
+            case(
+                (and_(is_home, Match.winner == 'HOME_TEAM'), 1),
+                (and_(~is_home, Match.winner == 'AWAY_TEAM'), 1),
+                else_=0
+            ).label('is_win'),
+            case(
+                (and_(is_home, Match.winner == 'AWAY_TEAM'), 1),
+                (and_(~is_home, Match.winner == 'HOME_TEAM'), 1),
+                else_=0
+            ).label('is_loss'),
+            func.row_number().over(
+                partition_by=form_requests.c.req_id,
+                order_by=(Match.utc_date.desc(), Match.id.desc())
+            ).label('rn'),
+        ).select_from(form_requests).join(
+            Match,
+            and_(
+                or_(Match.home_team_id == form_requests.c.team_id, Match.away_team_id == form_requests.c.team_id),
+                Match.utc_date < form_requests.c.as_of,
+                Match.status == 'FINISHED'
+            )
+        ).subquery('ranked')
+
+        return select(
+            ranked.c.req_id,
+            func.count().label('played'),
+            func.sum(ranked.c.is_win).label('wins'),
+            func.sum(ranked.c.is_loss).label('losses'),
+            func.coalesce(func.sum(ranked.c.goals_for), 0).label('goals_scored'),
+            func.coalesce(func.sum(ranked.c.goals_against), 0).label('goals_conceded'),
+        ).where(ranked.c.rn <= limit).group_by(ranked.c.req_id)
+
+    def _supports_window_functions(self) -> bool:
+        dialect = self.session.get_bind().dialect
+        if dialect.name != 'sqlite':
+            return True
+        return dialect.dbapi.sqlite_version_info >= (3, 25, 0)
+
+    @staticmethod
+    def _empty_form() -> Dict:
+        return {'wins': 0, 'draws': 0, 'losses': 0, 'goals_scored': 0, 'goals_conceded': 0}
+
     def save_bulk(self, matches_data: List[Dict]):
         """
         Saves a list of matches, updating existing ones.
@@ -59,28 +223,7 @@ class MatchRepository:
                 self._ensure_team(m.get('homeTeam'))
                 self._ensure_team(m.get('awayTeam'))
 
-                odds = m.get('odds', {})
-                
-                match_info = {
-                    'id': m['id'],
-                    'competition_id': m['competition']['id'],
-                    'season_year': str(m['season']['startDate'])[:4], 
-                    'utc_date': datetime.strptime(m['utcDate'], "%Y-%m-%dT%H:%M:%SZ"),
-                    'status': m['status'],
-                    'matchday': m['matchday'],
-                    'stage': m['stage'],
-                    'home_team_id': m['homeTeam']['id'],
-                    'away_team_id': m['awayTeam']['id'],
-                    'score_home': m['score']['fullTime']['home'],
-                    'score_away': m['score']['fullTime']['away'],
-                    'halftime_home': m['score']['halfTime']['home'],
-                    'halftime_away': m['score']['halfTime']['away'],
-                    'winner': m['score']['winner'],
-                    'odds_home': odds.get('homeWin'),
-                    'odds_draw': odds.get('draw'),
-                    'odds_away': odds.get('awayWin'),
-                    'referees': m.get('referees', [])
-                }
+                match_info = self._match_info(m)
 
                 existing = self.session.query(Match).filter_by(id=match_info['id']).first()
                 if existing:
@@ -90,12 +233,122 @@ class MatchRepository:
                     self.session.add(Match(**match_info))
             
             self.session.commit()
+            self._invalidate(
+                MATCHES_SCOPE, TEAMS_SCOPE,
+                *(competition_scope(m['competition']['id']) for m in matches_data)
+            )
             logger.info(f"Saved {len(matches_data)} matches with odds/refs.")
         except Exception as e:
             self.session.rollback()
             logger.error(f"Failed to save matches: {e}")
             raise
 
+    def load_bulk(self, matches_data: List[Dict]) -> BulkLoadResult:
+        """
+        Set-based save_bulk for large loads such as seeding a fresh database:
+        placeholder teams and matches are each written with one bulk upsert
+        (COPY on Postgres).
+        """
+        teams = {}
+        for m in matches_data:
+            for team_data in (m.get('homeTeam'), m.get('awayTeam')):
+                if team_data and 'id' in team_data:
+                    teams.setdefault(team_data['id'], {
+                        'id': team_data['id'],
+                        'name': team_data.get('name', f"Team {team_data['id']}"),
+                        'short_name': team_data.get('shortName')
+                    })
+        try:
+            conn = self.session.connection()
+            bulk_upsert(conn, Team.__table__, teams.values(), update_columns=[])
+            result = bulk_upsert(conn, Match.__table__, (self._match_info(m) for m in matches_data))
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to bulk load matches: {e}")
+            raise
+
+        self._invalidate(
+            MATCHES_SCOPE, TEAMS_SCOPE,
+            *{competition_scope(m['competition']['id']) for m in matches_data}
+        )
+        return result
+
+    def upsert_changed(self, matches_data: List[Dict], chunk_size: int = 500) -> Dict[int, int]:
+        """
+        Inserts new matches and updates only those whose schedule, status,
+        score or odds differ from the stored row. Missing odds in the payload
+        never overwrite stored ones. Returns the number of changed rows per
+        competition; only those competitions have their cache invalidated.
+        """
+        incoming = {}
+        for m in matches_data:
+            info = self._match_info(m)
+            incoming[info['id']] = (m, info)
+        if not incoming:
+            return {}
+
+        ids = list(incoming)
+        existing = {}
+        for start in range(0, len(ids), chunk_size):
+            rows = self.session.query(Match).filter(Match.id.in_(ids[start:start + chunk_size])).all()
+            existing.update({row.id: row for row in rows})
+
+        changed: Dict[int, int] = {}
+        try:
+            for match_id, (m, info) in incoming.items():
+                row = existing.get(match_id)
+                if row is None:
+                    self._ensure_team(m.get('homeTeam'))
+                    self._ensure_team(m.get('awayTeam'))
+                    self.session.add(Match(**info))
+                else:
+                    diff = {
+                        field: info[field] for field in SYNC_FIELDS
+                        if getattr(row, field) != info[field]
+                        and not (field in ODDS_FIELDS and info[field] is None)
+                    }
+                    if not diff:
+                        continue
+                    for field, value in diff.items():
+                        setattr(row, field, value)
+                changed[info['competition_id']] = changed.get(info['competition_id'], 0) + 1
+
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to upsert matches: {e}")
+            raise
+
+        if changed:
+            self._invalidate(MATCHES_SCOPE, TEAMS_SCOPE, *(competition_scope(c) for c in changed))
+        logger.info(f"Upserted {sum(changed.values())} of {len(incoming)} matches; the rest were unchanged.")
+        return changed
+
+    @staticmethod
+    def _match_info(m: Dict) -> Dict:
+        odds = m.get('odds', {})
+        return {
+            'id': m['id'],
+            'competition_id': m['competition']['id'],
+            'season_year': str(m['season']['startDate'])[:4], 
+            'utc_date': datetime.strptime(m['utcDate'], "%Y-%m-%dT%H:%M:%SZ"),
+            'status': m['status'],
+            'matchday': m['matchday'],
+            'stage': m['stage'],
+            'home_team_id': m['homeTeam']['id'],
+            'away_team_id': m['awayTeam']['id'],
+            'score_home': m['score']['fullTime']['home'],
+            'score_away': m['score']['fullTime']['away'],
+            'halftime_home': m['score']['halfTime']['home'],
+            'halftime_away': m['score']['halfTime']['away'],
+            'winner': m['score']['winner'],
+            'odds_home': odds.get('homeWin'),
+            'odds_draw': odds.get('draw'),
+            'odds_away': odds.get('awayWin'),
+            'referees': m.get('referees', [])
+        }
+
     def _ensure_team(self, team_data: Optional[Dict]):
         """Helper to create a placeholder team if it doesn't exist during match save."""
         if not team_data or 'id' not in team_data: 
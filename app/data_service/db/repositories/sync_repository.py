@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.data_service.db.database.db_schema import SyncState
+
+
+class SyncStateRepository:
+    """Per-competition progress of the incremental match sync."""
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get(self, competition_id: int) -> Optional[SyncState]:
+        return self.session.get(SyncState, competition_id)
+
+    def high_water_mark(self, competition_id: int) -> Optional[datetime]:
+        """Kickoff of the latest finished match already synced, or None if the competition was never synced."""
+        state = self.get(competition_id)
+        return state.high_water_mark if state else None
+
+    def mark_synced(self, competition_id: int, high_water_mark: Optional[datetime]):
+        state = self.get(competition_id)
+        if state is None:
+            state = SyncState(competition_id=competition_id)
+            self.session.add(state)
+        if high_water_mark is not None and (state.high_water_mark is None or high_water_mark > state.high_water_mark):
+            state.high_water_mark = high_water_mark
+        state.last_synced_at = datetime.utcnow()
+        self.session.commit()
@@ -1,22 +1,34 @@
-from sqlalchemy.orm import Session
 from typing import List, Optional, Dict
+from app.data_service.db.bulk_loader import BulkLoadResult, bulk_upsert
+from app.data_service.db.cache.query_cache import TEAMS_SCOPE, model_to_payload, payload_to_model
 from app.data_service.db.database.db_schema import Team, Player
+from app.data_service.db.repositories.cached_repository import CachedRepository
 import logging
 
 logger = logging.getLogger(__name__)
 
-class TeamRepository:
-    def __init__(self, session: Session):
-        self.session = session
-
+class TeamRepository(CachedRepository):
     def get_by_id(self, team_id: int) -> Optional[Team]:
-        return self.session.query(Team).filter(Team.id == team_id).first()
+        return self._cached(
+            'team_by_id', TEAMS_SCOPE, {'team_id': team_id},
+            lambda: self._find(team_id),
+            encode=model_to_payload,
+            decode=lambda row: payload_to_model(Team, row)
+        )
 
     def get_players(self, team_id: int) -> List[Player]:
-        return self.session.query(Player).filter(Player.team_id == team_id).all()
+        return self._cached(
+            'team_players', TEAMS_SCOPE, {'team_id': team_id},
+            lambda: self.session.query(Player).filter(Player.team_id == team_id).all(),
+            encode=lambda players: [model_to_payload(p) for p in players],
+            decode=lambda rows: [payload_to_model(Player, row) for row in rows]
+        )
+
+    def _find(self, team_id: int) -> Optional[Team]:
+        return self.session.query(Team).filter(Team.id == team_id).first()
 
     def save_team(self, team_data: Dict) -> Team:
-        team = self.get_by_id(team_data['id'])
+        team = self._find(team_data['id'])
         if team:
             for k, v in team_data.items():
                 if hasattr(team, k):
@@ -26,25 +38,19 @@ class TeamRepository:
             self.session.add(team)
         
         self.session.commit()
+        self._invalidate(TEAMS_SCOPE)
         return team
 
     def save_squad(self, team_id: int, squad_list: List[Dict]):
         """Save a list of players for a specific team."""
-        if not self.get_by_id(team_id):
+        if not self._find(team_id):
             self.save_team({'id': team_id, 'name': f"Team {team_id}"})
 
         try:
             count = 0
             for p_data in squad_list:
                 player_id = p_data['id']
-                player_info = {
-                    'id': player_id,
-                    'name': p_data['name'],
-                    'position': p_data.get('position'),
-                    'date_of_birth': p_data.get('dateOfBirth'),
-                    'nationality': p_data.get('nationality'),
-                    'team_id': team_id
-                }
+                player_info = self._player_info(team_id, p_data)
                 
                 existing = self.session.query(Player).filter_by(id=player_id).first()
                 if existing:
@@ -55,7 +61,41 @@ class TeamRepository:
                 count += 1
             
             self.session.commit()
+            self._invalidate(TEAMS_SCOPE)
             logger.info(f"Saved {count} players for Team {team_id}")
         except Exception as e:
             self.session.rollback()
-            logger.error(f"Error saving squad for team {team_id}: {e}")
\ No newline at end of file
+            logger.error(f"Error saving squad for team {team_id}: {e}")
+
+    def load_squads(self, squads: Dict[int, List[Dict]]) -> BulkLoadResult:
+        """Set-based save_squad for many teams: one bulk upsert of every player."""
+        try:
+            conn = self.session.connection()
+            bulk_upsert(
+                conn, Team.__table__,
+                ({'id': team_id, 'name': f"Team {team_id}"} for team_id in squads),
+                update_columns=[]
+            )
+            result = bulk_upsert(conn, Player.__table__, (
+                self._player_info(team_id, p_data)
+                for team_id, squad in squads.items() for p_data in squad
+            ))
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Error bulk loading squads: {e}")
+            raise
+
+        self._invalidate(TEAMS_SCOPE)
+        return result
+
+    @staticmethod
+    def _player_info(team_id: int, p_data: Dict) -> Dict:
+        return {
+            'id': p_data['id'],
+            'name': p_data['name'],
+            'position': p_data.get('position'),
+            'date_of_birth': p_data.get('dateOfBirth'),
+            'nationality': p_data.get('nationality'),
+            'team_id': team_id
+        }
@@ -1,43 +1,102 @@
 import os
 import logging
+import threading
 from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 
-from app.data_service.db.database.db_schema import Base
+from app.config import PipelineSettings, load_settings
+from app.data_service.db.database.migrations import init_schema
 from app.data_service.db.data_service import DataService
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-if DATABASE_URL is None:
-    logger.warning("DATABASE_URL not set. Using SQLite fallback.")
-    DATABASE_URL = "sqlite:///./test.db"
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+_engine_lock = threading.Lock()
+_active_service: ContextVar[Optional[DataService]] = ContextVar("active_db_service", default=None)
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base.metadata.create_all(engine)
+def database_url() -> str:
+    url = os.getenv("DATABASE_URL")
+    if url is None:
+        logger.warning("DATABASE_URL not set. Using SQLite fallback.")
+        url = "sqlite:///./test.db"
+    return url
+
+
+def engine_options(url: str, settings: PipelineSettings) -> Dict[str, Any]:
+    """Pool settings for create_engine. SQLite keeps SQLAlchemy's default pool."""
+    options: Dict[str, Any] = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if not url.startswith("sqlite"):
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    return options
+
+
+def get_engine() -> Engine:
+    """
+    Creates the engine and runs the schema check on first use only, so
+    importing this module never touches the database.
+    """
+    global _engine, _session_factory
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                url = database_url()
+                engine = create_engine(url, **engine_options(url, load_settings()))
+                init_schema(engine)
+                _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                _engine = engine
+    return _engine
+
+
+def SessionLocal():
+    get_engine()
+    return _session_factory()
+
 
 @contextmanager
 def get_db_service():
     """
     Context manager that provides a DataService instance with an active session.
     Automatically handles commit/rollback and closing the session.
-    
+    Nested calls reuse the outermost active service, so helpers called from
+    inside a block share its session instead of checking out another
+    connection. The session, and on Postgres its transaction, lives until
+    the outermost block exits: keep blocks to short units of database work
+    and never wrap training loops or other long computation in one.
+
     Usage:
         with get_db_service() as service:
             matches = service.matches.get_by_competition(...)
     """
+    active = _active_service.get()
+    if active is not None:
+        try:
+            yield active
+        except Exception:
+            active.session.rollback()
+            raise
+        return
+
     session = SessionLocal()
+    service = DataService(session)
+    token = _active_service.set(service)
     try:
-        service = DataService(session)
         yield service
     except Exception as e:
         logger.error(f"Database Session Error: {e}")
         session.rollback()
         raise e
     finally:
-        session.close()
\ No newline at end of file
+        _active_service.reset(token)
+        session.close()
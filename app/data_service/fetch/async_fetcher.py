@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.data_service.fetch.fetcher import FootballDataClient, finished_matches
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENCY = 8
+
+
+class AsyncFootballDataClient:
+    """
+    Concurrent front-end for FootballDataClient.
+    Calls answered by the client's response cache return immediately; the
+    rest run on worker threads over the shared pooled HTTP transport while
+    the event loop takes tokens from the shared RedisRateLimiter, so a batch
+    of calls fills the quota as fast as it allows and never exceeds it, even
+    when other processes use the same limiter key.
+    """
+    def __init__(self, client: Optional[FootballDataClient] = None, max_concurrency: int = MAX_CONCURRENCY):
+        self.client = client if client is not None else FootballDataClient()
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def get(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        payload = await asyncio.to_thread(self.client.cached, endpoint, params)
+        if payload is not None or self.client.replay:
+            return payload
+        async with self._semaphore_for_loop():
+            await self._reserve()
+            return await asyncio.to_thread(self.client._request, endpoint, params)
+
+    async def get_many(self, calls: Iterable[Tuple[str, Optional[Dict]]]) -> List[Optional[Dict]]:
+        """Runs (endpoint, params) calls concurrently; results keep the input order."""
+        return list(await asyncio.gather(*(self.get(endpoint, params) for endpoint, params in calls)))
+
+    async def fetch_competition_details(self, codes: List[str]) -> Dict[str, Optional[Dict]]:
+        results = await self.get_many((f"competitions/{code}", None) for code in codes)
+        return dict(zip(codes, results))
+
+    async def fetch_multiple_seasons(self, competition_code: str, seasons: List[str]) -> Dict:
+        results = await self.get_many(
+            (f"competitions/{competition_code}/matches", {'season': season}) for season in seasons
+        )
+        all_seasons_data = {}
+        for season, data in zip(seasons, results):
+            valid = finished_matches(data)
+            if valid is not None:
+                all_seasons_data[season] = valid
+                logger.info(f"{competition_code} {season}: retrieved {len(valid)} valid matches.")
+            else:
+                logger.warning(f"{competition_code} {season}: no data found.")
+        return all_seasons_data
+
+    async def fetch_standings(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[Dict]]:
+        results = await self.get_many(
+            (f"competitions/{code}/standings", {'season': season}) for code, season in pairs
+        )
+        return dict(zip(pairs, results))
+
+    async def fetch_top_scorers(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[Dict]]:
+        results = await self.get_many(
+            (f"competitions/{code}/scorers", {'season': season}) for code, season in pairs
+        )
+        return dict(zip(pairs, results))
+
+    async def fetch_team_squads(self, team_ids: List[int]) -> Dict[int, Optional[Dict]]:
+        results = await self.get_many((f"teams/{team_id}", None) for team_id in team_ids)
+        return dict(zip(team_ids, results))
+
+    async def _reserve(self):
+        """Waits until the shared limiter hands this call a token."""
+        limiter = self.client.limiter
+        while True:
+            wait = await asyncio.to_thread(limiter.try_acquire)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _semaphore_for_loop(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the loop that actually runs the requests
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
@@ -1,80 +1,161 @@
 import os
-import requests
-import time
 import logging
-from typing import List, Dict, Optional
+from datetime import date, timedelta
+from typing import Any, List, Dict, Optional
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
-from app.data_service.db.cache.cache_management import get_redis_client
+from app.config import FOOTBALL_DATA_BASE_URL, load_settings
+from app.data_service.fetch.http_transport import HttpTransport, transport as shared_transport
+from app.data_service.fetch.payload_archive import FOOTBALL_DATA, PayloadArchive, default_payload_archive
+from app.data_service.fetch.rate_limiter import RedisRateLimiter
+from app.data_service.fetch.response_cache import ResponseCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-class RedisRateLimiter:
-    """
-    Persist rate limits in Redis using a Sliding Window algorithm.
-    """
-    def __init__(self, key_prefix: str = "rate_limit:football_api", limit: int = 10, window: int = 60):
-        self.redis = get_redis_client()
-        self.key = key_prefix
-        self.limit = limit
-        self.window = window
+def finished_matches(data: Optional[Dict]) -> Optional[List[Dict]]:
+    """Finished matches with a full-time score from a matches payload, or None if the payload is empty."""
+    if not data or 'matches' not in data:
+        return None
+    return [
+        m for m in data['matches']
+        if m['status'] == 'FINISHED' and m.get('score', {}).get('fullTime', {}).get('home') is not None
+    ]
 
-    def wait_if_needed(self):
-        try:
-            now = time.time()
-            pipeline = self.redis.pipeline()
-            pipeline.zremrangebyscore(self.key, 0, now - self.window)
-            pipeline.zcard(self.key)
-            pipeline.zrange(self.key, 0, 0)
-            _, count, oldest = pipeline.execute()
-
-            if count >= self.limit:
-                oldest_ts = float(oldest[0]) if oldest else now
-                sleep_time = self.window - (now - oldest_ts) + 0.5
-                if sleep_time > 0:
-                    logger.warning(f"Rate limit hit ({self.limit}/{self.limit}). Sleeping {sleep_time:.2f}s...")
-                    time.sleep(sleep_time)
-        except Exception as e:
-            logger.error(f"Rate Limiter Error: {e}. Proceeding without delay.")
+# Response cache lifetimes (seconds). Finished seasons are cached forever.
+LIVE_TTL = 5 * 60
+CURRENT_SEASON_TTL = 30 * 60
+REFERENCE_TTL = 24 * 60 * 60
+# Longest dateFrom/dateTo span requested in one call
+MAX_WINDOW_DAYS = 10
 
-    def add_request(self):
-        try:
-            now = time.time()
-            pipeline = self.redis.pipeline()
-            pipeline.zadd(self.key, {str(now): now})
-            pipeline.expire(self.key, self.window)
-            pipeline.execute()
-        except Exception:
-            pass
+def season_is_complete(season: str, today: Optional[date] = None) -> bool:
+    """A season is treated as closed from July 1st of the following year."""
+    today = today or date.today()
+    try:
+        return today >= date(int(season) + 1, 7, 1)
+    except ValueError:
+        return False
+
+def cache_ttl(endpoint: str, params: Optional[Dict] = None, today: Optional[date] = None) -> Optional[float]:
+    """How long a response stays fresh: None for closed seasons, minutes for anything still changing."""
+    params = params or {}
+    if any(key in params for key in ('dateFrom', 'dateTo', 'status')):
+        return LIVE_TTL
+    season = params.get('season')
+    if season is not None:
+        return None if season_is_complete(str(season), today) else CURRENT_SEASON_TTL
+    if endpoint.endswith('/matches') or endpoint == 'matches':
+        return LIVE_TTL
+    return REFERENCE_TTL
+
+def host_namespace(base_url: str) -> Optional[str]:
+    """Suffix that keeps a non-default server's cache, archive and rate limit apart; None for football-data.org."""
+    if base_url == FOOTBALL_DATA_BASE_URL:
+        return None
+    return urlsplit(base_url).netloc
+
+def default_response_cache(namespace: Optional[str] = None) -> Optional[ResponseCache]:
+    settings = load_settings()
+    if not settings.http_cache_enabled:
+        return None
+    name = "football_data" if namespace is None else f"football_data@{namespace.replace(':', '_')}"
+    return ResponseCache(os.path.join(settings.http_cache_dir, name))
 
 class FootballDataClient:
-    def __init__(self):
+    """
+    football-data.org v4 client. Every payload it downloads is appended to
+    the payload archive; in replay mode (SOCCER_ANALYTICS_REPLAY) calls are
+    answered from that archive only, without network or rate limiting.
+    FOOTBALL_DATA_BASE_URL points it at another server (e.g. the local
+    stand-in API), which gets its own rate-limit bucket, response cache
+    directory and archive source, so its payloads never stand in for
+    football-data.org ones.
+    """
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        transport: Optional[HttpTransport] = None,
+        archive: Optional[PayloadArchive] = None,
+        replay: Optional[bool] = None,
+        base_url: Optional[str] = None
+    ):
+        settings = load_settings()
         self.api_key = os.getenv("FOOTBALL_DATA_API_KEY")
-        self.base_url = "https://api.football-data.org/v4/"
-        self.limiter = RedisRateLimiter()
-        
-        if not self.api_key:
+        self.base_url = base_url.rstrip('/') + '/' if base_url else settings.football_data_base_url
+        namespace = host_namespace(self.base_url)
+        key_prefix = "rate_limit:football_api"
+        if namespace is not None:
+            key_prefix = f"{key_prefix}:{namespace}"
+        self.source = FOOTBALL_DATA if namespace is None else f"{FOOTBALL_DATA}@{namespace}"
+        self.limiter = RedisRateLimiter(key_prefix=key_prefix, limit=settings.football_data_rate_limit)
+        self.transport = transport if transport is not None else shared_transport
+        self.cache = cache if cache is not None else default_response_cache(namespace)
+        self.archive = archive if archive is not None else default_payload_archive()
+        self.replay = replay if replay is not None else settings.replay
+
+        if self.replay:
+            if self.archive is None:
+                raise ValueError("Replay mode needs a payload archive")
+            logger.info(f"Replaying football-data payloads from {self.archive.directory}")
+        elif self.base_url != FOOTBALL_DATA_BASE_URL:
+            logger.info(f"Using football-data API at {self.base_url}")
+        elif not self.api_key:
             logger.error("No API Key found! Set FOOTBALL_DATA_API_KEY in .env")
 
     def _get(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        payload = self.cached(endpoint, params)
+        if payload is not None or self.replay:
+            return payload
         self.limiter.wait_if_needed()
-        
-        headers = {'X-Auth-Token': self.api_key}
+        return self._request(endpoint, params)
+
+    def cached(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        """Fresh cached payload for a call, without using the network or the rate budget."""
+        if self.replay:
+            payload = self.archive.latest(self.source, endpoint, params)
+            if payload is None:
+                logger.warning(f"Not in the payload archive: {endpoint} {params or ''}")
+            return payload
+        if self.cache is None:
+            return None
+        entry = self.cache.load(endpoint, params)
+        if entry is not None and entry.is_fresh(self.cache.clock()):
+            self.cache.count("hits")
+            return entry.payload
+        self.cache.count("misses")
+        return None
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        return self.cache.stats() if self.cache is not None else None
+
+    def _request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        """Performs the HTTP call. Callers are responsible for reserving rate-limit budget first."""
+        if self.replay:
+            return None
         url = f"{self.base_url}{endpoint}"
+        entry = self.cache.load(endpoint, params) if self.cache is not None else None
+        headers = {'X-Auth-Token': self.api_key or ''}
+        if entry is not None:
+            headers.update(entry.conditional_headers())
         
         try:
-            response = requests.get(url, headers=headers, params=params)
-            self.limiter.add_request()
+            response = self.transport.get(url, params=params, headers=headers)
             
             if response.status_code == 200:
-                return response.json()
+                payload = response.json()
+                self._save(endpoint, params, payload, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                return payload
+            elif response.status_code == 304 and entry is not None:
+                self.cache.count("revalidated")
+                self._save(endpoint, params, entry.payload, entry.etag, entry.last_modified, archive=False)
+                return entry.payload
             elif response.status_code == 429:
-                logger.warning(f"API Rate Limit 429. Sleeping 60s...")
-                time.sleep(60)
-                return self._get(endpoint, params)
+                logger.warning(f"API Rate Limit 429 persisted after retries: {url}")
+                return None
             elif response.status_code in [403, 404]:
                 logger.warning(f"{response.status_code} Error: {url}")
                 return None
@@ -85,23 +166,75 @@ class FootballDataClient:
             logger.error(f"Request failed: {e}")
             return None
 
+    def _save(self, endpoint: str, params: Optional[Dict], payload: Dict, etag: Optional[str],
+              last_modified: Optional[str], archive: bool = True):
+        """Archives and caches a good response. A failed write (full disk, permissions) is only logged."""
+        if archive and self.archive is not None:
+            try:
+                self.archive.append(self.source, endpoint, params, payload)
+            except Exception as e:
+                logger.warning(f"Could not archive {endpoint}: {e}")
+        if self.cache is not None:
+            try:
+                self.cache.store(endpoint, params, payload, cache_ttl(endpoint, params), etag, last_modified)
+            except Exception as e:
+                logger.warning(f"Could not cache {endpoint}: {e}")
+
     def fetch_multiple_seasons(self, competition_code: str, seasons: List[str]) -> Dict:
         all_seasons_data = {}
         for season in seasons:
             logger.info(f"Fetching {competition_code} season {season}...")
             data = self._get(f"competitions/{competition_code}/matches", {'season': season})
+            valid = finished_matches(data)
             
-            if data and 'matches' in data:
-                valid = [
-                    m for m in data['matches'] 
-                    if m['status'] == 'FINISHED' and m.get('score', {}).get('fullTime', {}).get('home') is not None
-                ]
+            if valid is not None:
                 all_seasons_data[season] = valid
                 logger.info(f"  -> Retrieved {len(valid)} valid matches.")
             else:
                 logger.warning(f"  -> No data found for {season}.")
         return all_seasons_data
 
+    def fetch_matches_window(self, competition_code: str, date_from: date, date_to: date) -> Optional[List[Dict]]:
+        """
+        All matches (any status) kicking off between date_from and date_to,
+        inclusive. None if any call failed, so a partial window is never
+        mistaken for a quiet one.
+        """
+        matches = []
+        start = date_from
+        while start <= date_to:
+            end = min(start + timedelta(days=MAX_WINDOW_DAYS - 1), date_to)
+            data = self._get(
+                f"competitions/{competition_code}/matches",
+                {'dateFrom': start.isoformat(), 'dateTo': end.isoformat()}
+            )
+            if data is None or 'matches' not in data:
+                return None
+            matches.extend(data['matches'])
+            start = end + timedelta(days=1)
+        return matches
+
+    def fetch_fixtures(self, competition_ids: List[int], date_from: date, date_to: date) -> Optional[List[Dict]]:
+        """
+        Matches of several competitions between date_from and date_to in one
+        call per MAX_WINDOW_DAYS span. None if any call failed, so a partial
+        result is never mistaken for a complete window.
+        """
+        matches = []
+        start = date_from
+        while start <= date_to:
+            end = min(start + timedelta(days=MAX_WINDOW_DAYS - 1), date_to)
+            data = self._get("matches", {
+                'competitions': ",".join(str(comp_id) for comp_id in sorted(competition_ids)),
+                'dateFrom': start.isoformat(),
+                'dateTo': end.isoformat(),
+            })
+            if data is None or 'matches' not in data:
+                return None
+            matches.extend(data['matches'])
+            start = end + timedelta(days=1)
+        return matches
+
     def fetch_competition_details(self, code: str):
         return self._get(f"competitions/{code}")
 
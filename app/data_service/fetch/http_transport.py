@@ -0,0 +1,275 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) seconds
+DEFAULT_TIMEOUT = (5.0, 30.0)
+POOL_SIZE = 16
+LATENCY_SAMPLES = 256
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised without touching the network while a host's circuit is open."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 3
+    backoff_base: float = 1.0
+    backoff_cap: float = 30.0
+    # Longest Retry-After honoured; anything beyond is treated as a failure
+    max_retry_after: float = 120.0
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures and rejects calls
+    until reset_timeout has passed; then a single trial call is let through
+    (half-open) and its outcome closes or re-opens the circuit.
+    """
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if self._clock() - self.opened_at >= self.reset_timeout else "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = self._clock()
+
+    def release(self):
+        """Ends a call that says nothing about the host's health (e.g. interrupted) without changing state."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+def _percentile_ms(ordered, q: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 1)
+
+
+class _HostMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.short_circuits = 0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def snapshot(self, circuit: str) -> Dict[str, Any]:
+        ordered = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "short_circuits": self.short_circuits,
+            "latency_ms_p50": _percentile_ms(ordered, 0.50),
+            "latency_ms_p95": _percentile_ms(ordered, 0.95),
+            "circuit": circuit,
+        }
+
+
+class HttpTransport:
+    """
+    Shared HTTP layer for every outbound client: one pooled keep-alive
+    session, connect/read timeouts, bounded retries with jittered
+    exponential backoff that honours Retry-After, and a circuit breaker
+    per host so a dead upstream fails fast instead of stalling each caller.
+    """
+    def __init__(
+        self,
+        pool_size: int = POOL_SIZE,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        retry: RetryPolicy = RetryPolicy(),
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.timeout = timeout
+        self.retry = retry
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._metrics: Dict[str, _HostMetrics] = {}
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: Optional[Timeout] = None
+    ) -> requests.Response:
+        """
+        Returns the first response that is not retryable, or the last one once
+        retries run out. Raises CircuitOpenError when the host is short-circuited,
+        the last connection error when no response was received at all, and any
+        other requests error (e.g. TooManyRedirects) at once, without retrying.
+        Every path settles the breaker, so a half-open trial is never left open.
+        """
+        host = urlparse(url).netloc
+        breaker, metrics = self._host(host)
+        if not breaker.allow():
+            with self._lock:
+                metrics.short_circuits += 1
+            raise CircuitOpenError(f"Circuit open for {host}; not calling {url}")
+
+        try:
+            response, error = self._attempts(method, url, params, headers, timeout, metrics)
+        except requests.RequestException:
+            with self._lock:
+                metrics.failures += 1
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+
+        if response is not None and response.status_code not in self.retry.retry_statuses:
+            breaker.record_success()
+            return response
+
+        with self._lock:
+            metrics.failures += 1
+        if response is not None and response.status_code == 429:
+            # Throttling means the host is alive; it must not open the circuit.
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+        if response is not None:
+            return response
+        raise error
+
+    def _attempts(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        headers: Optional[Dict],
+        timeout: Optional[Timeout],
+        metrics: _HostMetrics
+    ) -> Tuple[Optional[requests.Response], Optional[Exception]]:
+        """Calls until a response is not retryable or retries run out; returns the last response or connection error."""
+        response: Optional[requests.Response] = None
+        error: Optional[Exception] = None
+        for attempt in range(self.retry.max_retries + 1):
+            started = self._clock()
+            try:
+                response = self.session.request(
+                    method, url, params=params, headers=headers, timeout=timeout or self.timeout
+                )
+                error = None
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                response, error = None, e
+            finally:
+                with self._lock:
+                    metrics.requests += 1
+                    metrics.latencies.append(self._clock() - started)
+
+            if response is not None and response.status_code not in self.retry.retry_statuses:
+                return response, None
+
+            delay = self._retry_delay(attempt, response)
+            if attempt == self.retry.max_retries or delay is None:
+                break
+            with self._lock:
+                metrics.retries += 1
+            reason = response.status_code if response is not None else error
+            logger.warning(f"{method} {url} failed ({reason}); retry {attempt + 1}/{self.retry.max_retries} in {delay:.1f}s")
+            self._sleep(delay)
+        return response, error
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> Optional[float]:
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.retry.max_retry_after else None
+        # Full jitter keeps concurrent workers from retrying in lockstep
+        return random.uniform(0, min(self.retry.backoff_cap, self.retry.backoff_base * 2 ** attempt))
+
+    def _host(self, host: str) -> Tuple[CircuitBreaker, _HostMetrics]:
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout, self._clock)
+                self._metrics[host] = _HostMetrics()
+            return self._breakers[host], self._metrics[host]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {host: self._metrics[host].snapshot(self._breakers[host].state) for host in self._metrics}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After as seconds; accepts both the delta-seconds and HTTP-date forms."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+transport = HttpTransport()
@@ -0,0 +1,133 @@
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from app.config import load_settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+FOOTBALL_DATA = "football-data"
+UNDERSTAT = "understat"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS payloads (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    params TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    partition TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_payloads_lookup ON payloads (source, endpoint, params, fetched_at);
+"""
+
+def params_key(params: Optional[Dict]) -> str:
+    return json.dumps(params or {}, sort_keys=True, default=str)
+
+class PayloadArchive:
+    """
+    Append-only archive of every payload fetched from the external APIs.
+    Payloads are written as one gzip member each, appended to a file per
+    fetch day (YYYY/MM/YYYY-MM-DD.jsonl.gz, itself a valid gzip stream).
+    A SQLite index maps (source, endpoint, params) to the member's offset,
+    so any payload is read back with one seek and one decompress.
+    Appends hold an exclusive lock on the day file, so several archives or
+    processes writing to the same directory never record the wrong offset.
+    """
+    def __init__(self, directory: str, clock: Callable[[], float] = time.time):
+        self.directory = directory
+        self.clock = clock
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._index = sqlite3.connect(os.path.join(directory, "index.sqlite"), timeout=30, check_same_thread=False)
+        self._index.executescript(_SCHEMA)
+
+    def append(self, source: str, endpoint: str, params: Optional[Dict], payload: Any):
+        fetched_at = self.clock()
+        day = datetime.fromtimestamp(fetched_at, tz=timezone.utc).strftime("%Y-%m-%d")
+        partition = os.path.join(day[:4], day[5:7], f"{day}.jsonl.gz")
+        record = {'source': source, 'endpoint': endpoint, 'params': params or {}, 'fetched_at': fetched_at, 'payload': payload}
+        member = gzip.compress(json.dumps(record).encode('utf-8') + b"\n")
+
+        with self._lock:
+            path = os.path.join(self.directory, partition)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'ab') as handle:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    handle.write(member)
+                    handle.flush()
+                    # O_APPEND writes land at the end; the file lock keeps other writers out until tell()
+                    offset = handle.tell() - len(member)
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(handle, fcntl.LOCK_UN)
+            self._index.execute(
+                "INSERT INTO payloads (source, endpoint, params, fetched_at, partition, offset, length) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (source, endpoint, params_key(params), fetched_at, partition, offset, len(member))
+            )
+            self._index.commit()
+
+    def latest(self, source: str, endpoint: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """Most recently archived payload for a call, or None if it was never fetched."""
+        with self._lock:
+            row = self._index.execute(
+                "SELECT partition, offset, length FROM payloads "
+                "WHERE source = ? AND endpoint = ? AND params = ? ORDER BY fetched_at DESC LIMIT 1",
+                (source, endpoint, params_key(params))
+            ).fetchone()
+        return self._read(*row)['payload'] if row else None
+
+    def records(self, source: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Every archived record in fetch order, streamed partition by partition."""
+        with self._lock:
+            rows = self._index.execute(
+                "SELECT partition, offset, length FROM payloads WHERE ? IS NULL OR source = ? ORDER BY fetched_at, id",
+                (source, source)
+            ).fetchall()
+        for row in rows:
+            yield self._read(*row)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, size = self._index.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM payloads").fetchone()
+            partitions = self._index.execute("SELECT COUNT(DISTINCT partition) FROM payloads").fetchone()[0]
+        return {'payloads': count, 'compressed_bytes': size, 'partitions': partitions}
+
+    def _read(self, partition: str, offset: int, length: int) -> Dict[str, Any]:
+        with open(os.path.join(self.directory, partition), 'rb') as handle:
+            handle.seek(offset)
+            return json.loads(gzip.decompress(handle.read(length)))
+
+    def close(self):
+        with self._lock:
+            self._index.close()
+
+_archives: Dict[str, PayloadArchive] = {}
+_archives_lock = threading.Lock()
+
+def default_payload_archive() -> Optional[PayloadArchive]:
+    """Process-wide archive per directory, so every client shares one writer lock and index connection."""
+    settings = load_settings()
+    if not (settings.payload_archive_enabled or settings.replay):
+        return None
+    key = os.path.abspath(settings.payload_archive_dir)
+    with _archives_lock:
+        if key not in _archives:
+            _archives[key] = PayloadArchive(key)
+        return _archives[key]
@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+import redis
+
+from app.data_service.db.cache.cache_management import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# How long to stay on the local bucket after a Redis error before trying Redis again
+REDIS_RETRY_INTERVAL = 5.0
+
+# Refill, check and reserve in one atomic step. Uses the Redis server clock so
+# every host agrees on time. Returns the seconds to wait as a string, because
+# Redis truncates Lua numbers to integers; "0" means the token was taken.
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local wait = 0
+if tokens >= cost then
+    tokens = tokens - cost
+else
+    wait = (cost - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', string.format('%.6f', tokens), 'ts', string.format('%.6f', now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return string.format('%.6f', wait)
+"""
+
+
+class LocalTokenBucket:
+    """In-process token bucket with the same semantics as the Lua script."""
+    def __init__(self, capacity: float, rate: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.rate = rate
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._ts = clock()
+
+    def try_acquire(self, cost: float = 1) -> float:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + max(0.0, now - self._ts) * self.rate)
+            self._ts = now
+            if self._tokens >= cost:
+                self._tokens -= cost
+                return 0.0
+            return (cost - self._tokens) / self.rate
+
+
+class RedisRateLimiter:
+    """
+    Token bucket shared through Redis, refilled at limit/window tokens per
+    second. Check and reservation happen in a single Lua call, so any number
+    of workers, processes or hosts using the same key stay within the quota.
+    With the default burst of 1, requests are paced evenly and no sliding
+    window of `window` seconds ever holds more than `limit` of them; a larger
+    burst trades that guarantee for lower latency on short runs.
+    When Redis is unreachable, calls fall back to an in-process bucket.
+    """
+    def __init__(
+        self,
+        key_prefix: str = "rate_limit:football_api",
+        limit: int = 10,
+        window: int = 60,
+        burst: int = 1,
+        redis_client: Optional[redis.Redis] = None
+    ):
+        self.redis = redis_client if redis_client is not None else get_redis_client()
+        self.key = key_prefix
+        self.limit = limit
+        self.window = window
+        self.capacity = max(1, burst)
+        self.rate = limit / window
+        self.local = LocalTokenBucket(self.capacity, self.rate)
+        self._script = self.redis.register_script(TOKEN_BUCKET_LUA)
+        self._redis_down_until = 0.0
+
+    def try_acquire(self) -> float:
+        """Takes a token if one is available (returns 0), otherwise returns the exact wait in seconds."""
+        if time.monotonic() >= self._redis_down_until:
+            try:
+                return float(self._script(keys=[self.key], args=[self.capacity, self.rate, 1]))
+            except redis.RedisError as e:
+                logger.warning(f"Rate limiter falling back to the local bucket: {e}")
+                self._redis_down_until = time.monotonic() + REDIS_RETRY_INTERVAL
+        return self.local.try_acquire()
+
+    def wait_if_needed(self):
+        """Blocks until a token has been reserved for the caller."""
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            logger.info(f"Rate limit reached ({self.limit}/{self.window}s). Sleeping {wait:.2f}s...")
+            time.sleep(wait)
@@ -0,0 +1,104 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    payload: Any
+    stored_at: float
+    ttl: Optional[float]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, now: float) -> bool:
+        """Entries stored with ttl=None never expire."""
+        return self.ttl is None or now - self.stored_at < self.ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Gzipped JSON responses on disk, one file per (endpoint, params).
+    Stale entries are kept so their validators can be sent on the next
+    request; the caller decides freshness through the TTL it stores.
+    """
+    def __init__(self, directory: str, clock: Callable[[], float] = time.time):
+        self.directory = directory
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stores = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, endpoint: str, params: Optional[Dict] = None) -> str:
+        raw = json.dumps([endpoint, params or {}], sort_keys=True, default=str)
+        digest = hashlib.sha1(raw.encode()).hexdigest()
+        return os.path.join(self.directory, digest[:2], f"{digest}.json.gz")
+
+    def load(self, endpoint: str, params: Optional[Dict] = None) -> Optional[CachedResponse]:
+        path = self.path(endpoint, params)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return CachedResponse(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            return None
+
+    def store(
+        self,
+        endpoint: str,
+        params: Optional[Dict],
+        payload: Any,
+        ttl: Optional[float],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        entry = CachedResponse(payload, self.clock(), ttl, etag, last_modified)
+        path = self.path(endpoint, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temp file and rename so concurrent readers never see half an entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+                json.dump(entry.__dict__, f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.count("stores")
+
+    def count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "stores": self.stores,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
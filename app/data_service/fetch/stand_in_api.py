@@ -0,0 +1,473 @@
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from app.config import DEFAULT_COMPETITIONS_MAP
+
+logger = logging.getLogger(__name__)
+
+TEAMS_PER_COMPETITION = 20
+SQUAD_SIZE = 25
+POSITIONS = ["Goalkeeper"] * 3 + ["Defence"] * 8 + ["Midfield"] * 8 + ["Offence"] * 6
+# Full-time goals of one side: 0..5
+GOAL_WEIGHTS = [25, 33, 22, 12, 5, 3]
+
+def season_of(day: date) -> int:
+    return day.year if day.month >= 7 else day.year - 1
+
+class SyntheticFootballData:
+    """
+    Deterministic competitions, teams, squads and double round-robin seasons
+    in the football-data.org v4 JSON shape. Every value derives from the
+    seed and the competition/season/team, so two instances with the same
+    seed and `today` serve identical payloads. Matches before `today` are
+    FINISHED with a score; later ones are TIMED.
+    """
+    def __init__(
+        self,
+        competitions: Optional[Dict[str, int]] = None,
+        teams_per_competition: int = TEAMS_PER_COMPETITION,
+        today: Optional[date] = None,
+        seed: int = 0
+    ):
+        self.competitions = dict(competitions or DEFAULT_COMPETITIONS_MAP)
+        self.codes_by_id = {comp_id: code for code, comp_id in self.competitions.items()}
+        self.teams_per_competition = teams_per_competition
+        self.today = today or date.today()
+        self.seed = seed
+        self._seasons: Dict[Tuple[str, int], List[Dict]] = {}
+
+    def _rng(self, *key: Any) -> random.Random:
+        return random.Random(":".join(str(part) for part in (self.seed, *key)))
+
+    def current_season(self) -> int:
+        return season_of(self.today)
+
+    def competition(self, code: str) -> Optional[Dict]:
+        if code not in self.competitions:
+            return None
+        season = self.current_season()
+        return {
+            'id': self.competitions[code],
+            'name': f"Stand-in {code}",
+            'code': code,
+            'type': 'LEAGUE',
+            'emblem': None,
+            'area': {'id': 2000 + len(code), 'name': f"Area {code}", 'code': code[:3]},
+            'currentSeason': self._season_info(code, season),
+        }
+
+    def teams(self, code: str) -> List[Dict]:
+        comp_id = self.competitions[code]
+        return [self._team_ref(comp_id * 100 + i, code) for i in range(1, self.teams_per_competition + 1)]
+
+    def _team_ref(self, team_id: int, code: str) -> Dict:
+        number = team_id % 100
+        return {
+            'id': team_id,
+            'name': f"{code} Club {number:02d} FC",
+            'shortName': f"{code} Club {number:02d}",
+            'tla': f"{code[:1]}{number:02d}",
+            'crest': None,
+        }
+
+    def team(self, team_id: int) -> Optional[Dict]:
+        code = self.codes_by_id.get(team_id // 100)
+        if code is None or not 1 <= team_id % 100 <= self.teams_per_competition:
+            return None
+        rng = self._rng('squad', team_id)
+        squad = [
+            {
+                'id': team_id * 100 + n,
+                'name': f"Player {team_id}-{n:02d}",
+                'position': position,
+                'dateOfBirth': date(1990 + rng.randint(0, 15), rng.randint(1, 12), rng.randint(1, 28)).isoformat(),
+                'nationality': rng.choice(["England", "Spain", "Germany", "Italy", "France", "Brazil"]),
+            }
+            for n, position in enumerate(POSITIONS[:SQUAD_SIZE], start=1)
+        ]
+        return {**self._team_ref(team_id, code), 'founded': 1880 + team_id % 100, 'venue': f"Ground {team_id}",
+                'runningCompetitions': [self._competition_ref(code)], 'squad': squad}
+
+    def _competition_ref(self, code: str) -> Dict:
+        return {'id': self.competitions[code], 'name': f"Stand-in {code}", 'code': code, 'type': 'LEAGUE', 'emblem': None}
+
+    def _season_info(self, code: str, season: int) -> Dict:
+        start = date(season, 8, 1)
+        return {
+            'id': self.competitions[code] * 10_000 + season,
+            'startDate': start.isoformat(),
+            'endDate': date(season + 1, 5, 31).isoformat(),
+            'currentMatchday': None,
+            'winner': None,
+        }
+
+    def matches(self, code: str, season: int) -> List[Dict]:
+        key = (code, season)
+        if key not in self._seasons:
+            self._seasons[key] = self._build_season(code, season)
+        return self._seasons[key]
+
+    def _build_season(self, code: str, season: int) -> List[Dict]:
+        comp_id = self.competitions[code]
+        teams = self.teams(code)
+        rounds = _double_round_robin(len(teams))
+        # First matchday: the second Saturday of August
+        first = date(season, 8, 8)
+        first += timedelta(days=(5 - first.weekday()) % 7)
+        season_info = self._season_info(code, season)
+
+        matches = []
+        for matchday, pairs in enumerate(rounds, start=1):
+            for slot, (home, away) in enumerate(pairs):
+                kickoff = datetime.combine(first + timedelta(weeks=matchday - 1), datetime.min.time()) \
+                    + timedelta(hours=12 + 2 * (slot % 4))
+                number = len(matches) + 1
+                matches.append(self._match(
+                    comp_id * 1_000_000 + (season % 100) * 10_000 + number,
+                    code, season_info, matchday, kickoff, teams[home], teams[away]
+                ))
+        return matches
+
+    def _match(self, match_id: int, code: str, season_info: Dict, matchday: int,
+               kickoff: datetime, home: Dict, away: Dict) -> Dict:
+        finished = kickoff.date() < self.today
+        score = {'winner': None, 'duration': 'REGULAR',
+                 'fullTime': {'home': None, 'away': None}, 'halfTime': {'home': None, 'away': None}}
+        if finished:
+            rng = self._rng('match', match_id)
+            goals_home, goals_away = rng.choices(range(6), GOAL_WEIGHTS, k=2)
+            score.update(
+                winner='HOME_TEAM' if goals_home > goals_away else 'AWAY_TEAM' if goals_away > goals_home else 'DRAW',
+                fullTime={'home': goals_home, 'away': goals_away},
+                halfTime={'home': rng.randint(0, goals_home), 'away': rng.randint(0, goals_away)},
+            )
+        return {
+            'area': {'id': 2000 + len(code), 'name': f"Area {code}", 'code': code[:3]},
+            'competition': self._competition_ref(code),
+            'season': season_info,
+            'id': match_id,
+            'utcDate': kickoff.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            'status': 'FINISHED' if finished else 'TIMED',
+            'matchday': matchday,
+            'stage': 'REGULAR_SEASON',
+            'group': None,
+            'lastUpdated': kickoff.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            'homeTeam': home,
+            'awayTeam': away,
+            'score': score,
+            'odds': {'msg': "Activate Odds-Package in User-Panel to retrieve odds."},
+            'referees': [{'id': 10_000 + match_id % 97, 'name': f"Referee {match_id % 97}",
+                          'type': 'REFEREE', 'nationality': "England"}],
+        }
+
+    def standings(self, code: str, season: int) -> List[Dict]:
+        rows = {team['id']: {'team': team, 'playedGames': 0, 'won': 0, 'draw': 0, 'lost': 0,
+                             'goalsFor': 0, 'goalsAgainst': 0} for team in self.teams(code)}
+        for match in self.matches(code, season):
+            if match['status'] != 'FINISHED':
+                continue
+            home, away = rows[match['homeTeam']['id']], rows[match['awayTeam']['id']]
+            goals_home, goals_away = match['score']['fullTime']['home'], match['score']['fullTime']['away']
+            for side, scored, conceded in ((home, goals_home, goals_away), (away, goals_away, goals_home)):
+                side['playedGames'] += 1
+                side['goalsFor'] += scored
+                side['goalsAgainst'] += conceded
+                side['won' if scored > conceded else 'lost' if scored < conceded else 'draw'] += 1
+
+        table = []
+        for row in rows.values():
+            row['points'] = 3 * row['won'] + row['draw']
+            row['goalDifference'] = row['goalsFor'] - row['goalsAgainst']
+            table.append(row)
+        table.sort(key=lambda r: (-r['points'], -r['goalDifference'], -r['goalsFor'], r['team']['id']))
+        for position, row in enumerate(table, start=1):
+            row['position'] = position
+        return table
+
+    def scorers(self, code: str, season: int, limit: int = 10) -> List[Dict]:
+        played = sum(1 for m in self.matches(code, season) if m['status'] == 'FINISHED')
+        if not played:
+            return []
+        rng = self._rng('scorers', code, season)
+        candidates = []
+        for team in self.teams(code):
+            for player in self.team(team['id'])['squad']:
+                if player['position'] == 'Offence':
+                    goals = rng.randint(0, max(1, played // 20))
+                    candidates.append({
+                        'player': {'id': player['id'], 'name': player['name']},
+                        'team': team,
+                        'playedMatches': played * 2 // self.teams_per_competition,
+                        'goals': goals,
+                        'assists': rng.randint(0, max(1, goals // 2)),
+                        'penalties': rng.randint(0, max(0, goals // 5)),
+                    })
+        candidates.sort(key=lambda s: (-s['goals'], s['player']['id']))
+        return candidates[:limit]
+
+def _double_round_robin(n: int) -> List[List[Tuple[int, int]]]:
+    """Circle-method fixtures: every pairing once at home and once away."""
+    teams = list(range(n))
+    rounds = []
+    for _ in range(n - 1):
+        rounds.append([(teams[i], teams[n - 1 - i]) for i in range(n // 2)])
+        teams = [teams[0], teams[-1], *teams[1:-1]]
+    return rounds + [[(away, home) for home, away in pairs] for pairs in rounds]
+
+class StandInApi:
+    """
+    Routes v4 requests to the synthetic data and simulates the service
+    around it: per-request latency, a per-minute request quota answered with
+    429 + Retry-After like the real API, and optional random throttling.
+    """
+    def __init__(
+        self,
+        data: Optional[SyntheticFootballData] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: Optional[int] = None,
+        window: float = 60.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0,
+        clock=time.monotonic,
+        sleep=time.sleep
+    ):
+        self.data = data if data is not None else SyntheticFootballData(seed=seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.window = window
+        self.throttle_rate = throttle_rate
+        self.clock = clock
+        self.sleep = sleep
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window_start = clock()
+        self._window_count = 0
+        self._stats: Dict[str, int] = {'requests': 0, 'throttled': 0, 'not_found': 0}
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def handle(self, path: str) -> Tuple[int, Dict, Dict[str, str]]:
+        with self._lock:
+            self._stats['requests'] += 1
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            throttled = self._throttle()
+        if delay:
+            self.sleep(delay)
+        if throttled is not None:
+            return throttled
+
+        parts = urlsplit(path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        segments = [segment for segment in parts.path.split('/') if segment]
+        if segments[:1] == ['v4']:
+            segments = segments[1:]
+        try:
+            payload = self._route(segments, query)
+        except ValueError as e:
+            return 400, {'message': str(e), 'errorCode': 400}, {}
+        if payload is None:
+            with self._lock:
+                self._stats['not_found'] += 1
+            return 404, {'message': f"The resource you are looking for does not exist: {parts.path}", 'errorCode': 404}, {}
+        return 200, payload, self._quota_headers()
+
+    def _throttle(self) -> Optional[Tuple[int, Dict, Dict[str, str]]]:
+        now = self.clock()
+        if now - self._window_start >= self.window:
+            self._window_start, self._window_count = now, 0
+        reset = max(1, int(round(self.window - (now - self._window_start))))
+
+        over_quota = self.rate_limit is not None and self._window_count >= self.rate_limit
+        if over_quota or (self.throttle_rate and self._rng.random() < self.throttle_rate):
+            self._stats['throttled'] += 1
+            retry_after = reset if over_quota else 1
+            return 429, {'message': f"You reached your request limit. Wait {retry_after} seconds.", 'errorCode': 429}, {
+                'Retry-After': str(retry_after), 'X-Requests-Available-Minute': '0', 'X-RequestCounter-Reset': str(reset)
+            }
+        self._window_count += 1
+        return None
+
+    def _quota_headers(self) -> Dict[str, str]:
+        if self.rate_limit is None:
+            return {}
+        with self._lock:
+            available = max(self.rate_limit - self._window_count, 0)
+            reset = max(1, int(round(self.window - (self.clock() - self._window_start))))
+        return {'X-Requests-Available-Minute': str(available), 'X-RequestCounter-Reset': str(reset)}
+
+    def _season(self, query: Dict[str, str]) -> Optional[int]:
+        season = int(query['season']) if 'season' in query else self.data.current_season()
+        return season if season <= self.data.current_season() else None
+
+    def _route(self, segments: List[str], query: Dict[str, str]) -> Optional[Dict]:
+        data = self.data
+        if segments[:1] == ['competitions'] and len(segments) >= 2:
+            code = segments[1].upper()
+            if code.isdigit():
+                code = data.codes_by_id.get(int(code), code)
+            if code not in data.competitions:
+                return None
+            if len(segments) == 2:
+                return data.competition(code)
+            season = self._season(query)
+            if season is None:
+                return None
+            resource = segments[2]
+            if resource == 'matches':
+                matches = _filter_matches(data.matches(code, season), query)
+                return {'filters': query, 'resultSet': {'count': len(matches)},
+                        'competition': data._competition_ref(code), 'matches': matches}
+            if resource == 'standings':
+                return {'filters': query, 'competition': data._competition_ref(code),
+                        'season': data._season_info(code, season),
+                        'standings': [{'stage': 'REGULAR_SEASON', 'type': 'TOTAL', 'group': None,
+                                       'table': data.standings(code, season)}]}
+            if resource == 'scorers':
+                limit = int(query.get('limit', 10))
+                scorers = data.scorers(code, season, limit)
+                return {'count': len(scorers), 'filters': query, 'competition': data._competition_ref(code),
+                        'season': data._season_info(code, season), 'scorers': scorers}
+            return None
+
+        if segments[:1] == ['teams'] and len(segments) == 2 and segments[1].isdigit():
+            return data.team(int(segments[1]))
+
+        if segments == ['matches']:
+            return self._matches_across(query)
+        return None
+
+    def _matches_across(self, query: Dict[str, str]) -> Dict:
+        """GET /v4/matches: matches of several competitions in a date range (today by default)."""
+        data = self.data
+        requested = query.get('competitions')
+        codes = [data.codes_by_id.get(int(c), c) if c.isdigit() else c.upper()
+                 for c in requested.split(',')] if requested else list(data.competitions)
+        date_from = date.fromisoformat(query['dateFrom']) if 'dateFrom' in query else data.today
+        date_to = date.fromisoformat(query['dateTo']) if 'dateTo' in query else date_from
+        if date_to < date_from:
+            raise ValueError("dateTo must not be before dateFrom")
+
+        seasons = {season_of(date_from), season_of(date_to)}
+        matches = []
+        for code in codes:
+            if code not in data.competitions:
+                continue
+            for season in sorted(seasons):
+                if season <= data.current_season():
+                    matches.extend(_filter_matches(data.matches(code, season), query, date_from, date_to))
+        matches.sort(key=lambda m: (m['utcDate'], m['id']))
+        return {'filters': query, 'resultSet': {'count': len(matches)}, 'matches': matches}
+
+def _filter_matches(matches: List[Dict], query: Dict[str, str],
+                    date_from: Optional[date] = None, date_to: Optional[date] = None) -> List[Dict]:
+    if 'dateFrom' in query:
+        date_from = date.fromisoformat(query['dateFrom'])
+    if 'dateTo' in query:
+        date_to = date.fromisoformat(query['dateTo'])
+    statuses = set(query['status'].split(',')) if 'status' in query else None
+    matchday = int(query['matchday']) if 'matchday' in query else None
+
+    selected = []
+    for match in matches:
+        day = date.fromisoformat(match['utcDate'][:10])
+        if date_from is not None and day < date_from:
+            continue
+        if date_to is not None and day > date_to:
+            continue
+        if statuses is not None and match['status'] not in statuses:
+            continue
+        if matchday is not None and match['matchday'] != matchday:
+            continue
+        selected.append(match)
+    return selected
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        status, payload, headers = self.server.api.handle(self.path)
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+class LocalFootballDataServer:
+    """
+    Threaded localhost server for StandInApi. Point the client at it with
+    FOOTBALL_DATA_BASE_URL=<base_url>; port 0 picks a free port.
+
+    with LocalFootballDataServer(latency=0.05, rate_limit=600) as server:
+        client = FootballDataClient(base_url=server.base_url)
+    """
+    def __init__(self, api: Optional[StandInApi] = None, host: str = "127.0.0.1", port: int = 0, **options):
+        self.api = api if api is not None else StandInApi(**options)
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.api = self.api
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v4/"
+
+    def start(self) -> "LocalFootballDataServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="football-data-stand-in", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "LocalFootballDataServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve synthetic football-data.org v4 data on localhost.")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds.")
+    parser.add_argument("--rate-limit", type=int, default=None, help="Requests allowed per minute (429 beyond).")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of requests answered with a random 429.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+    server = LocalFootballDataServer(
+        port=args.port, latency=args.latency, jitter=args.jitter,
+        rate_limit=args.rate_limit, throttle_rate=args.throttle_rate, seed=args.seed
+    )
+    logger.info(f"Serving stand-in football-data API at {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        logger.info(f"Stand-in API stats: {server.api.stats()}")
+
+if __name__ == "__main__":
+    main()
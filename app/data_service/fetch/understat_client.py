@@ -1,53 +1,112 @@
-import requests
 import json
 import logging
+import os
 import re
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
+
+from app.config import load_settings
+from app.data_service.fetch.fetcher import season_is_complete
+from app.data_service.fetch.http_transport import HttpTransport, transport as shared_transport
+from app.data_service.fetch.payload_archive import UNDERSTAT, PayloadArchive, default_payload_archive
+from app.data_service.fetch.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Pages of the season in progress are re-downloaded after this many seconds
+CURRENT_SEASON_PAGE_TTL = 6 * 60 * 60
+
+# Every data blob on a league page is embedded as: var name = JSON.parse('...')
+_BLOB_PATTERN = re.compile(r"var\s+(\w+)\s*=\s*JSON\.parse\('([^']*)'\)")
+
+def extract_blobs(html: str) -> Dict[str, Any]:
+    """All JSON.parse blobs of a page (datesData, teamsData, playersData, ...) in one regex pass."""
+    blobs = {}
+    for name, raw in _BLOB_PATTERN.findall(html):
+        try:
+            blobs[name] = json.loads(raw.encode('utf8').decode('unicode_escape'))
+        except ValueError as e:
+            logger.warning(f"Could not decode Understat blob '{name}': {e}")
+    return blobs
+
+def default_page_cache() -> Optional[ResponseCache]:
+    settings = load_settings()
+    if not settings.http_cache_enabled:
+        return None
+    return ResponseCache(os.path.join(settings.http_cache_dir, "understat"))
+
 class UnderstatClient:
     BASE_URL = "https://understat.com/league"
 
+    def __init__(
+        self,
+        transport: Optional[HttpTransport] = None,
+        cache: Optional[ResponseCache] = None,
+        archive: Optional[PayloadArchive] = None,
+        replay: Optional[bool] = None
+    ):
+        self.transport = transport if transport is not None else shared_transport
+        self.cache = cache if cache is not None else default_page_cache()
+        self.archive = archive if archive is not None else default_payload_archive()
+        self.replay = replay if replay is not None else load_settings().replay
+        if self.replay and self.archive is None:
+            raise ValueError("Replay mode needs a payload archive")
+        self._seasons: Dict[tuple, Dict[str, Any]] = {}
+
+    def fetch_league_season(self, league_name: str, season_year: str) -> Dict[str, Any]:
+        """
+        Downloads a league/season page once and returns every embedded blob.
+        Parsed blobs are kept for the lifetime of the client, and raw pages
+        are cached on disk (past seasons permanently).
+        """
+        key = (league_name, str(season_year))
+        if key not in self._seasons:
+            html = self._page(league_name, str(season_year))
+            self._seasons[key] = extract_blobs(html) if html else {}
+        return self._seasons[key]
+
     def fetch_season_data(self, league_name: str, season_year: str) -> List[Dict]:
-        url = f"{self.BASE_URL}/{league_name}/{season_year}"
-        logger.info(f"Scraping Understat: {url}")
-        
-        try:
-            response = requests.get(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            scripts = soup.find_all('script')
-            
-            for script in scripts:
-                if 'datesData' in script.text:
-                    match = re.search(r"JSON\.parse\('([^']+)'\)", script.text)
-                    if match:
-                        json_string = match.group(1)
-                        json_string = json_string.encode('utf8').decode('unicode_escape')
-                        return json.loads(json_string)
-            
-            return []
-        except Exception as e:
-            logger.error(f"Error scraping Understat: {e}")
-            return []
+        return self.fetch_league_season(league_name, season_year).get('datesData', [])
+
+    def fetch_team_season_data(self, league_name: str, season_year: str) -> Dict[str, Dict]:
+        return self.fetch_league_season(league_name, season_year).get('teamsData', {})
 
     def fetch_player_season_data(self, league_name: str, season_year: str) -> List[Dict]:
         """
-        Scrapes aggregate player stats for a season.
+        Aggregate player stats for a season.
         """
-        url = f"{self.BASE_URL}/{league_name}/{season_year}"
+        return self.fetch_league_season(league_name, season_year).get('playersData', [])
+
+    def _page(self, league_name: str, season_year: str) -> Optional[str]:
+        endpoint = f"{league_name}/{season_year}"
+        if self.replay:
+            return self.archive.latest(UNDERSTAT, endpoint)
+        if self.cache is not None:
+            entry = self.cache.load(endpoint)
+            if entry is not None and entry.is_fresh(self.cache.clock()):
+                self.cache.count("hits")
+                return entry.payload
+            self.cache.count("misses")
+
+        url = f"{self.BASE_URL}/{endpoint}"
+        logger.info(f"Scraping Understat: {url}")
         try:
-            response = requests.get(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            scripts = soup.find_all('script')
-            
-            for script in scripts:
-                if 'playersData' in script.text:
-                    json_string = script.text.split("JSON.parse('")[1].split("');")[0]
-                    json_string = json_string.encode('utf8').decode('unicode_escape')
-                    return json.loads(json_string)
-            return []
+            response = self.transport.get(url)
+            response.raise_for_status()
+            html = response.text
         except Exception as e:
-            logger.error(f"Error scraping players: {e}")
-            return []
\ No newline at end of file
+            logger.error(f"Error scraping Understat: {e}")
+            return None
+
+        # A failed write (full disk, permissions) must not cost a page that was already downloaded
+        if self.archive is not None:
+            try:
+                self.archive.append(UNDERSTAT, endpoint, None, html)
+            except Exception as e:
+                logger.warning(f"Could not archive {endpoint}: {e}")
+        if self.cache is not None:
+            ttl = None if season_is_complete(season_year) else CURRENT_SEASON_PAGE_TTL
+            try:
+                self.cache.store(endpoint, None, html, ttl)
+            except Exception as e:
+                logger.warning(f"Could not cache {endpoint}: {e}")
+        return html
@@ -0,0 +1,58 @@
+import logging
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from app.config import DEFAULT_COMPETITIONS_MAP
+from app.data_service.db_session import get_db_service
+from app.data_service.fetch.fetcher import FootballDataClient
+
+logger = logging.getLogger(__name__)
+
+# Kick-off times and statuses of upcoming matches change; a stored window is refetched after this
+FIXTURE_TTL = timedelta(minutes=10)
+# football-data marks a fixture TIMED once its kick-off time is confirmed
+UPCOMING_STATUSES = ("SCHEDULED", "TIMED")
+
+def upcoming_fixtures(
+    codes: Iterable[str],
+    days: int,
+    client: Optional[FootballDataClient] = None,
+    today: Optional[date] = None,
+    ttl: timedelta = FIXTURE_TTL
+) -> Dict[str, List[Dict]]:
+    """
+    Not-yet-played matches from today to today + days, by competition code.
+    Reads the fixtures store; competitions whose stored window is missing,
+    narrower or older than ttl are fetched together in one multi-competition
+    call and written back, so the predictors and the site export in the
+    same run share a single fetch.
+    """
+    codes = list(codes)
+    if not codes:
+        return {}
+    today = today or date.today()
+    date_to = today + timedelta(days=days)
+    codes_by_id = {comp_id: code for code, comp_id in DEFAULT_COMPETITIONS_MAP.items()}
+
+    with get_db_service() as service:
+        fresh = set(service.fixtures.fresh_codes(codes, today, date_to, ttl))
+        stale = [code for code in codes if code not in fresh]
+        if stale:
+            client = client if client is not None else FootballDataClient()
+            matches = client.fetch_fixtures([DEFAULT_COMPETITIONS_MAP[code] for code in stale], today, date_to)
+            if matches is None:
+                logger.warning(f"Fixture fetch failed for {', '.join(stale)}; using stored fixtures.")
+            else:
+                grouped: Dict[str, List[Dict]] = {}
+                for match in matches:
+                    code = codes_by_id.get(match.get('competition', {}).get('id'))
+                    if code in stale:
+                        grouped.setdefault(code, []).append(match)
+                service.fixtures.replace(stale, today, date_to, grouped)
+                logger.info(f"Fetched {len(matches)} fixtures for {', '.join(stale)} ({today} to {date_to}).")
+        stored = service.fixtures.get(codes, today, date_to)
+
+    return {
+        code: [match for match in matches if match.get('status') in UPCOMING_STATUSES]
+        for code, matches in stored.items()
+    }
@@ -0,0 +1,160 @@
+import logging
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz, process
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.data_service.db.database.db_schema import Match, Team, TeamAlias
+
+logger = logging.getLogger(__name__)
+
+UNDERSTAT = "understat"
+ODDS_CSV = "football_data_uk"
+SPORTSDB = "thesportsdb"
+
+# Minimum WRatio score for a fuzzy candidate to be accepted
+MATCH_CUTOFF = 85
+
+# Club-type tokens that carry no identity ("Arsenal FC" == "Arsenal")
+_NOISE_TOKENS = {"fc", "cf", "afc", "ac", "sc", "cd", "ud", "sd", "ss", "ssc", "as", "sv", "vfl", "vfb", "club", "the"}
+
+def normalize_team_name(name: Optional[str]) -> str:
+    """Lowercase, accent-free, punctuation-free name without club-type tokens."""
+    if not isinstance(name, str):
+        return ""
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    text = re.sub(r"[^a-z0-9 ]+", " ", text.replace("&", " and "))
+    tokens = [token for token in text.split() if token not in _NOISE_TOKENS]
+    return " ".join(tokens) or text.strip()
+
+class TeamResolver:
+    """
+    Maps source-specific team names to team ids.
+    Known aliases are loaded once from team_aliases and served from a dict.
+    Names seen for the first time are resolved together: exact normalized
+    matches first, then one batched fuzzy scoring (rapidfuzz cdist) against
+    the candidate teams, usually one competition's. Accepted matches are
+    persisted, so later runs never score them again. Without candidates only
+    unambiguous exact matches are made, and they are not persisted: across
+    every team, reserve and women's sides score too close to the senior club.
+    Names that stay unresolved are only remembered for the lifetime of the
+    resolver, so they are retried once new teams are seeded.
+    Rows can be added to team_aliases by hand (score NULL) to pin a mapping.
+    """
+    def __init__(self, session: Session, cutoff: int = MATCH_CUTOFF):
+        self.session = session
+        self.cutoff = cutoff
+        self._aliases: Optional[Dict[Tuple[str, str], int]] = None
+        self._unscoped: Dict[Tuple[str, str], int] = {}
+        self._unresolved: Set[Tuple[str, str, Optional[Tuple[int, ...]]]] = set()
+        self.fuzzy_scored = 0
+
+    def resolve(self, source: str, name: str, candidates: Optional[Dict[int, str]] = None) -> Optional[int]:
+        return self.resolve_many(source, [name], candidates).get(name)
+
+    def resolve_many(
+        self,
+        source: str,
+        names: Iterable[str],
+        candidates: Optional[Dict[int, str]] = None
+    ) -> Dict[str, Optional[int]]:
+        """
+        Resolves every name, scoring only those never seen before.
+        candidates (team id -> name), e.g. the teams of one competition, is
+        what fuzzy matching scores against; without it only exact matches
+        across all teams are made.
+        """
+        aliases = self._load_aliases()
+        scope = tuple(sorted(candidates)) if candidates is not None else None
+        keys = {name: normalize_team_name(name) for name in set(names) if isinstance(name, str)}
+        unknown = sorted({
+            key for key in keys.values()
+            if key and (source, key) not in aliases and (source, key, scope) not in self._unresolved
+            and not (scope is None and (source, key) in self._unscoped)
+        })
+        if unknown:
+            self._resolve_new(source, unknown, candidates, scope)
+        return {
+            name: aliases.get((source, key), self._unscoped.get((source, key)) if scope is None else None)
+            for name, key in keys.items()
+        }
+
+    def competition_teams(self, competition_id: int) -> Dict[int, str]:
+        """Teams that played in a competition, as fuzzy-matching candidates."""
+        rows = self.session.query(Team.id, Team.name).join(
+            Match, or_(Match.home_team_id == Team.id, Match.away_team_id == Team.id)
+        ).filter(Match.competition_id == competition_id).distinct().all()
+        return dict(rows)
+
+    def _load_aliases(self) -> Dict[Tuple[str, str], int]:
+        if self._aliases is None:
+            rows = self.session.query(TeamAlias.source, TeamAlias.alias, TeamAlias.team_id).all()
+            self._aliases = {(source, alias): team_id for source, alias, team_id in rows}
+        return self._aliases
+
+    def _choices(self, candidates: Optional[Dict[int, str]]) -> Tuple[List[str], List[int]]:
+        if candidates is None:
+            rows = self.session.query(Team.id, Team.name, Team.short_name).all()
+        else:
+            short_names = dict(
+                self.session.query(Team.id, Team.short_name).filter(Team.id.in_(list(candidates))).all()
+            ) if candidates else {}
+            rows = [(team_id, name, short_names.get(team_id)) for team_id, name in candidates.items()]
+
+        keys, ids = [], []
+        for team_id, name, short_name in rows:
+            for label in (name, short_name):
+                key = normalize_team_name(label)
+                if key:
+                    keys.append(key)
+                    ids.append(team_id)
+        return keys, ids
+
+    def _resolve_new(
+        self,
+        source: str,
+        unknown: List[str],
+        candidates: Optional[Dict[int, str]],
+        scope: Optional[Tuple[int, ...]]
+    ):
+        choice_keys, choice_ids = self._choices(candidates)
+        owners: Dict[str, Set[int]] = {}
+        for key, team_id in zip(choice_keys, choice_ids):
+            owners.setdefault(key, set()).add(team_id)
+        exact = {key: next(iter(ids)) for key, ids in owners.items() if len(ids) == 1}
+        resolved: Dict[str, Tuple[int, float]] = {}
+
+        pending = []
+        for key in unknown:
+            if key in exact:
+                resolved[key] = (exact[key], 100.0)
+            else:
+                pending.append(key)
+
+        if pending and choice_keys and candidates is not None:
+            scores = process.cdist(pending, choice_keys, scorer=fuzz.WRatio, workers=-1)
+            best = np.argmax(scores, axis=1)
+            self.fuzzy_scored += len(pending)
+            for row, key in enumerate(pending):
+                score = float(scores[row, best[row]])
+                if score >= self.cutoff:
+                    resolved[key] = (choice_ids[best[row]], score)
+
+        for key in unknown:
+            if key not in resolved:
+                self._unresolved.add((source, key, scope))
+            elif candidates is None:
+                self._unscoped[(source, key)] = resolved[key][0]
+            else:
+                team_id, score = resolved[key]
+                self.session.merge(TeamAlias(source=source, alias=key, team_id=team_id, score=score))
+                self._aliases[(source, key)] = team_id
+        if candidates is not None and resolved:
+            self.session.commit()
+
+        if len(resolved) < len(unknown):
+            logger.info(f"{source}: {len(unknown) - len(resolved)} of {len(unknown)} new team names left unresolved")
@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable
+
+import joblib
+import pandas as pd
+
+from app.config import COMPETITIONS_MAP, TRAINING_SEASONS
+from app.data_service.db.cache.prediction_cache import (
+    PredictionCache,
+    default_prediction_cache,
+    feature_digests,
+    model_fingerprint,
+)
+from app.ml.feature_engineering import FeatureEngineer
+
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = Path("models")
+# Must match FeatureEngineer: rolling window and Elo K-factor used in training
+ROLLING_WINDOW = 5
+ELO_K = 20
+# Team states are rebuilt from the database once they are this old (seconds)
+TEAM_STATE_TTL = 10 * 60
+# CLI verdict: a side is called once its probability clears this
+VERDICT_THRESHOLD = 0.45
+
+CLASS_LABELS = {0: "Loss", 1: "Draw", 2: "Win"}
+
+
+@dataclass(frozen=True)
+class TeamState:
+    """
+    A team's form after its latest finished match. The defaults describe an
+    average team and are used for teams without history. deep and ppda are
+    not stored in the matches table, so training saw 0 for them.
+    """
+    rolling_xG: float = 1.35
+    rolling_deep: float = 0.0
+    rolling_ppda: float = 0.0
+    rolling_goals: float = 1.35
+    rolling_points: float = 1.35
+    rolling_wins: float = 2.0
+    elo: float = 1500.0
+    last_played: datetime | None = None
+
+
+DEFAULT_TEAM_STATE = TeamState()
+
+
+def label_for_class(value: Any) -> str:
+    try:
+        return CLASS_LABELS.get(int(value), str(value))
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def current_season(today: date | None = None) -> str:
+    today = today or date.today()
+    return str(today.year if today.month >= 7 else today.year - 1)
+
+
+def fixture_features(home: TeamState, away: TeamState, kickoff: datetime | None) -> dict[str, float]:
+    """The model's feature row for a fixture, seen from the home side (the Win/Draw/Loss labels are the home team's)."""
+    rest_days = 7
+    if kickoff is not None and home.last_played is not None:
+        rest_days = min(max((kickoff - home.last_played).days, 0), 14)
+    return {
+        "rolling_xG": home.rolling_xG,
+        "rolling_xGA": away.rolling_xG,
+        "rolling_deep": home.rolling_deep,
+        "rolling_ppda": home.rolling_ppda,
+        "rolling_goals": home.rolling_goals,
+        "rolling_wins": home.rolling_wins,
+        "is_home": 1.0,
+        "xG_diff": home.rolling_xG - away.rolling_xG,
+        "ppda_diff": home.rolling_ppda - away.rolling_ppda,
+        "deep_diff": home.rolling_deep - away.rolling_deep,
+        "points_diff": home.rolling_points - away.rolling_points,
+        "team_elo": home.elo,
+        "opp_elo": away.elo,
+        "elo_diff": home.elo - away.elo,
+        "rest_days": float(rest_days),
+    }
+
+
+def team_states_from_matches(columns: dict[str, list[Any]] | pd.DataFrame) -> dict[int, TeamState]:
+    """Latest TeamState per team from finished matches in the get_training_columns layout."""
+    from app.ml.training import ModelTrainer
+
+    matches = pd.DataFrame(columns)
+    if matches.empty:
+        return {}
+    rows = ModelTrainer._team_rows(matches)
+    rows["date"] = pd.to_datetime(rows["date"])
+    rows = FeatureEngineer()._calculate_elo(rows)
+
+    # _calculate_elo assigns pre-match ratings; apply each team's last update on top
+    score = rows["result"].map({"W": 1.0, "D": 0.5, "L": 0.0})
+    expected = 1 / (1 + 10 ** ((rows["opp_elo"] - rows["team_elo"]) / 400))
+    rows["elo_after"] = rows["team_elo"] + ELO_K * (score - expected)
+    rows["points"] = rows["result"].map({"W": 3, "D": 1, "L": 0})
+    rows = rows.sort_values(["date", "id"], kind="mergesort")
+
+    states = {}
+    for team_id, group in rows.groupby("teamID"):
+        recent = group.tail(ROLLING_WINDOW)
+        states[int(team_id)] = TeamState(
+            rolling_xG=float(recent["xGoals"].mean()),
+            rolling_goals=float(recent["goals"].astype(float).mean()),
+            rolling_points=float(recent["points"].mean()),
+            rolling_wins=float((recent["result"] == "W").sum()),
+            elo=float(group["elo_after"].iloc[-1]),
+            last_played=group["date"].iloc[-1].to_pydatetime(),
+        )
+    return states
+
+
+def load_team_states(competition_id: int, seasons: list[str] | None = None) -> dict[int, TeamState]:
+    from app.data_service.db_session import get_db_service
+
+    seasons = sorted(set(seasons or [*TRAINING_SEASONS, current_season()]))
+    with get_db_service() as service:
+        columns = service.matches.get_training_columns(competition_id, seasons)
+    return team_states_from_matches(columns)
+
+
+def _kickoff(fixture: dict[str, Any]) -> datetime | None:
+    try:
+        return datetime.strptime(fixture["utcDate"], "%Y-%m-%dT%H:%M:%SZ")
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class FixturePrediction:
+    competition: str
+    fixture: dict[str, Any] = field(repr=False)
+    probabilities: dict[str, float]
+
+    @property
+    def home_team(self) -> str | None:
+        return self.fixture.get("homeTeam", {}).get("name")
+
+    @property
+    def away_team(self) -> str | None:
+        return self.fixture.get("awayTeam", {}).get("name")
+
+    @property
+    def prediction(self) -> str:
+        return max(self.probabilities, key=self.probabilities.get)
+
+    @property
+    def confidence(self) -> float:
+        return self.probabilities[self.prediction]
+
+    def verdict(self) -> str:
+        if self.probabilities.get("Win", 0.0) > VERDICT_THRESHOLD:
+            return "HOME WIN"
+        if self.probabilities.get("Loss", 0.0) > VERDICT_THRESHOLD:
+            return "AWAY WIN"
+        return "DRAW (Risk)"
+
+    def to_record(self) -> dict[str, Any]:
+        """Row of docs/data/predictions.json."""
+        return {
+            "competition": self.competition,
+            "utc_date": self.fixture.get("utcDate"),
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "prediction": self.prediction,
+            "confidence": self.confidence,
+            "probabilities": dict(self.probabilities),
+        }
+
+
+class PredictionService:
+    """
+    The one inference path behind the CLI, the site export and the
+    prediction server. Models are loaded once and reloaded only when their
+    file changes; team states are read from the database once per
+    TEAM_STATE_TTL; each competition's fixtures are scored in a single
+    predict_proba call. Scores are cached per model fingerprint and feature
+    row, so only rows the current model has not seen reach predict_proba.
+    """
+    def __init__(
+        self,
+        models_dir: Path | str = MODELS_DIR,
+        competitions: dict[str, int] | None = None,
+        seasons: list[str] | None = None,
+        state_source: Callable[[int, list[str] | None], dict[int, TeamState]] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        cache: PredictionCache | None = None,
+    ):
+        self.models_dir = Path(models_dir)
+        self.competitions = dict(competitions or COMPETITIONS_MAP)
+        self.seasons = list(seasons) if seasons else None
+        self.state_source = state_source if state_source is not None else load_team_states
+        self.clock = clock
+        self.cache = cache if cache is not None else default_prediction_cache()
+        self.features = FeatureEngineer().features
+        self._lock = threading.RLock()
+        self._models: dict[str, tuple[float, Any, str]] = {}
+        self._states: dict[str, tuple[float, dict[int, TeamState]]] = {}
+        # Bumped by invalidate(), so a rebuild started before it is not cached
+        self._generations: dict[str, int] = {}
+
+    def model_path(self, code: str) -> Path:
+        return self.models_dir / f"{code.lower()}_model.joblib"
+
+    def available_competitions(self) -> list[str]:
+        return [code for code in self.competitions if self.model_path(code).exists()]
+
+    def model(self, code: str) -> Any | None:
+        """The competition's model, reloaded when the file's mtime changes; None if it has none."""
+        loaded = self._load_model(code)
+        return loaded[1] if loaded is not None else None
+
+    def model_fingerprint(self, code: str) -> str | None:
+        """Content hash of the loaded model file; a retrain changes it and with it every cache key."""
+        loaded = self._load_model(code)
+        return loaded[2] if loaded is not None else None
+
+    def _load_model(self, code: str) -> tuple[float, Any, str] | None:
+        path = self.model_path(code)
+        with self._lock:
+            try:
+                mtime = path.stat().st_mtime
+            except FileNotFoundError:
+                self._models.pop(code, None)
+                return None
+            cached = self._models.get(code)
+            if cached is None or cached[0] != mtime:
+                logger.info(f"Loading model {path}")
+                self._models[code] = (mtime, joblib.load(path), model_fingerprint(path))
+            return self._models[code]
+
+    def team_states(self, code: str) -> dict[int, TeamState]:
+        """
+        The competition's team states, rebuilt once they are TEAM_STATE_TTL old.
+        The rebuild runs outside the lock so other competitions keep scoring;
+        a rebuild that raced an invalidate() is returned but not cached.
+        """
+        with self._lock:
+            cached = self._states.get(code)
+            if cached is not None and self.clock() - cached[0] < TEAM_STATE_TTL:
+                return cached[1]
+            generation = self._generations.get(code, 0)
+        try:
+            states = self.state_source(self.competitions[code], self.seasons)
+        except Exception as e:
+            logger.warning(f"Team states unavailable for {code}, using defaults: {e}")
+            states = {}
+        with self._lock:
+            if self._generations.get(code, 0) == generation:
+                self._states[code] = (self.clock(), states)
+        return states
+
+    def invalidate(self, code: str | None = None):
+        """Drops cached models and team states of one competition or all, e.g. after retraining or a match sync."""
+        with self._lock:
+            codes = [code] if code is not None else set(self.competitions) | set(self._models) | set(self._states)
+            for key in codes:
+                self._models.pop(key, None)
+                self._states.pop(key, None)
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def feature_frame(self, code: str, fixtures: list[dict[str, Any]]) -> pd.DataFrame:
+        states = self.team_states(code)
+        rows = [
+            fixture_features(
+                states.get(fixture.get("homeTeam", {}).get("id"), DEFAULT_TEAM_STATE),
+                states.get(fixture.get("awayTeam", {}).get("id"), DEFAULT_TEAM_STATE),
+                _kickoff(fixture),
+            )
+            for fixture in fixtures
+        ]
+        return pd.DataFrame(rows, columns=self.features)
+
+    def predict_fixtures(self, fixtures: dict[str, list[dict[str, Any]]]) -> list[FixturePrediction]:
+        """Scores fixtures grouped by competition code; competitions without a model are skipped."""
+        predictions = []
+        for code, matches in fixtures.items():
+            if not matches:
+                continue
+            loaded = self._load_model(code)
+            if loaded is None:
+                logger.warning(f"No model found for {code} ({self.model_path(code)}). Skipping.")
+                continue
+            _, model, fingerprint = loaded
+            for match, probabilities in zip(matches, self._score(model, fingerprint, self.feature_frame(code, matches))):
+                predictions.append(FixturePrediction(code, match, probabilities))
+        return predictions
+
+    def _score(self, model: Any, fingerprint: str, frame: pd.DataFrame) -> list[dict[str, float]]:
+        """Probabilities per row: cached rows are reused, the rest go through one predict_proba call."""
+        digests = feature_digests(frame.to_numpy())
+        scored = self.cache.get_many(fingerprint, digests)
+        missing = [idx for idx, digest in enumerate(digests) if digest not in scored]
+        if missing:
+            labels = [label_for_class(value) for value in model.classes_]
+            probs = model.predict_proba(frame.iloc[missing])
+            fresh = {digests[idx]: {label: float(p) for label, p in zip(labels, row)} for idx, row in zip(missing, probs)}
+            self.cache.set_many(fingerprint, fresh)
+            scored.update(fresh)
+        return [dict(scored[digest]) for digest in digests]
+
+    def cache_stats(self) -> dict[str, Any]:
+        return self.cache.stats()
+
+    def predict_upcoming(self, days: int) -> list[FixturePrediction]:
+        from app.data_service.fixtures import upcoming_fixtures
+
+        return self.predict_fixtures(upcoming_fixtures(self.available_competitions(), days))
+
+
+def log_predictions(predictions: list[FixturePrediction]) -> None:
+    """CLI view: one block per fixture, grouped by competition."""
+    by_competition: dict[str, list[FixturePrediction]] = {}
+    for prediction in predictions:
+        by_competition.setdefault(prediction.competition, []).append(prediction)
+    for code, group in by_competition.items():
+        logger.info(f"--- Analyzing {code} ({len(group)} games) ---")
+        for p in group:
+            logger.info(f"{p.home_team} vs {p.away_team}")
+            logger.info(f"Pred: {p.verdict()} ({p.confidence * 100:.1f}%)")
+            logger.info(
+                f"Probs: H:{p.probabilities.get('Win', 0.0):.2f} "
+                f"D:{p.probabilities.get('Draw', 0.0):.2f} A:{p.probabilities.get('Loss', 0.0):.2f}\n"
+            )
+
+
+def export_records(predictions: list[FixturePrediction]) -> list[dict[str, Any]]:
+    return [prediction.to_record() for prediction in predictions]
+
+
+_services: dict[Path, PredictionService] = {}
+_services_lock = threading.Lock()
+
+
+def get_prediction_service(models_dir: Path | str = MODELS_DIR) -> PredictionService:
+    """Process-wide service per models directory, so every entry point in a run shares warm models."""
+    key = Path(models_dir).resolve()
+    with _services_lock:
+        if key not in _services:
+            _services[key] = PredictionService(key)
+        return _services[key]
+
+
+def prediction_cache_stats(models_dir: Path | str = MODELS_DIR) -> dict[str, Any] | None:
+    """Cache stats of the shared service for models_dir, or None if this process has not predicted with it."""
+    with _services_lock:
+        service = _services.get(Path(models_dir).resolve())
+    return service.cache_stats() if service is not None else None
@@ -39,67 +39,53 @@ class ModelTrainer:
         logger.info(f"--- Building Dataset for Comp ID: {competition_id} ---")
         
         with get_db_service() as service:
-            all_matches = []
-            for season in seasons:
-                matches = service.matches.get_by_competition(competition_id, season)
-                logger.info(f"Loaded {len(matches)} matches for season {season}")
-                all_matches.extend(matches)
-            
-            if not all_matches:
-                return pd.DataFrame()
-
-            data = []
-            for m in all_matches:
-
-                if m.status != 'FINISHED' or m.score_home is None:
-                    continue
-
-                row = {
-                    'id': m.id,
-                    'date': m.utc_date,
-                    'season': m.season_year,
-                    'home_team': m.home_team_id,
-                    'away_team': m.away_team_id,
-                    'teamID': m.home_team_id,
-                    'opponentID': m.away_team_id,
-                    'location': 'h',
-                    'result': 'W' if m.winner == 'HOME_TEAM' else ('L' if m.winner == 'AWAY_TEAM' else 'D'),
-                    'goals': m.score_home,
-                    'xGoals': m.home_xg if m.home_xg is not None else 0.0,
-                    
-                    'odds_home': m.odds_home,
-                    'odds_draw': m.odds_draw,
-                    'odds_away': m.odds_away
-                }
-
-                row_away = {
-                    'id': m.id,
-                    'date': m.utc_date,
-                    'season': m.season_year,
-                    'home_team': m.home_team_id,
-                    'away_team': m.away_team_id,
-                    'teamID': m.away_team_id,
-                    'opponentID': m.home_team_id,
-                    'location': 'a',
-                    'result': 'W' if m.winner == 'AWAY_TEAM' else ('L' if m.winner == 'HOME_TEAM' else 'D'),
-                    'goals': m.score_away,
-                    'xGoals': m.away_xg if m.away_xg is not None else 0.0,
-                    
-                    'odds_home': m.odds_home,
-                    'odds_draw': m.odds_draw,
-                    'odds_away': m.odds_away
-                }
-                
-                data.append(row)
-                data.append(row_away)
-
-            df = pd.DataFrame(data)
-
-            if df.empty: return df
-            
-            processed_df = self.fe.calculate_rolling_features(df)
-            
-            return processed_df
+            columns = service.matches.get_training_columns(competition_id, seasons)
+
+        matches = pd.DataFrame(columns)
+        logger.info(f"Loaded {len(matches)} matches for seasons {', '.join(str(s) for s in seasons)}")
+
+        if matches.empty:
+            return pd.DataFrame()
+
+        df = self._team_rows(matches)
+        processed_df = self.fe.calculate_rolling_features(df)
+
+        return processed_df
+
+    @staticmethod
+    def _team_rows(matches: pd.DataFrame) -> pd.DataFrame:
+        """
+        Expands one row per match into a home-team and an away-team row,
+        interleaved in match order (home first) as the FeatureEngineer expects.
+        """
+        home_won = matches['winner'] == 'HOME_TEAM'
+        away_won = matches['winner'] == 'AWAY_TEAM'
+
+        def side(team, opponent, location, won, lost, goals, xg):
+            return pd.DataFrame({
+                'id': matches['id'],
+                'date': matches['utc_date'],
+                'season': matches['season_year'],
+                'home_team': matches['home_team_id'],
+                'away_team': matches['away_team_id'],
+                'teamID': matches[team],
+                'opponentID': matches[opponent],
+                'location': location,
+                'result': np.select([won, lost], ['W', 'L'], default='D'),
+                'goals': matches[goals],
+                'xGoals': matches[xg].astype(float).fillna(0.0),
+
+                'odds_home': matches['odds_home'],
+                'odds_draw': matches['odds_draw'],
+                'odds_away': matches['odds_away']
+            })
+
+        home = side('home_team_id', 'away_team_id', 'h', home_won, away_won, 'score_home', 'home_xg')
+        away = side('away_team_id', 'home_team_id', 'a', away_won, home_won, 'score_away', 'away_xg')
+        home.index = np.arange(len(matches)) * 2
+        away.index = np.arange(len(matches)) * 2 + 1
+
+        return pd.concat([home, away]).sort_index().reset_index(drop=True)
 
     def train(self, df: pd.DataFrame, tune=False):
         if df.empty:
@@ -140,5 +126,8 @@ class ModelTrainer:
     def save_model(self, name: str):
         if not os.path.exists("models"):
             os.makedirs("models")
-        joblib.dump(self.model, f"models/{name}.joblib")
+        # Write then rename, so a running prediction server never loads a half-written file
+        tmp_path = f"models/{name}.joblib.tmp"
+        joblib.dump(self.model, tmp_path)
+        os.replace(tmp_path, f"models/{name}.joblib")
         logger.info(f"Model saved to models/{name}.joblib")
\ No newline at end of file
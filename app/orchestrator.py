@@ -0,0 +1,305 @@
+import argparse
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable
+
+from app.config import UNDERSTAT_LEAGUE_MAP, load_settings, resolve_competitions
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Resource classes: network/IO-bound stages share a thread pool, CPU-bound
+# stages (model training) get their own processes
+NETWORK = "network"
+CPU = "cpu"
+
+OK = "ok"
+FAILED = "failed"
+SKIPPED = "skipped"
+BLOCKED = "blocked"
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One unit of pipeline work. CPU stages run in a separate process, so
+    their callable (and its return value) must be picklable: a module-level
+    function or a functools.partial of one. `when` is evaluated in the
+    parent with the return values of finished stages; False skips the stage.
+    """
+    name: str
+    run: Callable[[], Any]
+    depends_on: tuple[str, ...] = ()
+    resource: str = NETWORK
+    when: Callable[[dict[str, Any]], bool] | None = None
+
+
+@dataclass
+class StageResult:
+    name: str
+    resource: str
+    status: str
+    started: float = 0.0
+    finished: float = 0.0
+    error: str | None = None
+    output: Any = field(default=None, repr=False)
+
+    @property
+    def duration(self) -> float:
+        return max(self.finished - self.started, 0.0)
+
+
+def _timed(fn: Callable[[], Any]) -> tuple[Any, float, float]:
+    """Runs a stage in its worker and reports wall-clock start and end (comparable across processes)."""
+    started = time.time()
+    output = fn()
+    return output, started, time.time()
+
+
+class Orchestrator:
+    """
+    Runs stages as soon as their dependencies have finished, with network
+    stages on a thread pool and CPU stages on a process pool. A failed stage
+    blocks everything downstream of it; a skipped stage does not.
+    """
+    def __init__(
+        self,
+        stages: list[Stage],
+        network_workers: int = 4,
+        cpu_workers: int | None = None,
+        executors: dict[str, Executor] | None = None,
+    ):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Stage names must be unique")
+        self.order = self._topological_order()
+        self.network_workers = network_workers
+        self.cpu_workers = cpu_workers or min(4, os.cpu_count() or 1)
+        self._executors = executors
+
+    def _topological_order(self) -> list[str]:
+        for stage in self.stages.values():
+            if stage.resource not in (NETWORK, CPU):
+                raise ValueError(f"Stage {stage.name} has unknown resource class {stage.resource!r}")
+            missing = [dep for dep in stage.depends_on if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage {stage.name} depends on unknown stages: {', '.join(missing)}")
+
+        remaining = {name: set(stage.depends_on) for name, stage in self.stages.items()}
+        order = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Dependency cycle between stages: {', '.join(sorted(remaining))}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    def _default_executors(self) -> dict[str, Executor]:
+        # spawn: forked children would inherit the parent's pooled DB connections
+        return {
+            NETWORK: ThreadPoolExecutor(max_workers=self.network_workers, thread_name_prefix="stage"),
+            CPU: ProcessPoolExecutor(max_workers=self.cpu_workers, mp_context=multiprocessing.get_context("spawn")),
+        }
+
+    def run(self) -> dict[str, StageResult]:
+        executors = self._executors or self._default_executors()
+        results: dict[str, StageResult] = {}
+        outputs: dict[str, Any] = {}
+        running: dict[Future, tuple[str, float]] = {}
+        pending = list(self.order)
+
+        try:
+            while pending or running:
+                pending = self._dispatch(pending, results, outputs, running, executors)
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, submitted = running.pop(future)
+                    stage = self.stages[name]
+                    try:
+                        output, started, finished = future.result()
+                    except Exception as exc:
+                        logger.error("Stage %s failed: %s", name, exc)
+                        results[name] = StageResult(name, stage.resource, FAILED, submitted, time.time(), error=str(exc))
+                        continue
+                    outputs[name] = output
+                    results[name] = StageResult(name, stage.resource, OK, started, finished, output=output)
+                    logger.info("Stage %s finished in %.1fs", name, finished - started)
+        finally:
+            if self._executors is None:
+                for executor in executors.values():
+                    executor.shutdown(wait=True)
+
+        return {name: results[name] for name in self.order}
+
+    def _dispatch(self, pending, results, outputs, running, executors) -> list[str]:
+        """Submits every stage whose dependencies are settled; returns the ones still waiting."""
+        progressed = True
+        while progressed:
+            progressed = False
+            waiting = []
+            for name in pending:
+                stage = self.stages[name]
+                deps = [results.get(dep) for dep in stage.depends_on]
+                if any(dep is None for dep in deps):
+                    waiting.append(name)
+                    continue
+                progressed = True
+                now = time.time()
+                if any(dep.status in (FAILED, BLOCKED) for dep in deps):
+                    results[name] = StageResult(name, stage.resource, BLOCKED, now, now)
+                    logger.warning("Stage %s blocked by a failed dependency", name)
+                elif stage.when is not None and not stage.when(outputs):
+                    results[name] = StageResult(name, stage.resource, SKIPPED, now, now)
+                    logger.info("Stage %s skipped", name)
+                else:
+                    logger.info("Starting stage %s (%s)", name, stage.resource)
+                    running[executors[stage.resource].submit(_timed, stage.run)] = (name, now)
+            pending = waiting
+        return pending
+
+    def critical_path(self, results: dict[str, StageResult]) -> list[str]:
+        """
+        The chain of stages that determined the wall time: from the last stage
+        to finish, repeatedly step back to the dependency that finished last.
+        """
+        ran = {name: result for name, result in results.items() if result.status in (OK, FAILED)}
+        if not ran:
+            return []
+        current = max(ran, key=lambda name: ran[name].finished)
+        path = [current]
+        while True:
+            deps = [dep for dep in self.stages[current].depends_on if dep in ran]
+            if not deps:
+                break
+            current = max(deps, key=lambda name: ran[name].finished)
+            path.append(current)
+        return path[::-1]
+
+    def summary(self, results: dict[str, StageResult]) -> str:
+        ran = [result for result in results.values() if result.status in (OK, FAILED)]
+        lines = ["Stage timings:"]
+        for result in results.values():
+            lines.append(f"  {result.name:<20} {result.resource:<8} {result.status:<8} {result.duration:8.1f}s")
+        if ran:
+            wall = max(r.finished for r in ran) - min(r.started for r in ran)
+            busy = sum(r.duration for r in ran)
+            path = self.critical_path(results)
+            lines.append(f"Wall time {wall:.1f}s for {busy:.1f}s of stage time ({busy / wall if wall else 1:.1f}x)")
+            lines.append(
+                f"Critical path ({sum(results[name].duration for name in path):.1f}s): " + " -> ".join(path)
+            )
+        return "\n".join(lines)
+
+
+def _train(code: str) -> None:
+    from app.pipeline import run_training_pipeline
+    run_training_pipeline(competition_codes=code)
+
+
+def _export(days: int) -> None:
+    from app.web.export_site import export_site_data
+    export_site_data(days=days)
+
+
+def seed_stages(competitions: dict[str, int], refresh: bool = False) -> list[Stage]:
+    """Initial population: matches first, then the independent enrichment seeds, then one training per competition."""
+    from app.seeds.seed_competitions import seed_competitions
+    from app.seeds.seed_matches import seed_matches
+    from app.seeds.seed_players import seed_players
+    from app.seeds.seed_real_odds import CSV_SOURCES, run_seed as seed_odds
+    from app.seeds.seed_understat import seed_understat
+
+    stages = [
+        Stage("matches", partial(seed_matches, refresh=refresh)),
+        Stage("context", partial(seed_competitions, refresh=refresh), depends_on=("matches",)),
+        Stage("players", partial(seed_players, refresh=refresh), depends_on=("matches",)),
+        Stage("understat", seed_understat, depends_on=("matches",)),
+        Stage("odds", seed_odds, depends_on=("matches",)),
+    ]
+    for code, comp_id in competitions.items():
+        deps = ["matches"]
+        if code in UNDERSTAT_LEAGUE_MAP:
+            deps.append("understat")
+        if comp_id in CSV_SOURCES:
+            deps.append("odds")
+        stages.append(Stage(f"train:{code}", partial(_train, code), depends_on=tuple(deps), resource=CPU))
+    return stages
+
+
+def daily_stages(competitions: dict[str, int], days: int = 1, full_refresh: bool = False) -> list[Stage]:
+    """
+    Daily refresh: the match sync and the standings refresh run side by side;
+    a competition is retrained only if the sync changed its matches.
+    """
+    from app.seeds.seed_competitions import seed_competitions
+    from app.seeds.seed_matches import seed_matches
+    from app.seeds.sync_matches import sync_matches
+
+    if full_refresh:
+        # Reseed past the checkpoints; seed_matches returns None, so every competition counts as changed
+        matches = Stage("matches", partial(seed_matches, refresh=True))
+    else:
+        matches = Stage("matches", partial(sync_matches, competitions))
+
+    def changed(code: str) -> Callable[[dict[str, Any]], bool]:
+        return lambda outputs: outputs.get("matches") is None or code in outputs["matches"]
+
+    train = [
+        Stage(f"train:{code}", partial(_train, code), depends_on=("matches",), resource=CPU, when=changed(code))
+        for code in competitions
+    ]
+    return [
+        Stage("context", seed_competitions),
+        matches,
+        *train,
+        Stage("export", partial(_export, days), depends_on=("context", *(stage.name for stage in train))),
+    ]
+
+
+def run_stages(stages: list[Stage], network_workers: int = 4, cpu_workers: int | None = None) -> dict[str, StageResult]:
+    orchestrator = Orchestrator(stages, network_workers=network_workers, cpu_workers=cpu_workers)
+    results = orchestrator.run()
+    logger.info("%s", orchestrator.summary(results))
+    return results
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run the seed or daily refresh stages in dependency order.")
+    parser.add_argument("command", choices=["seed", "daily"])
+    parser.add_argument("--competitions", help="Comma-separated competition codes (for example: PL,PD,SA).")
+    parser.add_argument("--days", type=int, default=1, help="Days ahead to export (daily only).")
+    parser.add_argument("--refresh", action="store_true", help="Ignore seed checkpoints / reseed all matches.")
+    parser.add_argument("--network-workers", type=int, default=4, help="Threads for network-bound stages.")
+    parser.add_argument("--cpu-workers", type=int, default=None, help="Processes for CPU-bound stages.")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    competitions = resolve_competitions(args.competitions, load_settings())
+    if args.command == "seed":
+        stages = seed_stages(competitions, refresh=args.refresh)
+    else:
+        stages = daily_stages(competitions, days=args.days, full_refresh=args.refresh)
+
+    results = run_stages(stages, network_workers=args.network_workers, cpu_workers=args.cpu_workers)
+    if any(result.status in (FAILED, BLOCKED) for result in results.values()):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
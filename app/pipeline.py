@@ -2,7 +2,8 @@ import argparse
 import logging
 
 from app.config import load_settings, resolve_competitions
-from app.ml.predict_upcoming import UpcomingPredictor
+from app.data_service.db.cache.query_cache import query_cache
+from app.ml.prediction_service import get_prediction_service, log_predictions
 from app.ml.simulate_betting import BettingSimulator
 from app.ml.training import ModelTrainer
 from app.web.export_site import export_site_data
@@ -52,12 +53,12 @@ def run_training_pipeline(*, competition_codes: str | None = None, seasons: list
         success_count,
         fail_count,
     )
+    logger.info("Query cache: %s", query_cache.stats())
 
 
 def run_predictions_pipeline(days: int = 3):
     logger.info("Running Weekend Predictions...")
-    predictor = UpcomingPredictor()
-    predictor.predict(days=days)
+    log_predictions(get_prediction_service().predict_upcoming(days))
     logger.info("Done.")
 
 
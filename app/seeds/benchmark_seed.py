@@ -0,0 +1,85 @@
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SEED_TABLES = ["competitions", "teams", "matches", "players", "standings", "top_scorers"]
+
+def _configure(args, workdir: str):
+    """app.config reads the environment at import time, so this runs before importing anything from app."""
+    os.environ.update({
+        'DATABASE_URL': args.database_url or f"sqlite:///{os.path.join(workdir, 'benchmark.db')}",
+        'FOOTBALL_DATA_API_KEY': os.getenv('FOOTBALL_DATA_API_KEY') or 'stand-in',
+        'SOCCER_ANALYTICS_COMPETITIONS': args.competitions,
+        'SOCCER_ANALYTICS_TRAINING_SEASONS': args.seasons,
+        'SOCCER_ANALYTICS_FOOTBALL_DATA_RATE_LIMIT': str(args.client_rate_limit),
+        # Every call has to reach the server to measure anything
+        'SOCCER_ANALYTICS_HTTP_CACHE': '0',
+        'SOCCER_ANALYTICS_PAYLOAD_ARCHIVE': '0',
+        'SOCCER_ANALYTICS_REPLAY': '0',
+    })
+
+def _run_seeds(mode: str):
+    if mode == "async":
+        from app.seeds.seed_async import seed_all
+        asyncio.run(seed_all())
+        return
+    from app.seeds.seed_competitions import seed_competitions
+    from app.seeds.seed_matches import seed_matches
+    from app.seeds.seed_players import seed_players
+    seed_matches(refresh=True)
+    seed_competitions(refresh=True)
+    seed_players(refresh=True)
+
+def _row_counts() -> dict:
+    from sqlalchemy import text
+    from app.data_service.db_session import get_engine
+    with get_engine().connect() as conn:
+        return {table: conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar_one() for table in SEED_TABLES}
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Measure end-to-end seed throughput against the local stand-in API.")
+    parser.add_argument("--mode", choices=["sync", "async"], default="sync")
+    parser.add_argument("--competitions", default="PL,PD,BL1,SA,FL1")
+    parser.add_argument("--seasons", default="2021,2022,2023,2024")
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated server latency per request (seconds).")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=None, help="Server-side requests per minute (429 beyond).")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of requests answered with a random 429.")
+    parser.add_argument("--client-rate-limit", type=int, default=6000, help="Client rate limiter, requests per minute.")
+    parser.add_argument("--database-url", default=None, help="Seed into this database instead of a temporary SQLite file.")
+    return parser
+
+def _benchmark(args, server):
+    started = time.perf_counter()
+    _run_seeds(args.mode)
+    elapsed = time.perf_counter() - started
+
+    counts = _row_counts()
+    stats = server.api.stats()
+    rows = sum(counts.values())
+    logger.info(f"Seed benchmark ({args.mode}, {args.competitions} x {args.seasons}, latency {args.latency}s)")
+    logger.info(f"  rows: {counts}")
+    logger.info(f"  {rows:,} rows in {elapsed:.1f}s = {rows / elapsed:,.0f} rows/s")
+    logger.info(f"  {stats['requests']:,} requests = {stats['requests'] / elapsed:,.1f} req/s "
+                f"({stats['throttled']} throttled, {stats['not_found']} not found)")
+
+def main():
+    args = build_parser().parse_args()
+    with tempfile.TemporaryDirectory() as workdir:
+        _configure(args, workdir)
+        from app.data_service.fetch.stand_in_api import LocalFootballDataServer
+        server = LocalFootballDataServer(
+            latency=args.latency, jitter=args.jitter, rate_limit=args.rate_limit, throttle_rate=args.throttle_rate
+        )
+        with server:
+            os.environ['FOOTBALL_DATA_BASE_URL'] = server.base_url
+            _benchmark(args, server)
+
+if __name__ == "__main__":
+    main()
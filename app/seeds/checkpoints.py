@@ -0,0 +1,110 @@
+import argparse
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+
+from app.data_service.db.repositories.checkpoint_repository import SeedCheckpointRepository, Unit
+from app.data_service.fetch.fetcher import season_is_complete
+
+logger = logging.getLogger(__name__)
+
+# Units that can still change (season in progress, squads) are redone once their checkpoint is this old,
+# so a resumed run the same night skips them but the next nightly seed fetches them again
+CHECKPOINT_TTL = timedelta(hours=20)
+
+def checkpoint_is_fresh(unit: Unit, completed_at: datetime, now: datetime, today: Optional[date] = None) -> bool:
+    season = unit[1]
+    if season and season_is_complete(season, today):
+        return True
+    return now - completed_at < CHECKPOINT_TTL
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    return f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
+
+def refresh_requested(description: str) -> bool:
+    """Command line of the seed scripts: only --refresh, to ignore checkpoints."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--refresh", action="store_true", help="Ignore checkpoints and redo every unit.")
+    return parser.parse_args().refresh
+
+class SeedRun:
+    """
+    Checkpointed progress of one seed step over a known number of units
+    (competition/season or team). pending() tells whether a unit still has
+    to run; complete() records it, and fail() leaves it for the next run.
+    Each call logs progress with an ETA based on the units run so far.
+    """
+    def __init__(
+        self,
+        checkpoints: SeedCheckpointRepository,
+        step: str,
+        total: int,
+        refresh: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+        now: Optional[datetime] = None
+    ):
+        self.checkpoints = checkpoints
+        self.step = step
+        self.total = total
+        self.clock = clock
+        self.executed = 0
+        self.skipped = 0
+        self.failed = 0
+
+        if refresh:
+            cleared = checkpoints.clear(step)
+            logger.info(f"[{step}] Refresh requested, cleared {cleared} checkpoints.")
+            self._done = set()
+        else:
+            now = now or datetime.utcnow()
+            self._done = {
+                unit for unit, completed_at in checkpoints.completed(step).items()
+                if checkpoint_is_fresh(unit, completed_at, now)
+            }
+            if self._done:
+                logger.info(f"[{step}] Resuming: {len(self._done)} units already complete.")
+        self._started = clock()
+
+    def pending(self, competition: str = "", season: str = "", team_id: int = 0) -> bool:
+        if (competition, str(season), team_id) in self._done:
+            self.skipped += 1
+            return False
+        return True
+
+    def complete(self, competition: str = "", season: str = "", team_id: int = 0, rows: Optional[int] = None):
+        self.checkpoints.mark_done(self.step, (competition, str(season), team_id), rows)
+        self.executed += 1
+        self._report()
+
+    def fail(self, competition: str = "", season: str = "", team_id: int = 0):
+        self.failed += 1
+        logger.warning(f"[{self.step}] Unit {competition or team_id} {season} failed; it stays pending.")
+        self._report()
+
+    @property
+    def remaining(self) -> int:
+        return max(self.total - self.executed - self.skipped - self.failed, 0)
+
+    def eta(self) -> Optional[float]:
+        attempted = self.executed + self.failed
+        if not attempted:
+            return None
+        return (self.clock() - self._started) / attempted * self.remaining
+
+    def summary(self) -> str:
+        return (f"[{self.step}] {self.executed} done, {self.skipped} skipped (checkpointed), "
+                f"{self.failed} failed of {self.total} units in {format_duration(self.clock() - self._started)}")
+
+    def _report(self):
+        eta = self.eta()
+        logger.info(
+            f"[{self.step}] {self.total - self.remaining}/{self.total} units "
+            f"({self.skipped} skipped, {self.failed} failed) | "
+            f"elapsed {format_duration(self.clock() - self._started)} | "
+            f"ETA {format_duration(eta) if eta is not None else '?'}"
+        )
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from app.config import COMPETITIONS_MAP, SEASONS
+from app.data_service.fetch.async_fetcher import AsyncFootballDataClient
+from app.data_service.db_session import get_db_service
+from app.data_service.db.database.db_schema import Team
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+async def seed_all(max_concurrency: int = 8):
+    """
+    Runs the match, context and player seeds with concurrent requests.
+    Every phase issues its whole batch at once and lets the shared rate
+    limiter pace it; database writes happen between phases.
+    """
+    client = AsyncFootballDataClient(max_concurrency=max_concurrency)
+    codes = list(COMPETITIONS_MAP)
+    pairs = [(code, season) for code in codes for season in SEASONS]
+
+    logger.info(f"Fetching details and {len(pairs)} competition-seasons...")
+    details, season_data = await asyncio.gather(
+        client.fetch_competition_details(codes),
+        asyncio.gather(*(client.fetch_multiple_seasons(code, SEASONS) for code in codes)),
+    )
+
+    with get_db_service() as service:
+        for code, seasons in zip(codes, season_data):
+            comp_details = details.get(code)
+            if not comp_details:
+                logger.error(f"Could not fetch details for {code}. Skipping...")
+                continue
+            comp_details['id'] = COMPETITIONS_MAP[code]
+            service.competitions.save_competition(comp_details)
+
+            all_matches = [m for matches in seasons.values() for m in matches]
+            if all_matches:
+                result = service.matches.load_bulk(all_matches)
+                logger.info(f"Saved {result.rows} matches for {code} ({result.rows_per_second:,.0f} rows/s).")
+
+        team_ids = [team_id for (team_id,) in service.session.query(Team.id).all()]
+
+    logger.info(f"Fetching standings, scorers and {len(team_ids)} squads...")
+    standings, scorers, squads = await asyncio.gather(
+        client.fetch_standings(pairs),
+        client.fetch_top_scorers(pairs),
+        client.fetch_team_squads(team_ids),
+    )
+
+    with get_db_service() as service:
+        for code, season in pairs:
+            comp_id = COMPETITIONS_MAP[code]
+            table = standings.get((code, season))
+            if table and 'standings' in table:
+                service.competitions.save_standings(comp_id, season, table['standings'][0]['table'])
+            top = scorers.get((code, season))
+            if top and 'scorers' in top:
+                service.competitions.save_top_scorers(comp_id, season, top['scorers'])
+
+        found = {}
+        for team_id, team_data in squads.items():
+            if team_data and 'squad' in team_data:
+                found[team_id] = team_data['squad']
+            else:
+                logger.warning(f"   -> No squad data found for team {team_id}")
+        if found:
+            result = service.teams.load_squads(found)
+            logger.info(f"Saved {result.rows} players for {len(found)} teams.")
+
+    logger.info("Async seeding complete.")
+    logger.info(f"HTTP cache: {client.client.cache_stats()}")
+    logger.info(f"HTTP transport: {client.client.transport.stats()}")
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(seed_all())
+    except KeyboardInterrupt:
+        logger.warning("Interrupted.")
@@ -1,38 +1,51 @@
 import logging
-import time
 from app.config import COMPETITIONS_MAP, SEASONS
 from app.data_service.fetch.fetcher import FootballDataClient
 from app.data_service.db_session import get_db_service
+from app.seeds.checkpoints import SeedRun, refresh_requested
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def seed_competitions():
+def seed_competitions(refresh: bool = False):
     client = FootballDataClient()
     
     with get_db_service() as service:
+        run = SeedRun(service.checkpoints, "context", len(COMPETITIONS_MAP) * len(SEASONS), refresh)
         try:
             logger.info("Starting Context Seed (Standings & Scorers)...")
             
             for code, comp_id in COMPETITIONS_MAP.items():
                 for season in SEASONS:
+                    if not run.pending(code, season):
+                        continue
                     logger.info(f"Processing {code} - {season}...")
-                    
-                    standings = client.fetch_standings(code, season)
-                    if standings and 'standings' in standings:
-                        table = standings['standings'][0]['table']
-                        service.competitions.save_standings(comp_id, season, table)
-                    
-                    scorers = client.fetch_top_scorers(code, season)
-                    if scorers and 'scorers' in scorers:
-                        service.competitions.save_top_scorers(comp_id, season, scorers['scorers'])
 
-                    time.sleep(1) 
+                    # Only checkpointed once both writes happened; anything else is retried next run
+                    saved_standings = saved_scorers = False
+                    try:
+                        standings = client.fetch_standings(code, season)
+                        if standings and 'standings' in standings:
+                            table = standings['standings'][0]['table']
+                            saved_standings = service.competitions.save_standings(comp_id, season, table)
+
+                        scorers = client.fetch_top_scorers(code, season)
+                        if scorers and 'scorers' in scorers:
+                            saved_scorers = service.competitions.save_top_scorers(comp_id, season, scorers['scorers'])
+                    except Exception as e:
+                        logger.error(f"An error occurred for {code} {season}: {e}")
+
+                    if saved_standings and saved_scorers:
+                        run.complete(code, season)
+                    else:
+                        run.fail(code, season)
                     
         except KeyboardInterrupt:
             logger.warning("Interrupted.")
-        except Exception as e:
-            logger.error(f"An error occurred: {e}")
+
+    logger.info(run.summary())
+    logger.info(f"HTTP cache: {client.cache_stats()}")
+    logger.info(f"HTTP transport: {client.transport.stats()}")
 
 if __name__ == "__main__":
-    seed_competitions()
\ No newline at end of file
+    seed_competitions(refresh=refresh_requested("Seed standings and top scorers of the configured competitions."))
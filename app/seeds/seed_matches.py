@@ -1,20 +1,24 @@
 import logging
-import time
 from app.config import COMPETITIONS_MAP, SEASONS
 from app.data_service.fetch.fetcher import FootballDataClient
 from app.data_service.db_session import get_db_service
+from app.seeds.checkpoints import SeedRun, refresh_requested
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def seed_matches():
+def seed_matches(refresh: bool = False):
     client = FootballDataClient()
     total_saved = 0
     
     with get_db_service() as service:
         logger.info("Starting Match Seed Process...")
+        run = SeedRun(service.checkpoints, "matches", len(COMPETITIONS_MAP) * len(SEASONS), refresh)
 
         for code, comp_id in COMPETITIONS_MAP.items():
+            seasons = [season for season in SEASONS if run.pending(code, season)]
+            if not seasons:
+                continue
             logger.info(f"--- Processing {code} (ID: {comp_id}) ---")
 
             comp_details = client.fetch_competition_details(code)
@@ -23,26 +27,27 @@ def seed_matches():
                 service.competitions.save_competition(comp_details)
             else:
                 logger.error(f"Could not fetch details for {code}. Skipping...")
+                for season in seasons:
+                    run.fail(code, season)
                 continue
 
-            season_data = client.fetch_multiple_seasons(code, SEASONS)
-            
-            all_matches = []
-            for season, matches in season_data.items():
-                if matches:
-                    all_matches.extend(matches)
-
-            if not all_matches:
-                continue
-
-            try:
-                service.matches.save_bulk(all_matches)
-                total_saved += len(all_matches)
-                logger.info(f"Saved {len(all_matches)} matches for {code}.")
-            except Exception as e:
-                logger.error(f"Failed to save matches for {code}: {e}")
-
+            for season in seasons:
+                try:
+                    matches = client.fetch_multiple_seasons(code, [season]).get(season)
+                    if matches is None:
+                        run.fail(code, season)
+                        continue
+                    rows = service.matches.load_bulk(matches).rows if matches else 0
+                    total_saved += rows
+                    run.complete(code, season, rows=rows)
+                except Exception as e:
+                    logger.error(f"Failed to save matches for {code} {season}: {e}")
+                    run.fail(code, season)
+
+    logger.info(run.summary())
     logger.info(f"Seeding Complete. Total Matches Saved: {total_saved}")
+    logger.info(f"HTTP cache: {client.cache_stats()}")
+    logger.info(f"HTTP transport: {client.transport.stats()}")
 
 if __name__ == "__main__":
-    seed_matches()
\ No newline at end of file
+    seed_matches(refresh=refresh_requested("Seed matches of the configured competitions and seasons."))
@@ -1,37 +1,70 @@
 import logging
-import time
 from app.data_service.fetch.fetcher import FootballDataClient
 from app.data_service.db_session import get_db_service
 from app.data_service.db.database.db_schema import Team
+from app.seeds.checkpoints import SeedRun, refresh_requested
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def seed_players():
+# Squads are written (and checkpointed) in bulk loads of this many teams
+SQUAD_FLUSH_SIZE = 25
+
+def _flush(service, run: SeedRun, squads: dict):
+    """Writes the batched squads; a failed write leaves its teams pending and drops the batch."""
+    if not squads:
+        return
+    try:
+        result = service.teams.load_squads(squads)
+    except Exception as e:
+        logger.error(f"Failed to save squads of {len(squads)} teams: {e}")
+        for team_id in squads:
+            run.fail(team_id=team_id)
+        squads.clear()
+        return
+    logger.info(f"Saved {result.rows} players for {len(squads)} teams.")
+    for team_id, squad in squads.items():
+        run.complete(team_id=team_id, rows=len(squad))
+    squads.clear()
+
+def seed_players(refresh: bool = False):
     client = FootballDataClient()
     
     with get_db_service() as service:
+        logger.info("Querying database for teams...")
+        teams = service.session.query(Team).all()
+        run = SeedRun(service.checkpoints, "players", len(teams), refresh)
+        squads = {}
         try:
-            logger.info("Querying database for teams...")
-            teams = service.session.query(Team).all() 
             logger.info(f"Found {len(teams)} teams. Starting player fetch...")
             
             for i, team in enumerate(teams):
+                if not run.pending(team_id=team.id):
+                    continue
                 logger.info(f"[{i+1}/{len(teams)}] Processing {team.name} (ID: {team.id})...")
 
                 team_data = client.fetch_team_squad(team.id)
                 
                 if team_data and 'squad' in team_data:
-                    service.teams.save_squad(team.id, team_data['squad'])
+                    squads[team.id] = team_data['squad']
                 else:
                     logger.warning(f"   -> No squad data found for {team.name}")
+                    run.fail(team_id=team.id)
+
+                if len(squads) >= SQUAD_FLUSH_SIZE:
+                    _flush(service, run, squads)
 
-                time.sleep(0.5) 
-                
         except KeyboardInterrupt:
             logger.warning("Process interrupted by user.")
         except Exception as e:
             logger.error(f"An error occurred: {e}")
 
+        # Whatever was fetched, including before an interrupt, is still written
+        _flush(service, run, squads)
+
+    logger.info(run.summary())
+    logger.info(f"HTTP cache: {client.cache_stats()}")
+    logger.info(f"HTTP transport: {client.transport.stats()}")
+
 if __name__ == "__main__":
-    seed_players()
\ No newline at end of file
+    seed_players(refresh=refresh_requested("Seed squads of every stored team."))
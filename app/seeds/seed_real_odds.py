@@ -1,10 +1,18 @@
 import pandas as pd
-import requests
 import io
 
-import os
-from datetime import datetime, timedelta
 import logging
+from dataclasses import dataclass, field
+from typing import List, Optional
+from sqlalchemy import Column, DateTime, Float, Integer, MetaData, Table, and_, exists, func, or_, select, update
+from sqlalchemy.engine import Connection
+
+from app.data_service.db_session import get_db_service
+from app.data_service.db.bulk_loader import bulk_insert
+from app.data_service.db.cache.query_cache import MATCHES_SCOPE, competition_scope
+from app.data_service.db.database.db_schema import Match
+from app.data_service.fetch.http_transport import transport
+from app.data_service.team_identity import ODDS_CSV, TeamResolver
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
@@ -24,103 +32,165 @@ CSV_SOURCES = {
 SEASONS = ["2324", "2425"]
 BASE_URL = "https://www.football-data.co.uk/mmz4281/{}/{}.csv"
 
-def get_db_connection():
-    """Establishes a connection to the Docker PostgreSQL database."""
-    try:
-        conn = psycopg2.connect(
-            host=os.environ.get('DB_HOST', 'football_db'),
-            database=os.environ.get('DB_NAME', 'football'),
-            user=os.environ.get('DB_USER', 'postgres'),
-            password=os.environ.get('DB_PASSWORD', 'football')
-        )
-        return conn
-    except Exception as e:
-        logger.error(f"Error connecting to database: {e}")
-        raise e
+ODDS_COLUMNS = ['Date', 'HomeTeam', 'AwayTeam', 'B365H', 'B365D', 'B365A']
+
+# Session-local staging table; every connection gets its own copy, and
+# Postgres drops it with the transaction however the import ends
+_staging_metadata = MetaData()
+odds_staging = Table(
+    "odds_staging", _staging_metadata,
+    Column("competition_id", Integer, nullable=False),
+    Column("home_team_id", Integer, nullable=False),
+    Column("away_team_id", Integer, nullable=False),
+    Column("window_start", DateTime, nullable=False),
+    Column("window_end", DateTime, nullable=False),
+    Column("odds_home", Float),
+    Column("odds_draw", Float),
+    Column("odds_away", Float),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+@dataclass
+class OddsImportReport:
+    rows: int = 0
+    unresolved: int = 0
+    matched: int = 0
+    updated: int = 0
+    unresolved_names: List[str] = field(default_factory=list)
+
+    @property
+    def unmatched(self) -> int:
+        return self.rows - self.unresolved - self.matched
+
+def parse_odds_csv(content: bytes) -> Optional[pd.DataFrame]:
+    """Kickoff dates and B365 odds from a football-data.co.uk CSV, or None when the file has no B365 odds."""
+    df = pd.read_csv(io.StringIO(content.decode('utf-8', errors='ignore')))
+    if 'B365H' not in df.columns:
+        return None
+    df = df[ODDS_COLUMNS].dropna()
+    # Older files use two-digit years; parse both layouts in one pass each
+    dates = pd.to_datetime(df['Date'], format="%d/%m/%Y", errors='coerce')
+    dates = dates.fillna(pd.to_datetime(df['Date'], format="%d/%m/%y", errors='coerce'))
+    return df.assign(date=dates).dropna(subset=['date'])
 
-def normalize_name(name):
-    """Simple normalizer to help match team names"""
-    if not isinstance(name, str): return ""
-    return name.lower().replace(" fc", "").replace("cf ", "").replace(" ac", "").strip()
+def resolve_teams(frame: pd.DataFrame, resolver: TeamResolver, competition_id: int) -> pd.DataFrame:
+    candidates = resolver.competition_teams(competition_id)
+    ids = resolver.resolve_many(ODDS_CSV, pd.concat([frame['HomeTeam'], frame['AwayTeam']]).unique(), candidates)
+    return frame.assign(
+        competition_id=competition_id,
+        home_team_id=frame['HomeTeam'].map(ids),
+        away_team_id=frame['AwayTeam'].map(ids),
+    )
+
+def import_odds(conn: Connection, frame: pd.DataFrame) -> OddsImportReport:
+    """
+    Bulk loads resolved odds rows into a temporary staging table (COPY on
+    Postgres) and fills the missing odds of matching fixtures with one
+    UPDATE ... FROM, joined on competition, home/away team and a +/-1 day
+    kickoff window. The staging table is only dropped on success; after a
+    failure the caller's rollback discards it.
+    """
+    report = OddsImportReport(rows=len(frame))
+    unresolved = frame['home_team_id'].isna() | frame['away_team_id'].isna()
+    report.unresolved = int(unresolved.sum())
+    report.unresolved_names = sorted(
+        set(frame.loc[frame['home_team_id'].isna(), 'HomeTeam'])
+        | set(frame.loc[frame['away_team_id'].isna(), 'AwayTeam'])
+    )
+    resolved = frame[~unresolved]
+    if resolved.empty:
+        return report
+
+    day = pd.Timedelta(days=1)
+    staged = pd.DataFrame({
+        'competition_id': resolved['competition_id'].astype(int),
+        'home_team_id': resolved['home_team_id'].astype(int),
+        'away_team_id': resolved['away_team_id'].astype(int),
+        'window_start': resolved['date'] - day,
+        'window_end': resolved['date'] + 2 * day,
+        'odds_home': resolved['B365H'].astype(float),
+        'odds_draw': resolved['B365D'].astype(float),
+        'odds_away': resolved['B365A'].astype(float),
+    })
+    records = staged.to_dict('records')
+    for record in records:
+        record['window_start'] = record['window_start'].to_pydatetime()
+        record['window_end'] = record['window_end'].to_pydatetime()
+
+    join = and_(
+        Match.competition_id == odds_staging.c.competition_id,
+        Match.home_team_id == odds_staging.c.home_team_id,
+        Match.away_team_id == odds_staging.c.away_team_id,
+        Match.utc_date >= odds_staging.c.window_start,
+        Match.utc_date < odds_staging.c.window_end,
+    )
+    odds_staging.create(conn, checkfirst=True)
+    conn.execute(odds_staging.delete())
+    bulk_insert(conn, odds_staging, records)
+    report.matched = conn.execute(
+        select(func.count()).select_from(odds_staging).where(exists().where(join))
+    ).scalar_one()
+    report.updated = conn.execute(
+        update(Match.__table__)
+        .where(join, or_(Match.odds_home.is_(None), Match.odds_home == 0))
+        .values(
+            odds_home=odds_staging.c.odds_home,
+            odds_draw=odds_staging.c.odds_draw,
+            odds_away=odds_staging.c.odds_away,
+        )
+    ).rowcount
+    odds_staging.drop(conn)
+    return report
 
 def run_seed():
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
     logger.info("--- STARTING REAL ODDS UPDATE ---")
     
-    total_updated = 0
-    
-    for comp_id, code in CSV_SOURCES.items():
-        for season in SEASONS:
-            url = BASE_URL.format(season, code)
-            logger.info(f"Fetching {code} ({season}) from {url}...")
-            
-            try:
-                response = requests.get(url)
-                if response.status_code != 200:
-                    logger.warning(f"  Failed to download: {url}")
-                    continue
+    with get_db_service() as service:
+        resolver = TeamResolver(service.session)
+        frames = []
 
-                s = response.content
-                df = pd.read_csv(io.StringIO(s.decode('utf-8', errors='ignore')))
+        for comp_id, code in CSV_SOURCES.items():
+            for season in SEASONS:
+                url = BASE_URL.format(season, code)
+                logger.info(f"Fetching {code} ({season}) from {url}...")
                 
-                # Check for B365 odds
-                if 'B365H' not in df.columns:
+                try:
+                    response = transport.get(url)
+                    if response.status_code != 200:
+                        logger.warning(f"  Failed to download: {url}")
+                        continue
+                    frame = parse_odds_csv(response.content)
+                except Exception as e:
+                    logger.error(f"  Failed to process {code}-{season}: {e}")
+                    continue
+
+                if frame is None:
                     logger.warning(f"  No B365 odds found in {code}-{season}")
                     continue
+                frames.append(resolve_teams(frame, resolver, comp_id))
 
-                df = df[['Date', 'HomeTeam', 'AwayTeam', 'B365H', 'B365D', 'B365A']].dropna()
-                
-                matches_updated = 0
-                
-                for _, row in df.iterrows():
-                    # Parse Date
-                    try:
-                        date_str = row['Date']
-                        if len(date_str.split("/")[-1]) == 2:
-                            date_fmt = "%d/%m/%y"
-                        else:
-                            date_fmt = "%d/%m/%Y"
-                        date_obj = datetime.strptime(date_str, date_fmt).date()
-                    except Exception:
-                        continue
-                            
-                    home_clean = normalize_name(row['HomeTeam'])
-                    
-                    query = """
-                        UPDATE matches 
-                        SET odds_home = %s, odds_draw = %s, odds_away = %s
-                        WHERE date BETWEEN %s AND %s 
-                        AND competition_id = %s
-                        AND (LOWER(home_team) LIKE %s OR LOWER(home_team) LIKE %s)
-                        AND (odds_home = 0 OR odds_home IS NULL)
-                    """
-                    
-                    fuzzy_name = f"{home_clean[:4]}%" 
-                    exact_name = f"%{home_clean}%"
-                    
-                    cursor.execute(query, (
-                        row['B365H'], row['B365D'], row['B365A'],
-                        date_obj - timedelta(days=1), date_obj + timedelta(days=1),
-                        comp_id,
-                        exact_name, fuzzy_name
-                    ))
-                    
-                    if cursor.rowcount > 0:
-                        matches_updated += cursor.rowcount
-                
-                conn.commit()
-                logger.info(f"  Updated {matches_updated} matches for {code}-{season}")
-                total_updated += matches_updated
-                
-            except Exception as e:
-                logger.error(f"  Failed to process {code}-{season}: {e}")
+        if not frames:
+            logger.warning("No odds files could be loaded.")
+            return
+
+        odds = pd.concat(frames, ignore_index=True)
+        try:
+            report = import_odds(service.session.connection(), odds)
+            service.session.commit()
+        except Exception as e:
+            service.session.rollback()
+            logger.error(f"Odds import failed: {e}")
+            raise
+        service.cache.bump(MATCHES_SCOPE, *(competition_scope(c) for c in CSV_SOURCES))
 
     logger.info("-----------------------------------------------------")
-    logger.info(f"TOTAL MATCHES UPDATED WITH REAL ODDS: {total_updated}")
+    logger.info(f"CSV rows: {report.rows} | unresolved teams: {report.unresolved} | "
+                f"matched: {report.matched} | unmatched: {report.unmatched}")
+    logger.info(f"TOTAL MATCHES UPDATED WITH REAL ODDS: {report.updated}")
+    if report.unresolved_names:
+        logger.info(f"Unresolved team names: {', '.join(report.unresolved_names[:20])}")
     logger.info("-----------------------------------------------------")
-    conn.close()
 
 if __name__ == "__main__":
-    run_seed()
\ No newline at end of file
+    run_seed()
@@ -1,99 +1,171 @@
 import logging
-from datetime import datetime, timedelta
-from rapidfuzz import process
-from sqlalchemy import func
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import update
+from sqlalchemy.orm import Session
 
 from app.data_service.db_session import get_db_service
+from app.data_service.db.cache.query_cache import MATCHES_SCOPE, competition_scope
 from app.data_service.fetch.understat_client import UnderstatClient
+from app.data_service.team_identity import UNDERSTAT, TeamResolver
+from app.data_service.db.bulk_loader import bulk_insert
 from app.data_service.db.database.db_schema import Match, Team, PlayerForm, Player
 from app.config import COMPETITIONS_MAP, UNDERSTAT_LEAGUE_MAP, SEASONS
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@dataclass
+class XgReconciliation:
+    total: int = 0
+    matched: int = 0
+    unmatched: List[str] = field(default_factory=list)
+
+    @property
+    def match_rate(self) -> float:
+        return self.matched / self.total if self.total else 0.0
+
+def reconcile_xg(
+    session: Session,
+    competition_id: int,
+    season: str,
+    understat_matches: List[Dict],
+    resolver: Optional[TeamResolver] = None
+) -> XgReconciliation:
+    """
+    Joins Understat results to a competition-season's matches in memory and
+    writes home_xg/away_xg with one bulk UPDATE. Matches are indexed by
+    (date, home team, away team); a one-day offset is tolerated because
+    Understat lists local kickoff times while ours are UTC.
+    """
+    rows = session.query(Match.id, Match.utc_date, Match.home_team_id, Match.away_team_id).filter(
+        Match.competition_id == competition_id,
+        Match.season_year == str(season),
+        Match.status == 'FINISHED'
+    ).all()
+    index: Dict[Tuple[date, int, int], int] = {
+        (row.utc_date.date(), row.home_team_id, row.away_team_id): row.id for row in rows
+    }
+
+    team_ids = {row.home_team_id for row in rows} | {row.away_team_id for row in rows}
+    teams = dict(session.query(Team.id, Team.name).filter(Team.id.in_(team_ids)).all()) if team_ids else {}
+    results = [m for m in understat_matches if m.get('isResult', True) and m.get('xG')]
+    resolver = resolver or TeamResolver(session)
+    resolved = resolver.resolve_many(
+        UNDERSTAT, [m['h']['title'] for m in results] + [m['a']['title'] for m in results], candidates=teams
+    )
+
+    report = XgReconciliation(total=len(results))
+    updates = []
+    for m in results:
+        home_id, away_id = resolved.get(m['h']['title']), resolved.get(m['a']['title'])
+        kickoff = datetime.strptime(m['datetime'][:10], "%Y-%m-%d").date()
+        match_id = None
+        for offset in (0, -1, 1):
+            match_id = index.get((kickoff + timedelta(days=offset), home_id, away_id))
+            if match_id is not None:
+                break
+        if match_id is None:
+            report.unmatched.append(f"{m['datetime'][:10]} {m['h']['title']} vs {m['a']['title']}")
+            continue
+        updates.append({'id': match_id, 'home_xg': float(m['xG']['h']), 'away_xg': float(m['xG']['a'])})
+
+    if updates:
+        session.execute(update(Match), updates)
+        session.commit()
+    report.matched = len(updates)
+    return report
+
 class UnderstatSeeder:
     def __init__(self):
         self.client = UnderstatClient()
 
-    def sync_matches(self):
+    def sync_matches(self, competitions: Optional[Dict[str, int]] = None) -> Dict[Tuple[str, str], XgReconciliation]:
         """
         Fetches xG data from Understat and updates existing matches in DB.
         """
+        competitions = competitions or COMPETITIONS_MAP
+        reports = {}
         with get_db_service() as service:
-            session = service.session
-            
+            resolver = TeamResolver(service.session)
             for code, understat_name in UNDERSTAT_LEAGUE_MAP.items():
-                if code not in COMPETITIONS_MAP: 
+                if code not in competitions: 
                     continue
+                comp_id = competitions[code]
                 
                 for season in SEASONS:
                     logger.info(f"Syncing Match xG for {code} {season}...")
 
                     data = self.client.fetch_season_data(understat_name, season)
                     if not data: continue
-                    
-                    count = 0
-                    for m in data:                        
-                        m_date = m['datetime'][:10]
-                        db_match = session.query(Match).filter(
-                            func.to_char(Match.utc_date, 'YYYY-MM-DD') == m_date,
-                            Match.status == 'FINISHED',
-                        ).first()
-                        
-                        if db_match:
-                            db_match.home_xg = float(m['xG']['h'])
-                            db_match.away_xg = float(m['xG']['a'])
-                            count += 1
-                            
-                    session.commit()
-                    logger.info(f"  -> Updated {count} matches with xG.")
+
+                    report = reconcile_xg(service.session, comp_id, season, data, resolver)
+                    reports[(code, season)] = report
+                    if report.matched:
+                        service.cache.bump(MATCHES_SCOPE, competition_scope(comp_id))
+                    logger.info(
+                        f"  -> Updated {report.matched}/{report.total} matches with xG "
+                        f"({report.match_rate:.1%}); {len(report.unmatched)} unmatched."
+                    )
+                    for row in report.unmatched[:10]:
+                        logger.info(f"     unmatched: {row}")
+        return reports
 
     def sync_players(self):
         with get_db_service() as service:
             session = service.session
-            all_teams = session.query(Team).all()
-            team_map = {t.name: t.id for t in all_teams}
+            resolver = TeamResolver(session)
 
             for code, understat_name in UNDERSTAT_LEAGUE_MAP.items():
                 if code not in COMPETITIONS_MAP: continue
-                
+                candidates = resolver.competition_teams(COMPETITIONS_MAP[code])
+                if not candidates:
+                    logger.warning(f"No {code} teams in the database yet; skipping player sync.")
+                    continue
+
                 for season in SEASONS:
                     logger.info(f"Syncing Players for {code} {season}...")
                     players_data = self.client.fetch_player_season_data(understat_name, season)
+                    team_ids = resolver.resolve_many(
+                        UNDERSTAT, [p['team_title'] for p in players_data], candidates=candidates
+                    )
                     
                     form_entries = []
                     for p in players_data:
-                        match = process.extractOne(p['team_title'], team_map.keys())
-                        if match and match[1] > 80:
-                            t_id = team_map[match[0]]
-                        else:
+                        t_id = team_ids.get(p['team_title'])
+                        if t_id is None:
                             continue
                         
-                        entry = PlayerForm(
-                            period_label=f"{season}_season",
-                            team_id=t_id,
-                            goals=int(p['goals']),
-                            xg=float(p['xG']),
-                            assists=int(p['assists']),
-                            xa=float(p['xA']),
-                            shots=int(p['shots']),
-                            key_passes=int(p['key_passes']),
-                            yellow_cards=int(p['yellow_cards']),
-                            red_cards=int(p['red_cards']),
-                            npg=float(p['npg']),
-                            npxg=float(p['npxG']),
-                            xg_chain=float(p['xGChain']),
-                            xg_buildup=float(p['xGBuildup']),
-                            minutes_played=int(p['time']),
-                            games_played=int(p['games'])
-                        )
-                        form_entries.append(entry)
-
-                    session.query(PlayerForm).filter_by(period_label=f"{season}_season").delete()                    
-                    session.add_all(form_entries)
+                        form_entries.append({
+                            'period_label': f"{season}_season",
+                            'team_id': t_id,
+                            'goals': int(p['goals']),
+                            'xg': float(p['xG']),
+                            'assists': int(p['assists']),
+                            'xa': float(p['xA']),
+                            'shots': int(p['shots']),
+                            'key_passes': int(p['key_passes']),
+                            'yellow_cards': int(p['yellow_cards']),
+                            'red_cards': int(p['red_cards']),
+                            'npg': float(p['npg']),
+                            'npxg': float(p['npxG']),
+                            'xg_chain': float(p['xGChain']),
+                            'xg_buildup': float(p['xGBuildup']),
+                            'minutes_played': int(p['time']),
+                            'games_played': int(p['games'])
+                        })
+
+                    session.query(PlayerForm).filter_by(period_label=f"{season}_season").delete()
+                    bulk_insert(session.connection(), PlayerForm.__table__, form_entries)
                     session.commit()
 
-if __name__ == "__main__":
+def seed_understat():
     seeder = UnderstatSeeder()
     seeder.sync_matches()
-    seeder.sync_players()
\ No newline at end of file
+    seeder.sync_players()
+    if seeder.client.cache is not None:
+        logger.info(f"Understat page cache: {seeder.client.cache.stats()}")
+
+if __name__ == "__main__":
+    seed_understat()
\ No newline at end of file
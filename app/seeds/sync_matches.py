@@ -0,0 +1,113 @@
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+from app.config import COMPETITIONS_MAP, SEASONS
+from app.data_service.fetch.fetcher import FootballDataClient
+from app.data_service.db_session import get_db_service
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Finished matches this close to the high-water mark are re-checked for late corrections
+LOOKBACK_DAYS = 3
+# Upcoming fixtures are pulled this far ahead so reschedules are picked up
+LOOKAHEAD_DAYS = 7
+# Marks older than this (off-season, or a lapsed sync) refetch the seasons since the mark instead of a window
+MAX_WINDOW_AGE_DAYS = 30
+
+def sync_window(high_water_mark: datetime, today: date) -> Optional[Tuple[date, date]]:
+    """Date window covering everything since the mark, or None when the mark is too old for a window."""
+    if high_water_mark.date() < today - timedelta(days=MAX_WINDOW_AGE_DAYS):
+        return None
+    return high_water_mark.date() - timedelta(days=LOOKBACK_DAYS), today + timedelta(days=LOOKAHEAD_DAYS)
+
+def season_of(day: date) -> int:
+    """Start year of the season a day falls in; seasons turn over on July 1st."""
+    return day.year if day.month >= 7 else day.year - 1
+
+def seasons_since(high_water_mark: datetime, today: date) -> List[str]:
+    return [str(year) for year in range(season_of(high_water_mark.date()), season_of(today) + 1)]
+
+def latest_finished_kickoff(matches: List[Dict]) -> Optional[datetime]:
+    kickoffs = [
+        datetime.strptime(m['utcDate'], "%Y-%m-%dT%H:%M:%SZ")
+        for m in matches if m.get('status') == 'FINISHED'
+    ]
+    return max(kickoffs) if kickoffs else None
+
+def _fetch_since(client: FootballDataClient, code: str, high_water_mark: datetime, today: date) -> Optional[List[Dict]]:
+    window = sync_window(high_water_mark, today)
+    if window is not None:
+        logger.info(f"{code}: syncing {window[0]} -> {window[1]}...")
+        return client.fetch_matches_window(code, *window)
+
+    seasons = seasons_since(high_water_mark, today)
+    logger.info(f"{code}: last synced match is from {high_water_mark.date()}, fetching seasons {seasons}...")
+    return _fetch_seasons(client, code, seasons)
+
+def _fetch_seasons(client: FootballDataClient, code: str, seasons: List[str]) -> Optional[List[Dict]]:
+    """Matches of every season, or None if any season is missing so a partial fetch never moves the mark."""
+    fetched = client.fetch_multiple_seasons(code, seasons)
+    if len(fetched) < len(seasons):
+        return None
+    return [m for season in seasons for m in fetched[season]]
+
+def sync_matches(
+    competitions: Optional[Dict[str, int]] = None,
+    today: Optional[date] = None,
+    client: Optional[FootballDataClient] = None
+) -> Set[str]:
+    """
+    Incremental replacement for seed_matches. Competitions with a high-water
+    mark only fetch the recent date window; competitions never synced fall
+    back to the full SEASONS fetch once, and a mark older than
+    MAX_WINDOW_AGE_DAYS refetches every season since it. Only rows whose
+    status, score or odds changed are written. A failed fetch, including a
+    single missing season, leaves the mark where it was (or the competition
+    unsynced), so the next run covers the same span again.
+
+    Returns the codes of competitions whose matches changed.
+    """
+    client = client if client is not None else FootballDataClient()
+    competitions = competitions or COMPETITIONS_MAP
+    today = today or date.today()
+    affected: Set[str] = set()
+
+    with get_db_service() as service:
+        for code, comp_id in competitions.items():
+            high_water_mark = service.sync.high_water_mark(comp_id)
+            if high_water_mark is None:
+                logger.info(f"{code}: no sync state, fetching seasons {SEASONS}...")
+                if service.competitions.get_by_code(code) is None:
+                    details = client.fetch_competition_details(code)
+                    if not details:
+                        logger.error(f"Could not fetch details for {code}. Skipping...")
+                        continue
+                    details['id'] = comp_id
+                    service.competitions.save_competition(details)
+                matches = _fetch_seasons(client, code, SEASONS)
+            else:
+                matches = _fetch_since(client, code, high_water_mark, today)
+
+            if matches is None:
+                logger.error(f"{code}: fetch failed; keeping the high-water mark for the next run.")
+                continue
+
+            try:
+                changed = service.matches.upsert_changed(matches)
+            except Exception as e:
+                logger.error(f"Failed to sync matches for {code}: {e}")
+                continue
+
+            service.sync.mark_synced(comp_id, latest_finished_kickoff(matches))
+            if changed:
+                affected.add(code)
+            logger.info(f"{code}: {sum(changed.values())} changed of {len(matches)} fetched.")
+
+    logger.info(f"Sync complete. Affected competitions: {sorted(affected) or 'none'}")
+    logger.info(f"HTTP cache: {client.cache_stats()}")
+    logger.info(f"HTTP transport: {client.transport.stats()}")
+    return affected
+
+if __name__ == "__main__":
+    sync_matches()
@@ -1,30 +1,33 @@
 import logging
 
-from app.pipeline import run_training_pipeline
-from app.seeds.seed_competitions import seed_competitions
-from app.seeds.seed_matches import seed_matches
-from app.web.export_site import export_site_data
+from app.config import load_settings, resolve_competitions
+from app.orchestrator import BLOCKED, FAILED, SKIPPED, daily_stages, run_stages
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
-def run_daily_update(days: int = 1) -> None:
-    logger.info("Seeding latest competitions...")
-    seed_competitions()
+def run_daily_update(days: int = 1, full_refresh: bool = False) -> None:
+    """
+    Refreshes standings and matches side by side, retrains the competitions
+    whose matches changed (in parallel processes) and exports the site data.
+    """
+    competitions = resolve_competitions(None, load_settings())
+    mode = "Seeding all matches" if full_refresh else "Syncing recent matches"
+    logger.info(f"{mode} and refreshing standings...")
 
-    logger.info("Seeding latest matches...")
-    seed_matches()
+    results = run_stages(daily_stages(competitions, days=days, full_refresh=full_refresh))
 
-    logger.info("Training models...")
-    run_training_pipeline()
-
-    logger.info("Exporting static site data...")
-    export_site_data(days=days)
+    training = [result for name, result in results.items() if name.startswith("train:")]
+    if training and all(result.status == SKIPPED for result in training):
+        logger.info("No match changes since the last sync; kept existing models.")
 
+    failed = [name for name, result in results.items() if result.status in (FAILED, BLOCKED)]
+    if failed:
+        raise RuntimeError(f"Daily update stages did not complete: {', '.join(failed)}")
     logger.info("Daily update completed.")
 
 
 if __name__ == "__main__":
-    run_daily_update()
\ No newline at end of file
+    run_daily_update()
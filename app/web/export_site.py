@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -11,6 +12,8 @@ from app.web.release_governance import build_release_governance
 from app.web.scores import fetch_daily_scores
 from app.web.site_paths import data_dir, repo_root
 
+logger = logging.getLogger(__name__)
+
 
 def _write_json(path: Path, payload: dict[str, Any]) -> None:
     path.write_text(json.dumps(payload, indent=2, sort_keys=True))
@@ -54,6 +57,25 @@ def _generate_predictions(models_dir: Path, days: int) -> list[dict[str, Any]]:
     return generate_predictions(models_dir=models_dir, days=days)
 
 
+def _daily_scores() -> list[dict[str, Any]]:
+    """Scores with team ids from the shared resolver; without a database they are exported unresolved."""
+    from app.data_service.db_session import get_db_service
+    from app.data_service.team_identity import TeamResolver
+
+    try:
+        with get_db_service() as service:
+            return fetch_daily_scores(resolver=TeamResolver(service.session))
+    except Exception as e:
+        logger.warning(f"Team resolver unavailable, exporting scores without team ids: {e}")
+        return fetch_daily_scores()
+
+
+def _prediction_cache_stats(models_dir: Path) -> dict[str, Any] | None:
+    from app.ml.prediction_service import prediction_cache_stats
+
+    return prediction_cache_stats(models_dir)
+
+
 def export_site_data(days: int = 1) -> dict[str, Path]:
     data_path = data_dir()
     data_path.mkdir(parents=True, exist_ok=True)
@@ -75,13 +97,17 @@ def export_site_data(days: int = 1) -> dict[str, Path]:
 
     scores_payload = {
         "generated_at": _timestamp(),
-        "scores": fetch_daily_scores(),
+        "scores": _daily_scores(),
     }
     scores_path = data_path / "scores.json"
     _write_json(scores_path, scores_payload)
 
     operations_path = data_path / "operations.json"
-    operations_summary = build_operations_summary(predictions, scores_payload["scores"])
+    operations_summary = build_operations_summary(
+        predictions,
+        scores_payload["scores"],
+        cache_stats=_prediction_cache_stats(models_dir),
+    )
     _write_json(operations_path, operations_summary)
 
     release_path = data_path / "release.json"
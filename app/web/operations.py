@@ -12,6 +12,7 @@ def build_operations_summary(
     generated_at: str | None = None,
     high_confidence_threshold: float = 0.6,
     low_confidence_threshold: float = 0.5,
+    cache_stats: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     generated = generated_at or datetime.now(UTC).isoformat()
     confidence_values = [
@@ -36,7 +37,7 @@ def build_operations_summary(
         competition_count=len(competitions),
     )
 
-    return {
+    summary = {
         "generated_at": generated,
         "status": "healthy" if not alerts else "attention",
         "prediction_count": len(predictions),
@@ -55,6 +56,24 @@ def build_operations_summary(
             "low_confidence": low_confidence_threshold,
         },
     }
+    if cache_stats is not None:
+        summary["prediction_cache"] = _cache_summary(cache_stats)
+    return summary
+
+
+def _cache_summary(stats: dict[str, Any]) -> dict[str, Any]:
+    hits = int(stats.get("hits") or 0)
+    misses = int(stats.get("misses") or 0)
+    return {
+        "enabled": bool(stats.get("enabled", True)),
+        "lookups": hits + misses,
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": _round_or_none(hits / (hits + misses) if hits + misses else None),
+        "local_hit_ratio": _round_or_none(stats.get("local_hit_ratio")),
+        "redis_hit_ratio": _round_or_none(stats.get("redis_hit_ratio")),
+        "degraded_calls": int(stats.get("degraded_calls") or 0),
+    }
 
 
 def _build_alerts(
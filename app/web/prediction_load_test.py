@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from urllib.parse import urlsplit
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _fixture(rng: random.Random, competition: str, team_ids: list[int]) -> dict:
+    home, away = rng.sample(team_ids, 2)
+    return {
+        "id": rng.randint(1, 10**9),
+        "competition": competition,
+        "utcDate": "2030-01-05T15:00:00Z",
+        "homeTeam": {"id": home, "name": f"Team {home}"},
+        "awayTeam": {"id": away, "name": f"Team {away}"},
+    }
+
+
+async def _request(reader, writer, host: str, path: str, body: bytes) -> int:
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def run_load_test(url: str, requests: int, concurrency: int, batch: int,
+                        competitions: list[str], team_ids: list[int], seed: int = 0) -> dict:
+    """Keeps `concurrency` keep-alive connections busy until `requests` POSTs have completed."""
+    parts = urlsplit(url)
+    rng = random.Random(seed)
+    latencies: list[float] = []
+    errors = 0
+    issued = 0
+
+    async def worker():
+        nonlocal errors, issued
+        reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+        try:
+            while issued < requests:
+                issued += 1
+                fixtures = [_fixture(rng, rng.choice(competitions), team_ids) for _ in range(batch)]
+                body = json.dumps({"fixtures": fixtures} if batch > 1 else fixtures[0]).encode("utf-8")
+                started = time.perf_counter()
+                status = await _request(reader, writer, parts.netloc, parts.path or "/predict", body)
+                latencies.append(time.perf_counter() - started)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "fixtures": len(latencies) * batch,
+        "seconds": round(elapsed, 2),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(max(latencies, default=0.0) * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the prediction server and report latency percentiles.")
+    parser.add_argument("--url", default="http://127.0.0.1:8765/predict")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--batch", type=int, default=1, help="Fixtures per request.")
+    parser.add_argument("--competitions", default="PL", help="Comma-separated competition codes with models.")
+    parser.add_argument("--teams", default="57,61,64,65,66,73,76,354,397,402",
+                        help="Comma-separated team ids to draw fixtures from.")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load_test(
+        args.url, args.requests, args.concurrency, args.batch,
+        [code.strip().upper() for code in args.competitions.split(",") if code.strip()],
+        [int(team_id) for team_id in args.teams.split(",")],
+    ))
+    print(
+        f"{report['requests']} requests ({report['fixtures']} fixtures, {report['errors']} errors) "
+        f"in {report['seconds']}s: {report['rps']} req/s, "
+        f"p50 {report['p50_ms']} ms, p99 {report['p99_ms']} ms, max {report['max_ms']} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable
+
+from app.ml.prediction_service import MODELS_DIR, FixturePrediction, PredictionService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+# A batch is scored once it holds this many fixtures or its oldest request has waited this long
+MAX_BATCH = 256
+MAX_WAIT = 0.005
+# How often models/ is checked for new or retrained models (seconds)
+RELOAD_INTERVAL = 2.0
+MAX_BODY = 1024 * 1024
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+
+class MicroBatcher:
+    """
+    Collects fixtures submitted concurrently for the same competition and
+    scores them with one predict call, off the event loop. Each submitter
+    gets back the predictions for its own fixtures, in order.
+    """
+    def __init__(
+        self,
+        predict: Callable[[dict[str, list[dict]]], list[FixturePrediction]],
+        max_batch: int = MAX_BATCH,
+        max_wait: float = MAX_WAIT,
+    ):
+        self.predict = predict
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.fixtures = 0
+        self._pending: dict[str, list[tuple[list[dict], asyncio.Future]]] = {}
+        self._sizes: dict[str, int] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._running: set[asyncio.Task] = set()
+
+    async def submit(self, code: str, fixtures: list[dict]) -> list[FixturePrediction]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(code, []).append((fixtures, future))
+        self._sizes[code] = self._sizes.get(code, 0) + len(fixtures)
+        if self._sizes[code] >= self.max_batch:
+            self._flush(code)
+        elif code not in self._timers:
+            self._timers[code] = loop.call_later(self.max_wait, self._flush, code)
+        return await future
+
+    def stats(self) -> dict[str, Any]:
+        return {"batches": self.batches, "fixtures": self.fixtures,
+                "mean_batch": round(self.fixtures / self.batches, 1) if self.batches else 0.0}
+
+    def _flush(self, code: str):
+        timer = self._timers.pop(code, None)
+        if timer is not None:
+            timer.cancel()
+        items = self._pending.pop(code, [])
+        self._sizes.pop(code, None)
+        if items:
+            task = asyncio.get_running_loop().create_task(self._run(code, items))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, code: str, items: list[tuple[list[dict], asyncio.Future]]):
+        fixtures = [fixture for batch, _ in items for fixture in batch]
+        try:
+            predictions = await asyncio.to_thread(self.predict, {code: fixtures})
+            if len(predictions) != len(fixtures):
+                raise LookupError(f"No model for competition {code}")
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.fixtures += len(fixtures)
+        offset = 0
+        for batch, future in items:
+            if not future.done():
+                future.set_result(predictions[offset:offset + len(batch)])
+            offset += len(batch)
+
+
+def _model_files(models_dir: Path) -> dict[str, float]:
+    try:
+        return {path.name: path.stat().st_mtime for path in models_dir.glob("*_model.joblib")}
+    except FileNotFoundError:
+        return {}
+
+
+def _competition(fixture: dict[str, Any]) -> str | None:
+    competition = fixture.get("competition")
+    if isinstance(competition, dict):
+        competition = competition.get("code")
+    return competition.upper() if isinstance(competition, str) else None
+
+
+class PredictionServer:
+    """
+    Long-running localhost HTTP/1.1 service over a warm PredictionService.
+
+    POST /predict takes one fixture (a football-data match payload whose
+    "competition" is a code or an object with "code") or {"fixtures": [...]},
+    and answers with the export records. GET /health reports loaded models
+    and batching stats. models/ is polled so retrained models are loaded in
+    the background instead of on the next request.
+    """
+    def __init__(
+        self,
+        service: PredictionService,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        max_batch: int = MAX_BATCH,
+        max_wait: float = MAX_WAIT,
+        reload_interval: float = RELOAD_INTERVAL,
+    ):
+        self.service = service
+        self.host = host
+        self.port = port
+        self.reload_interval = reload_interval
+        self.batcher = MicroBatcher(service.predict_fixtures, max_batch, max_wait)
+        self.requests = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._watcher: asyncio.Task | None = None
+        self._model_files: dict[str, float] = {}
+
+    async def start(self) -> "PredictionServer":
+        await asyncio.to_thread(self._warm)
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._watcher = asyncio.get_running_loop().create_task(self._watch_models())
+        logger.info(f"Prediction server on http://{self.host}:{self.port} "
+                    f"with models for {', '.join(self.service.available_competitions()) or 'no competitions'}")
+        return self
+
+    async def stop(self):
+        if self._watcher is not None:
+            self._watcher.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    def _warm(self) -> list[str]:
+        """Loads new or changed models and rebuilds their team states; returns the codes loaded."""
+        files = _model_files(self.service.models_dir)
+        loaded = []
+        for code in self.service.available_competitions():
+            name = self.service.model_path(code).name
+            if files.get(name) != self._model_files.get(name):
+                self.service.invalidate(code)
+            self.service.model(code)
+            self.service.team_states(code)
+            loaded.append(code)
+        self._model_files = files
+        return loaded
+
+    async def _watch_models(self):
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            if _model_files(self.service.models_dir) == self._model_files:
+                continue
+            try:
+                loaded = await asyncio.to_thread(self._warm)
+                logger.info(f"Models changed; loaded {', '.join(loaded) or 'none'}")
+            except Exception as e:
+                # Keep the old snapshot so the next poll retries
+                logger.warning(f"Model reload failed, retrying: {e}")
+
+    def health(self) -> dict[str, Any]:
+        return {"status": "ok", "models": self.service.available_competitions(),
+                "requests": self.requests, **self.batcher.stats()}
+
+    async def predict(self, body: Any) -> tuple[int, Any]:
+        batch = isinstance(body, dict) and "fixtures" in body
+        fixtures = body["fixtures"] if batch else [body]
+        if not isinstance(fixtures, list) or not all(isinstance(f, dict) for f in fixtures):
+            return 400, {"error": "Expected a fixture object or {\"fixtures\": [...]}"}
+
+        results: list[Any] = [None] * len(fixtures)
+        groups: dict[str, list[int]] = {}
+        for idx, fixture in enumerate(fixtures):
+            code = _competition(fixture)
+            if code is None:
+                results[idx] = {"error": "Missing competition code"}
+            else:
+                groups.setdefault(code, []).append(idx)
+
+        async def score(code: str, indexes: list[int]):
+            try:
+                predictions = await self.batcher.submit(code, [fixtures[i] for i in indexes])
+            except LookupError as e:
+                for i in indexes:
+                    results[i] = {"error": str(e)}
+                return
+            for i, prediction in zip(indexes, predictions):
+                results[i] = {"match_id": prediction.fixture.get("id"), **prediction.to_record()}
+
+        await asyncio.gather(*(score(code, indexes) for code, indexes in groups.items()))
+        if batch:
+            return 200, {"predictions": results}
+        return (422 if "error" in results[0] else 200), results[0]
+
+    async def _route(self, method: str, path: str, body: bytes) -> tuple[int, Any]:
+        if path == "/health":
+            return (200, self.health()) if method == "GET" else (405, {"error": "Use GET"})
+        if path != "/predict":
+            return 404, {"error": f"Unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": "Use POST"}
+        try:
+            payload = json.loads(body or b"null")
+        except json.JSONDecodeError as e:
+            return 400, {"error": f"Invalid JSON: {e}"}
+        return await self.predict(payload)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY:
+                    status, payload = 413, {"error": f"Body larger than {MAX_BODY} bytes"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    self.requests += 1
+                    try:
+                        status, payload = await self._route(method, path.split("?", 1)[0], body)
+                    except Exception as e:
+                        logger.error(f"{method} {path} failed: {e}")
+                        status, payload = 500, {"error": str(e)}
+                    keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+                data = json.dumps(payload).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Serve warm, micro-batched model predictions on localhost.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--models-dir", default=str(MODELS_DIR))
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH, help="Fixtures per predict call.")
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT * 1000, help="Longest wait to fill a batch.")
+    parser.add_argument("--reload-interval", type=float, default=RELOAD_INTERVAL, help="Seconds between models/ checks.")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    server = PredictionServer(
+        PredictionService(args.models_dir), host=args.host, port=args.port, max_batch=args.max_batch,
+        max_wait=args.max_wait_ms / 1000, reload_interval=args.reload_interval,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        logger.info(f"Stopped. {server.health()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,32 @@
 from __future__ import annotations
 
+import logging
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import requests
 
+from app.config import COMPETITIONS_MAP, SPORTSDB_LEAGUE_MAP
+from app.data_service.fetch.http_transport import transport
 
-def fetch_daily_scores(date: datetime | None = None) -> list[dict[str, Any]]:
+if TYPE_CHECKING:
+    from app.data_service.team_identity import TeamResolver
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_daily_scores(date: datetime | None = None, resolver: TeamResolver | None = None) -> list[dict[str, Any]]:
+    """
+    TheSportsDB's soccer results for a day. With a resolver, each row gains
+    home_team_id/away_team_id: events of a known league are matched against
+    that competition's teams, the rest only by unambiguous exact name.
+    """
     target_date = (date or datetime.utcnow()).strftime("%Y-%m-%d")
     url = "https://www.thesportsdb.com/api/v1/json/3/eventsday.php"
     params = {"d": target_date, "s": "Soccer"}
 
     try:
-        response = requests.get(url, params=params, timeout=15)
+        response = transport.get(url, params=params, timeout=15)
         response.raise_for_status()
         payload = response.json()
     except (requests.RequestException, ValueError):
@@ -32,4 +46,29 @@ def fetch_daily_scores(date: datetime | None = None) -> list[dict[str, Any]]:
                 "date": event.get("dateEvent"),
             }
         )
-    return results
\ No newline at end of file
+
+    if resolver is not None and results:
+        try:
+            _resolve_teams(results, [event.get("idLeague") for event in events], resolver)
+        except Exception as e:
+            logger.warning(f"Could not resolve score teams: {e}")
+    return results
+
+
+def _resolve_teams(results: list[dict[str, Any]], league_ids: list[Any], resolver: TeamResolver) -> None:
+    from app.data_service.team_identity import SPORTSDB
+
+    competitions = {
+        league_id: COMPETITIONS_MAP[code] for code, league_id in SPORTSDB_LEAGUE_MAP.items() if code in COMPETITIONS_MAP
+    }
+    by_league: dict[int | None, list[dict[str, Any]]] = {}
+    for row, league_id in zip(results, league_ids):
+        by_league.setdefault(competitions.get(str(league_id)), []).append(row)
+
+    for competition_id, rows in by_league.items():
+        candidates = resolver.competition_teams(competition_id) if competition_id is not None else None
+        names = [row["home_team"] for row in rows] + [row["away_team"] for row in rows]
+        team_ids = resolver.resolve_many(SPORTSDB, names, candidates or None)
+        for row in rows:
+            row["home_team_id"] = team_ids.get(row["home_team"])
+            row["away_team_id"] = team_ids.get(row["away_team"])
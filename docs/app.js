@@ -201,6 +201,11 @@ function renderOperationsSummary(summary) {
       <span>Run confidence</span>
       <strong>${formatConfidence(summary?.average_confidence)}</strong>
     </div>
+    ${summary?.prediction_cache ? `
+    <div class="operation-stat">
+      <span>Prediction cache hits</span>
+      <strong>${formatConfidence(summary.prediction_cache.hit_ratio)}</strong>
+    </div>` : ""}
   `;
 
   if (coverage.length > 0) {
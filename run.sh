@@ -23,17 +23,7 @@ ${DOCKER_COMPOSE} up --build -d
 echo "Waiting for Database to initialize..."
 sleep 10
 
-echo "Running Seed Matches..."
-docker exec -it football_app python3 -m app.seeds.seed_matches > ./log/match_gather.log
-
-echo "Running Seed Players..."
-docker exec -it football_app python3 -m app.seeds.seed_players > ./log/player_gather.log
-
-echo "Running Seed Competitions..."
-docker exec -it football_app python3 -m app.seeds.seed_competitions > ./log/context_gather.log
-
-echo "Training Models..."
-
-docker exec -it football_app python3 -m app.pipeline train > ./log/ml.log
+echo "Running seeds and training (dependency-ordered, in parallel where possible)..."
+docker exec -it football_app python3 -m app.orchestrator seed > ./log/pipeline.log
 
 echo "Pipeline Complete."
\ No newline at end of file
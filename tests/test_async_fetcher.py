@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+
+from app.data_service.fetch.async_fetcher import AsyncFootballDataClient
+
+
+class _WindowLimiter:
+    """In-memory stand-in for RedisRateLimiter with the same interface."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.stamps: list[float] = []
+
+    def try_acquire(self) -> float:
+        now = time.monotonic()
+        live = [stamp for stamp in self.stamps if stamp > now - self.window]
+        if len(live) < self.limit:
+            self.stamps.append(now)
+            return 0.0
+        return live[0] + self.window - now
+
+
+class _FakeClient:
+    replay = False
+
+    def __init__(self, limiter: _WindowLimiter, latency: float = 0.05) -> None:
+        self.limiter = limiter
+        self.latency = latency
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def cached(self, endpoint: str, params: dict | None = None) -> None:
+        return None
+
+    def _request(self, endpoint: str, params: dict | None = None) -> dict:
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        if endpoint.endswith("/matches"):
+            return {"matches": [
+                {"status": "FINISHED", "score": {"fullTime": {"home": 1, "away": 0}}},
+                {"status": "SCHEDULED", "score": {"fullTime": {"home": None, "away": None}}},
+            ]}
+        return {"endpoint": endpoint, "params": params}
+
+
+class TestAsyncFootballDataClient(unittest.TestCase):
+    def test_requests_overlap_up_to_the_concurrency_limit(self) -> None:
+        fake = _FakeClient(_WindowLimiter(limit=100, window=60))
+        client = AsyncFootballDataClient(client=fake, max_concurrency=4)
+
+        started = time.monotonic()
+        squads = asyncio.run(client.fetch_team_squads(list(range(12))))
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(list(squads), list(range(12)))
+        self.assertEqual(squads[3]["endpoint"], "teams/3")
+        self.assertEqual(fake.peak_in_flight, 4)
+        self.assertLess(elapsed, 12 * fake.latency)
+
+    def test_rate_window_is_never_exceeded(self) -> None:
+        limiter = _WindowLimiter(limit=3, window=0.2)
+        client = AsyncFootballDataClient(client=_FakeClient(limiter, latency=0.0), max_concurrency=8)
+        pairs = [("PL", str(season)) for season in range(2015, 2024)]
+
+        standings = asyncio.run(client.fetch_standings(pairs))
+
+        self.assertEqual(len(standings), 9)
+        stamps = sorted(limiter.stamps)
+        for idx in range(len(stamps) - limiter.limit):
+            self.assertGreaterEqual(stamps[idx + limiter.limit] - stamps[idx], limiter.window - 0.01)
+
+    def test_season_bulk_helper_keeps_finished_matches_only(self) -> None:
+        client = AsyncFootballDataClient(client=_FakeClient(_WindowLimiter(limit=100, window=60)))
+
+        seasons = asyncio.run(client.fetch_multiple_seasons("PL", ["2022", "2023"]))
+
+        self.assertEqual(sorted(seasons), ["2022", "2023"])
+        self.assertEqual(len(seasons["2023"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from app.data_service.db.cache import cache_management
+
+try:
+    import fakeredis
+except Exception:  # pragma: no cover - optional test dependency
+    fakeredis = None  # type: ignore[assignment]
+
+
+class TestSerializer(unittest.TestCase):
+    def test_small_payloads_stay_uncompressed(self) -> None:
+        data = cache_management.serialize({"id": 66, "name": "North FC"})
+
+        self.assertEqual(data[:1], b"P")
+        self.assertEqual(cache_management.deserialize(data), {"id": 66, "name": "North FC"})
+
+    def test_large_payloads_are_compressed(self) -> None:
+        rows = [{"teamID": idx % 20, "rolling_xG": 1.25} for idx in range(2000)]
+        data = cache_management.serialize(rows)
+
+        self.assertEqual(data[:1], b"Z")
+        self.assertLess(len(data), len(cache_management.serialize(rows, compress_threshold=10**9)))
+        self.assertEqual(cache_management.deserialize(data), rows)
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class TestBatchedCacheApi(unittest.TestCase):
+    def setUp(self) -> None:
+        server = fakeredis.FakeServer()
+        self.text_client = fakeredis.FakeRedis(server=server, decode_responses=True)
+        self.binary_client = fakeredis.FakeRedis(server=server)
+        self.patches = [
+            patch.object(cache_management, "get_redis_client", return_value=self.text_client),
+            patch.object(cache_management, "get_binary_redis_client", return_value=self.binary_client),
+            patch.dict(cache_management._health, {"ok": True, "checked_at": float("-inf")}),
+        ]
+        for active in self.patches:
+            active.start()
+
+    def tearDown(self) -> None:
+        for active in reversed(self.patches):
+            active.stop()
+
+    def test_set_many_and_get_many_round_trip(self) -> None:
+        values = {f"team:{idx}": {"id": idx} for idx in range(50)}
+
+        self.assertEqual(cache_management.set_many(values, ttl=60), 50)
+        found = cache_management.get_many(list(values) + ["team:missing"])
+
+        self.assertEqual(found, values)
+        self.assertEqual(self.binary_client.ttl("team:0"), 60)
+
+    def test_clear_all_pattern_deletes_in_scan_batches(self) -> None:
+        for idx in range(25):
+            self.text_client.set(f"query:matches:{idx}", 1)
+        self.text_client.set("query:teams:1", 1)
+
+        with patch.object(self.text_client, "keys", side_effect=AssertionError("KEYS must not be used")):
+            deleted = cache_management.clear_all_pattern("query:matches:*", batch_size=10)
+
+        self.assertEqual(deleted, 25)
+        self.assertEqual(self.text_client.keys("*"), ["query:teams:1"])
+
+    def test_health_status_is_cached_between_writes(self) -> None:
+        with patch.object(self.text_client, "ping", wraps=self.text_client.ping) as ping:
+            for idx in range(5):
+                cache_management.set_cache(f"key:{idx}", idx)
+
+        self.assertEqual(ping.call_count, 1)
+        self.assertEqual(cache_management.get_cache("key:4"), 4)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
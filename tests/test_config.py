@@ -12,6 +12,8 @@ class TestConfig(unittest.TestCase):
             "SOCCER_ANALYTICS_TRAINING_SEASONS": "2022,2024",
             "SOCCER_ANALYTICS_PREDICTION_DAYS": "5",
             "SOCCER_ANALYTICS_SITE_EXPORT_DAYS": "2",
+            "FOOTBALL_DATA_BASE_URL": "http://127.0.0.1:8080/v4",
+            "SOCCER_ANALYTICS_FOOTBALL_DATA_RATE_LIMIT": "600",
         }
         with patch.dict(os.environ, env, clear=False):
             settings = load_settings()
@@ -20,6 +22,8 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(settings.training_seasons, ["2022", "2024"])
         self.assertEqual(settings.prediction_days, 5)
         self.assertEqual(settings.site_export_days, 2)
+        self.assertEqual(settings.football_data_base_url, "http://127.0.0.1:8080/v4/")
+        self.assertEqual(settings.football_data_rate_limit, 600)
 
     def test_resolve_competitions_falls_back_when_filter_is_empty(self):
         settings = load_settings()
@@ -32,3 +36,4 @@ class TestConfig(unittest.TestCase):
 
         self.assertEqual(settings.competitions_map, DEFAULT_COMPETITIONS_MAP)
         self.assertEqual(settings.training_seasons, DEFAULT_SEASONS)
+        self.assertEqual(settings.football_data_base_url, "https://api.football-data.org/v4/")
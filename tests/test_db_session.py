@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from app import pipeline
+from app.config import load_settings
+from app.data_service import db_session
+
+
+class TestDbSession(unittest.TestCase):
+    def test_import_does_not_touch_the_database(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env = {key: value for key, value in os.environ.items() if key != "DATABASE_URL"}
+            env["PYTHONPATH"] = str(Path(__file__).resolve().parents[1])
+            subprocess.run(
+                [sys.executable, "-c", "import app.data_service.db_session, app.data_service.db_test"],
+                cwd=tmpdir,
+                env=env,
+                check=True,
+            )
+            self.assertFalse((Path(tmpdir) / "test.db").exists())
+
+    def test_engine_is_created_lazily_and_sessions_are_reused(self) -> None:
+        with patch.dict(os.environ, {"DATABASE_URL": "sqlite://"}), patch.object(
+            db_session, "_engine", None
+        ), patch.object(db_session, "_session_factory", None):
+            self.assertIsNone(db_session._engine)
+
+            with db_session.get_db_service() as outer:
+                self.assertIsNotNone(db_session._engine)
+                with db_session.get_db_service() as inner:
+                    self.assertIs(inner, outer)
+                    self.assertEqual(inner.matches.get_by_competition(2021, "2023"), [])
+
+            with db_session.get_db_service() as fresh:
+                self.assertIsNot(fresh, outer)
+
+    def test_training_pipeline_holds_no_session_while_training(self) -> None:
+        active = []
+
+        class _Trainer:
+            def prepare_dataset(self, competition_id, seasons):
+                return pd.DataFrame({"result": [1]})
+
+            def train(self, df, tune=True):
+                active.append(db_session._active_service.get())
+                return None
+
+        with patch.object(pipeline, "ModelTrainer", _Trainer):
+            pipeline.run_training_pipeline(competition_codes="PL,PD", seasons=["2023"], tune=False)
+
+        self.assertEqual(active, [None, None])
+
+    def test_pool_options_come_from_settings(self) -> None:
+        env = {
+            "SOCCER_ANALYTICS_DB_POOL_SIZE": "12",
+            "SOCCER_ANALYTICS_DB_MAX_OVERFLOW": "0",
+            "SOCCER_ANALYTICS_DB_POOL_PRE_PING": "false",
+            "SOCCER_ANALYTICS_DB_POOL_RECYCLE": "600",
+        }
+        with patch.dict(os.environ, env):
+            settings = load_settings()
+
+        self.assertEqual(
+            db_session.engine_options("postgresql://db/football", settings),
+            {"pool_pre_ping": False, "pool_size": 12, "max_overflow": 0, "pool_recycle": 600},
+        )
+        self.assertEqual(db_session.engine_options("sqlite:///./test.db", settings), {"pool_pre_ping": False})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
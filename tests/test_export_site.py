@@ -43,7 +43,7 @@ class TestExportSiteData(unittest.TestCase):
             ), patch.object(
                 export_site, "_generate_predictions", return_value=predictions
             ) as generate_predictions, patch.object(
-                export_site, "fetch_daily_scores", return_value=scores
+                export_site, "_daily_scores", return_value=scores
             ):
                 outputs = export_site.export_site_data(days=4)
 
@@ -111,7 +111,7 @@ class TestExportSiteData(unittest.TestCase):
             ), patch.object(
                 export_site, "_generate_predictions", return_value=[]
             ), patch.object(
-                export_site, "fetch_daily_scores", return_value=[]
+                export_site, "_daily_scores", return_value=[]
             ):
                 export_site.export_site_data()
 
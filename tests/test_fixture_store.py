@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from contextlib import contextmanager
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.data_service import fixtures
+from app.data_service.db.data_service import DataService
+from app.data_service.db.database.db_schema import Base, Fixture
+from app.data_service.fetch.fetcher import FootballDataClient
+from app.data_service.fetch.http_transport import HttpTransport, RetryPolicy
+from app.data_service.fetch.payload_archive import PayloadArchive
+from app.data_service.fetch.response_cache import ResponseCache
+from app.data_service.fetch.stand_in_api import LocalFootballDataServer, StandInApi, SyntheticFootballData
+
+TODAY = date(2024, 1, 15)
+
+
+class _NoLimit:
+    def wait_if_needed(self):
+        pass
+
+
+class TestFixtureStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.api = StandInApi(SyntheticFootballData({"PL": 2021, "PD": 2014, "SA": 2019}, today=TODAY))
+        self.server = LocalFootballDataServer(self.api).start()
+        self.archive = PayloadArchive(self.tmp.name)
+        self.client = FootballDataClient(cache=ResponseCache(self.tmp.name), archive=self.archive,
+                                         replay=False, base_url=self.server.base_url)
+        self.client.limiter = _NoLimit()
+        self.client.cache = None
+
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+
+        @contextmanager
+        def service():
+            yield DataService(self.session)
+
+        self.db = patch.object(fixtures, "get_db_service", service)
+        self.db.start()
+
+    def tearDown(self) -> None:
+        self.db.stop()
+        self.session.close()
+        self.server.stop()
+        self.archive.close()
+        self.tmp.cleanup()
+
+    def _upcoming(self, codes, days: int, **kwargs) -> dict:
+        return fixtures.upcoming_fixtures(codes, days, client=self.client, today=TODAY, **kwargs)
+
+    def test_competitions_are_fetched_in_one_call(self) -> None:
+        result = self._upcoming(["PL", "PD"], 7)
+
+        self.assertEqual(self.api.stats()["requests"], 1)
+        self.assertEqual(set(result), {"PL", "PD"})
+        self.assertEqual(len(result["PL"]), 10)
+        for match in result["PL"]:
+            self.assertEqual(match["status"], "TIMED")
+            self.assertTrue(TODAY.isoformat() <= match["utcDate"][:10] <= (TODAY + timedelta(days=7)).isoformat())
+
+    def test_fresh_windows_are_served_from_the_store(self) -> None:
+        first = self._upcoming(["PL", "PD"], 14)
+        # A narrower window of the same competitions needs no request; a new competition needs one
+        narrower = self._upcoming(["PL"], 7)
+        self._upcoming(["PL", "SA"], 7)
+
+        # 14 days are two MAX_WINDOW_DAYS calls, plus one for SA
+        self.assertEqual(self.api.stats()["requests"], 3)
+        self.assertEqual(len(first["PL"]), 20)
+        self.assertEqual(narrower["PL"], [m for m in first["PL"] if m["utcDate"][:10] <= "2024-01-22"])
+        self.assertEqual(self.session.query(Fixture).filter(Fixture.competition_code == "SA").count(), 10)
+
+    def test_expired_windows_are_refetched(self) -> None:
+        self._upcoming(["PL"], 7)
+        self._upcoming(["PL"], 7, ttl=timedelta(0))
+
+        self.assertEqual(self.api.stats()["requests"], 2)
+        self.assertEqual(self.session.query(Fixture).count(), 10)
+
+    def test_failed_fetch_keeps_the_window_stale(self) -> None:
+        self.api.rate_limit = 0
+        self.client.transport = HttpTransport(retry=RetryPolicy(max_retries=0))
+
+        self.assertEqual(self._upcoming(["PL"], 7), {})
+        self.assertEqual(self.session.query(Fixture).count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
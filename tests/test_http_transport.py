@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import unittest
+
+import requests
+
+from app.data_service.fetch.http_transport import (
+    CircuitOpenError, HttpTransport, RetryPolicy, parse_retry_after
+)
+
+
+class _Response:
+    def __init__(self, status_code: int, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class _Session:
+    """Replays a script of responses/exceptions in place of requests.Session."""
+
+    def __init__(self, script: list) -> None:
+        self.script = script
+        self.calls = 0
+
+    def request(self, method: str, url: str, **kwargs) -> _Response:
+        self.calls += 1
+        outcome = self.script.pop(0) if self.script else _Response(200)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestHttpTransport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        self.sleeps: list[float] = []
+        self.transport = HttpTransport(
+            retry=RetryPolicy(max_retries=3, backoff_base=1.0, backoff_cap=4.0),
+            failure_threshold=2,
+            reset_timeout=30.0,
+            sleep=self.sleeps.append,
+            clock=self.clock,
+        )
+
+    def _script(self, *outcomes) -> _Session:
+        session = _Session(list(outcomes))
+        self.transport.session = session  # type: ignore[assignment]
+        return session
+
+    def test_retry_after_is_honoured(self) -> None:
+        self._script(_Response(429, {"Retry-After": "7"}), _Response(200))
+
+        response = self.transport.get("https://api.example.test/v4/matches")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.sleeps, [7.0])
+        stats = self.transport.stats()["api.example.test"]
+        self.assertEqual((stats["requests"], stats["retries"], stats["failures"]), (2, 1, 0))
+
+    def test_retries_are_bounded_with_jittered_backoff(self) -> None:
+        session = self._script(*[_Response(503)] * 10)
+
+        response = self.transport.get("https://api.example.test/v4/matches")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(session.calls, 4)
+        self.assertEqual(len(self.sleeps), 3)
+        for attempt, delay in enumerate(self.sleeps):
+            self.assertLessEqual(delay, min(4.0, 2 ** attempt))
+        self.assertEqual(self.transport.stats()["api.example.test"]["failures"], 1)
+
+    def test_circuit_opens_then_half_opens_after_timeout(self) -> None:
+        self._script(*[requests.ConnectionError("refused")] * 8)
+        url = "https://dead.example.test/league"
+
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                self.transport.get(url)
+        with self.assertRaises(CircuitOpenError):
+            self.transport.get(url)
+        self.assertEqual(self.transport.stats()["dead.example.test"]["circuit"], "open")
+
+        self.clock.now += 31
+        session = self._script(_Response(200))
+        self.assertEqual(self.transport.get(url).status_code, 200)
+        self.assertEqual(session.calls, 1)
+        self.assertEqual(self.transport.stats()["dead.example.test"]["circuit"], "closed")
+
+    def test_other_request_errors_settle_the_half_open_trial(self) -> None:
+        self._script(*[requests.ConnectionError("refused")] * 8)
+        url = "https://dead.example.test/league"
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                self.transport.get(url)
+
+        self.clock.now += 31
+        session = self._script(requests.TooManyRedirects("loop"))
+        with self.assertRaises(requests.TooManyRedirects):
+            self.transport.get(url)
+        self.assertEqual(session.calls, 1)
+        self.assertEqual(self.transport.stats()["dead.example.test"]["circuit"], "open")
+
+        self.clock.now += 31
+        self._script(_Response(200))
+        self.assertEqual(self.transport.get(url).status_code, 200)
+        self.assertEqual(self.transport.stats()["dead.example.test"]["circuit"], "closed")
+
+    def test_throttling_does_not_open_the_circuit(self) -> None:
+        self._script(*[_Response(429, {"Retry-After": "0"})] * 12)
+
+        for _ in range(3):
+            self.transport.get("https://api.example.test/v4/matches")
+
+        self.assertEqual(self.transport.stats()["api.example.test"]["circuit"], "closed")
+
+    def test_parse_retry_after_forms(self) -> None:
+        self.assertEqual(parse_retry_after("12"), 12.0)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
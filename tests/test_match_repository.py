@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.data_service.db.database.db_schema import Base, Match
+from app.data_service.db.repositories.match_repository import MatchRepository
+
+
+def _seed_matches(session) -> None:
+    start = datetime(2023, 8, 1, 15, 0)
+    rows = []
+    for idx in range(1, 13):
+        home, away = (1, 2) if idx % 2 else (2, 3)
+        rows.append(
+            Match(
+                id=idx,
+                competition_id=2021 if idx <= 10 else 2014,
+                season_year="2023" if idx <= 6 else "2024",
+                utc_date=start + timedelta(days=idx * 3),
+                status="FINISHED",
+                home_team_id=home,
+                away_team_id=away,
+                score_home=idx % 3,
+                score_away=1,
+                winner="HOME_TEAM" if idx % 3 == 2 else ("AWAY_TEAM" if idx % 3 == 0 else "DRAW"),
+                home_xg=1.1 if idx % 4 else None,
+                referees=[{"name": "Ref"}],
+            )
+        )
+    rows.append(
+        Match(
+            id=99,
+            competition_id=2021,
+            season_year="2024",
+            utc_date=start + timedelta(days=60),
+            status="SCHEDULED",
+            home_team_id=1,
+            away_team_id=3,
+        )
+    )
+    session.add_all(rows)
+    session.commit()
+
+
+class TestMatchRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        _seed_matches(self.session)
+        self.repo = MatchRepository(self.session)
+
+    def tearDown(self) -> None:
+        self.session.close()
+
+    def test_training_columns_cover_all_seasons_in_one_read(self) -> None:
+        columns = self.repo.get_training_columns(2021, ["2023", "2024"], batch_size=4)
+
+        self.assertEqual(columns["id"], list(range(1, 11)))
+        self.assertEqual(columns["season_year"], ["2023"] * 6 + ["2024"] * 4)
+        self.assertNotIn("referees", columns)
+        self.assertEqual(len(set(len(values) for values in columns.values())), 1)
+
+        legacy = [
+            m.id
+            for season in ["2023", "2024"]
+            for m in self.repo.get_by_competition(2021, season)
+        ]
+        self.assertEqual(columns["id"], legacy)
+
+    def test_training_columns_empty_for_unknown_season(self) -> None:
+        columns = self.repo.get_training_columns(2021, ["1999"])
+
+        self.assertTrue(all(values == [] for values in columns.values()))
+        self.assertIn("home_team_id", columns)
+
+    def _form_pairs(self) -> list[tuple[int, datetime]]:
+        return [
+            (team_id, datetime(2023, 8, 1) + timedelta(days=offset))
+            for team_id in (1, 2, 3, 4)
+            for offset in (0, 5, 14, 22, 40, 90)
+        ]
+
+    def test_recent_form_batch_matches_per_team_queries(self) -> None:
+        pairs = self._form_pairs()
+        batched = self.repo.get_recent_form_batch(pairs, limit=3, chunk_size=7)
+
+        self.assertEqual(set(batched), set(pairs))
+        for team_id, as_of in pairs:
+            with self.subTest(team_id=team_id, as_of=as_of):
+                self.assertEqual(batched[(team_id, as_of)], self.repo.get_recent_form(team_id, as_of, limit=3))
+
+    def test_recent_form_batch_fallback_matches_window_query(self) -> None:
+        pairs = self._form_pairs()
+        windowed = self.repo.get_recent_form_batch(pairs)
+
+        with patch.object(MatchRepository, "_supports_window_functions", return_value=False), patch.object(
+            MatchRepository, "_recent_form_statement"
+        ) as statement:
+            fallback = self.repo.get_recent_form_batch(pairs)
+
+        statement.assert_not_called()
+        self.assertEqual(fallback, windowed)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import unittest
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.data_service.db.database.db_schema import Base
+from app.data_service.db.database.migrations import MIGRATIONS, applied_versions, init_schema, run_migrations
+
+
+class TestSchemaMigrations(unittest.TestCase):
+    def test_migrations_add_indexes_to_existing_tables(self) -> None:
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            # Pre-index layout: create_all on an old schema never alters it.
+            conn.execute(text(
+                "CREATE TABLE matches (id INTEGER PRIMARY KEY, competition_id INTEGER, season_year VARCHAR(10), "
+                "utc_date DATETIME, status VARCHAR(20), home_team_id INTEGER, away_team_id INTEGER)"
+            ))
+        Base.metadata.create_all(engine)
+        self.assertEqual(inspect(engine).get_indexes("matches"), [])
+
+        applied = run_migrations(engine)
+
+        self.assertEqual(applied, [m.version for m in MIGRATIONS])
+        index_names = {index["name"] for index in inspect(engine).get_indexes("matches")}
+        self.assertIn("ix_matches_competition_season_status", index_names)
+        self.assertIn("ix_matches_home_team_date", index_names)
+        self.assertIn("ix_matches_away_team_date", index_names)
+
+        with engine.connect() as conn:
+            plan = " ".join(
+                str(row[-1])
+                for row in conn.execute(text(
+                    "EXPLAIN QUERY PLAN SELECT * FROM matches "
+                    "WHERE competition_id = 2021 AND season_year = '2023' AND status = 'FINISHED'"
+                ))
+            )
+        self.assertIn("ix_matches_competition_season_status", plan)
+
+    def test_init_schema_is_idempotent(self) -> None:
+        engine = create_engine("sqlite://")
+
+        init_schema(engine)
+        self.assertEqual(init_schema(engine), [])
+        self.assertEqual(applied_versions(engine), [m.version for m in MIGRATIONS])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -32,6 +32,21 @@ class TestOperationsSummary(unittest.TestCase):
             ],
         )
         self.assertEqual(summary["alerts"], [])
+        self.assertNotIn("prediction_cache", summary)
+
+    def test_reports_prediction_cache_hit_rates(self) -> None:
+        summary = build_operations_summary(
+            [{"competition": "PL", "confidence": 0.72}],
+            [{"league": "Premier League"}],
+            cache_stats={"enabled": True, "hits": 3, "misses": 1, "local_hit_ratio": 0.5,
+                         "redis_hit_ratio": 2 / 3, "degraded_calls": 0},
+        )
+
+        self.assertEqual(summary["status"], "healthy")
+        self.assertEqual(summary["prediction_cache"], {
+            "enabled": True, "lookups": 4, "hits": 3, "misses": 1, "hit_ratio": 0.75,
+            "local_hit_ratio": 0.5, "redis_hit_ratio": 0.6667, "degraded_calls": 0,
+        })
 
     def test_flags_empty_and_low_quality_exports(self) -> None:
         empty = build_operations_summary([], [])
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from app.orchestrator import BLOCKED, CPU, FAILED, NETWORK, OK, SKIPPED, Orchestrator, Stage, daily_stages
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+class TestOrchestrator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = ThreadPoolExecutor(max_workers=4)
+        self.executors = {NETWORK: self.pool, CPU: self.pool}
+
+    def tearDown(self) -> None:
+        self.pool.shutdown()
+
+    def test_independent_stages_overlap_after_their_dependency(self) -> None:
+        events: list[str] = []
+        barrier = threading.Barrier(3, timeout=5)
+
+        def matches() -> None:
+            events.append("matches")
+
+        def enrich(name: str) -> str:
+            barrier.wait()  # deadlocks unless all three run at once
+            events.append(name)
+            return name
+
+        stages = [
+            Stage("matches", matches),
+            *(Stage(name, partial(enrich, name), depends_on=("matches",)) for name in ("context", "players", "odds")),
+            Stage("train:PL", lambda: time.sleep(0.05), depends_on=("odds",), resource=CPU),
+        ]
+        orchestrator = Orchestrator(stages, executors=self.executors)
+
+        results = orchestrator.run()
+
+        self.assertEqual(events[0], "matches")
+        self.assertTrue(all(result.status == OK for result in results.values()))
+        self.assertEqual(results["odds"].output, "odds")
+        self.assertEqual(orchestrator.critical_path(results), ["matches", "odds", "train:PL"])
+        self.assertIn("Critical path", orchestrator.summary(results))
+
+    def test_failures_block_downstream_and_conditions_skip(self) -> None:
+        def broken() -> None:
+            raise RuntimeError("API down")
+
+        stages = [
+            Stage("sync", lambda: {"PL"}),
+            Stage("odds", broken),
+            Stage("train:PL", lambda: "trained", depends_on=("sync",), when=lambda out: "PL" in out["sync"]),
+            Stage("train:SA", lambda: "trained", depends_on=("sync",), when=lambda out: "SA" in out["sync"]),
+            Stage("report", lambda: None, depends_on=("train:PL", "train:SA")),
+            Stage("train:BL1", lambda: None, depends_on=("odds",)),
+            Stage("export", lambda: None, depends_on=("train:BL1",)),
+        ]
+
+        results = Orchestrator(stages, executors=self.executors).run()
+
+        self.assertEqual({name: result.status for name, result in results.items()}, {
+            "sync": OK, "odds": FAILED, "train:PL": OK, "train:SA": SKIPPED,
+            "report": OK, "train:BL1": BLOCKED, "export": BLOCKED,
+        })
+        self.assertEqual(results["odds"].error, "API down")
+
+    def test_daily_full_refresh_reseeds_past_checkpoints(self) -> None:
+        refresh = {stage.name: stage for stage in daily_stages({"PL": 2021}, full_refresh=True)}["matches"]
+        sync = {stage.name: stage for stage in daily_stages({"PL": 2021})}["matches"]
+
+        self.assertEqual((refresh.run.func.__name__, refresh.run.keywords), ("seed_matches", {"refresh": True}))
+        self.assertEqual(sync.run.func.__name__, "sync_matches")
+
+    def test_invalid_graphs_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            Orchestrator([Stage("a", print, depends_on=("missing",))])
+        with self.assertRaises(ValueError):
+            Orchestrator([Stage("a", print, depends_on=("b",)), Stage("b", print, depends_on=("a",))])
+
+    def test_cpu_stages_run_in_worker_processes(self) -> None:
+        stages = [Stage(f"square:{n}", partial(_square, n), resource=CPU) for n in (3, 4)]
+
+        results = Orchestrator(stages, network_workers=1, cpu_workers=2).run()
+
+        self.assertEqual([result.output for result in results.values()], [9, 16])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
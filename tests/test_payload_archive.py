@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from app.data_service.fetch.fetcher import FootballDataClient
+from app.data_service.fetch.payload_archive import FOOTBALL_DATA, UNDERSTAT, PayloadArchive, default_payload_archive
+from app.data_service.fetch.understat_client import UnderstatClient
+
+DAY = 24 * 60 * 60
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0  # 2023-11-14 UTC
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Offline:
+    """Transport and limiter that fail the test if replay touches them."""
+    def get(self, *args, **kwargs):
+        raise AssertionError("replay must not use the network")
+
+    def wait_if_needed(self):
+        raise AssertionError("replay must not use the rate limit")
+
+
+class TestPayloadArchive(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.clock = _Clock()
+        self.archive = PayloadArchive(self.tmp.name, clock=self.clock)
+
+    def tearDown(self) -> None:
+        self.archive.close()
+        self.tmp.cleanup()
+
+    def test_payloads_are_partitioned_by_fetch_day(self) -> None:
+        self.archive.append(FOOTBALL_DATA, "competitions/PL/matches", {"season": "2023"}, {"matches": [1]})
+        self.clock.now += DAY
+        self.archive.append(FOOTBALL_DATA, "competitions/PL/matches", {"season": "2023"}, {"matches": [1, 2]})
+        self.archive.append(FOOTBALL_DATA, "teams/57", None, {"squad": []})
+
+        day_file = os.path.join(self.tmp.name, "2023", "11", "2023-11-15.jsonl.gz")
+        with gzip.open(day_file, "rt") as handle:
+            lines = [json.loads(line) for line in handle]
+
+        self.assertEqual([line["endpoint"] for line in lines], ["competitions/PL/matches", "teams/57"])
+        self.assertEqual(self.archive.stats()["partitions"], 2)
+        self.assertEqual(len(list(self.archive.records(FOOTBALL_DATA))), 3)
+
+    def test_concurrent_writers_record_correct_offsets(self) -> None:
+        other = PayloadArchive(self.tmp.name, clock=self.clock)
+
+        def write(archive, worker):
+            for idx in range(25):
+                archive.append(FOOTBALL_DATA, f"teams/{worker}", {"n": idx}, {"worker": worker, "n": idx})
+
+        threads = [threading.Thread(target=write, args=(archive, worker))
+                   for worker, archive in enumerate([self.archive, other, self.archive, other])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        other.close()
+
+        for worker in range(4):
+            for idx in range(25):
+                self.assertEqual(self.archive.latest(FOOTBALL_DATA, f"teams/{worker}", {"n": idx}),
+                                 {"worker": worker, "n": idx})
+
+    def test_default_archive_is_shared_per_directory(self) -> None:
+        with mock.patch.dict(os.environ, {"SOCCER_ANALYTICS_PAYLOAD_ARCHIVE_DIR": os.path.join(self.tmp.name, "shared")}):
+            first = default_payload_archive()
+            self.addCleanup(first.close)
+            self.assertIs(default_payload_archive(), first)
+
+    def test_latest_payload_wins_and_params_order_is_ignored(self) -> None:
+        params = {"season": "2023", "status": "FINISHED"}
+        self.archive.append(FOOTBALL_DATA, "competitions/PL/matches", params, {"version": 1})
+        self.clock.now += 60
+        self.archive.append(FOOTBALL_DATA, "competitions/PL/matches", params, {"version": 2})
+
+        latest = self.archive.latest(FOOTBALL_DATA, "competitions/PL/matches", {"status": "FINISHED", "season": "2023"})
+
+        self.assertEqual(latest, {"version": 2})
+        self.assertIsNone(self.archive.latest(UNDERSTAT, "competitions/PL/matches", params))
+
+    def test_replay_serves_seeds_without_network(self) -> None:
+        finished = {"id": 1, "status": "FINISHED", "score": {"fullTime": {"home": 2, "away": 0}}}
+        self.archive.append(FOOTBALL_DATA, "competitions/PL/matches", {"season": "2023"}, {"matches": [finished]})
+        self.archive.append(UNDERSTAT, "EPL/2023", None, "<script>var datesData = JSON.parse('[]');</script>")
+
+        client = FootballDataClient(transport=_Offline(), archive=self.archive, replay=True)
+        client.limiter = _Offline()
+        understat = UnderstatClient(transport=_Offline(), archive=self.archive, replay=True)
+
+        self.assertEqual(client.fetch_multiple_seasons("PL", ["2023", "2024"]), {"2023": [finished]})
+        self.assertIsNone(client.fetch_team_squad(57))
+        self.assertEqual(understat.fetch_league_season("EPL", "2023"), {"datesData": []})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
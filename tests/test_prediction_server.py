@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+import joblib
+import numpy as np
+
+from app.data_service.db.cache.prediction_cache import PredictionCache
+from app.ml.prediction_service import PredictionService
+from app.web.prediction_load_test import percentile, run_load_test
+from app.web.prediction_server import MicroBatcher, PredictionServer
+
+
+class _ConstantModel:
+    """Picklable model answering the same probabilities for every row."""
+    classes_ = np.array([0, 1, 2])
+
+    def __init__(self, win: float) -> None:
+        self.win = win
+
+    def predict_proba(self, X):
+        return np.tile([1.0 - self.win - 0.2, 0.2, self.win], (len(X), 1))
+
+
+def _fixture(match_id: int, competition="PL") -> dict:
+    return {"id": match_id, "competition": competition, "utcDate": "2030-01-05T15:00:00Z",
+            "homeTeam": {"id": 1, "name": "Home"}, "awayTeam": {"id": 2, "name": "Away"}}
+
+
+async def _post(port: int, path: str, payload) -> tuple[int, dict]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode()
+    writer.write(f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, data = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(data)
+
+
+class TestMicroBatcher(unittest.TestCase):
+    def test_concurrent_submissions_share_one_predict_call(self) -> None:
+        calls = []
+
+        def predict(fixtures):
+            calls.append({code: [f["id"] for f in batch] for code, batch in fixtures.items()})
+            return [type("P", (), {"fixture": f})() for batch in fixtures.values() for f in batch]
+
+        async def scenario():
+            batcher = MicroBatcher(predict, max_batch=100, max_wait=0.01)
+            return await asyncio.gather(
+                batcher.submit("PL", [{"id": 1}, {"id": 2}]),
+                batcher.submit("PL", [{"id": 3}]),
+                batcher.submit("PD", [{"id": 4}]),
+            ), batcher.stats()
+
+        results, stats = asyncio.run(scenario())
+
+        self.assertEqual(sorted(calls, key=str), [{"PD": [4]}, {"PL": [1, 2, 3]}])
+        self.assertEqual([[p.fixture["id"] for p in r] for r in results], [[1, 2], [3], [4]])
+        self.assertEqual(stats, {"batches": 2, "fixtures": 4, "mean_batch": 2.0})
+
+    def test_full_batch_is_flushed_without_waiting(self) -> None:
+        async def scenario():
+            batcher = MicroBatcher(lambda f: [object()] * len(f["PL"]), max_batch=2, max_wait=60)
+            return await asyncio.wait_for(batcher.submit("PL", [{}, {}]), timeout=1)
+
+        self.assertEqual(len(asyncio.run(scenario())), 2)
+
+
+class TestPredictionServer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.state_calls: list[int] = []
+        self.service = PredictionService(self.tmp.name, competitions={"PL": 2021, "SA": 2019},
+                                         state_source=self._states,
+                                         cache=PredictionCache(enabled=False))
+        joblib.dump(_ConstantModel(0.6), self.service.model_path("PL"))
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _states(self, competition_id: int, seasons) -> dict:
+        self.state_calls.append(competition_id)
+        return {}
+
+    def _run(self, scenario):
+        async def wrapper():
+            server = await PredictionServer(self.service, port=0, reload_interval=0.05).start()
+            try:
+                return await scenario(server)
+            finally:
+                await server.stop()
+        return asyncio.run(wrapper())
+
+    def test_single_and_batched_predictions(self) -> None:
+        async def scenario(server):
+            single = await _post(server.port, "/predict", _fixture(1))
+            batch = await _post(server.port, "/predict", {"fixtures": [_fixture(2), _fixture(3, "SA"), {"id": 4}]})
+            unknown = await _post(server.port, "/nope", {})
+            return single, batch, unknown
+
+        single, batch, unknown = self._run(scenario)
+
+        self.assertEqual(single[0], 200)
+        self.assertEqual((single[1]["match_id"], single[1]["prediction"]), (1, "Win"))
+        self.assertEqual(batch[0], 200)
+        predictions = batch[1]["predictions"]
+        self.assertEqual(predictions[0]["match_id"], 2)
+        self.assertEqual(predictions[1], {"error": "No model for competition SA"})
+        self.assertEqual(predictions[2], {"error": "Missing competition code"})
+        self.assertEqual(unknown[0], 404)
+
+    def test_models_are_hot_reloaded(self) -> None:
+        async def scenario(server):
+            before = await _post(server.port, "/predict", _fixture(1, "SA"))
+            path = self.service.model_path("SA")
+            joblib.dump(_ConstantModel(0.1), path)
+            os.utime(path, (1, 1))
+            for _ in range(100):
+                await asyncio.sleep(0.05)
+                if "SA" in server.health()["models"] and server.service._models.get("SA"):
+                    break
+            return before, await _post(server.port, "/predict", _fixture(2, "SA"))
+
+        before, after = self._run(scenario)
+
+        self.assertEqual(before[0], 422)
+        self.assertEqual((after[0], after[1]["prediction"]), (200, "Loss"))
+
+    def test_hot_reload_rebuilds_team_states_of_the_changed_model(self) -> None:
+        async def scenario(server):
+            path = self.service.model_path("PL")
+            joblib.dump(_ConstantModel(0.1), path)
+            os.utime(path, (1, 1))
+            for _ in range(100):
+                await asyncio.sleep(0.05)
+                if self.state_calls.count(2021) > 1:
+                    break
+            return await _post(server.port, "/predict", _fixture(1))
+
+        response = self._run(scenario)
+
+        self.assertEqual(self.state_calls, [2021, 2021])
+        self.assertEqual(response[1]["prediction"], "Loss")
+
+    def test_load_test_reports_latency_percentiles(self) -> None:
+        async def scenario(server):
+            return await run_load_test(f"http://127.0.0.1:{server.port}/predict", requests=200,
+                                       concurrency=20, batch=2, competitions=["PL"], team_ids=[1, 2, 3])
+
+        report = self._run(scenario)
+
+        self.assertEqual((report["requests"], report["errors"], report["fixtures"]), (200, 0, 400))
+        self.assertLessEqual(report["p50_ms"], report["p99_ms"])
+        self.assertGreater(report["rps"], 0)
+        self.assertEqual(percentile([1.0, 2.0, 3.0, 4.0], 50), 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+import joblib
+import numpy as np
+
+from app.data_service.db.cache.prediction_cache import PredictionCache
+from app.data_service.db.cache.tiered_cache import LocalCache, TieredCache
+from app.ml.feature_engineering import FeatureEngineer
+from app.ml.prediction_service import (
+    DEFAULT_TEAM_STATE,
+    PredictionService,
+    TeamState,
+    export_records,
+    team_states_from_matches,
+)
+from tests.test_query_cache import _DictTier
+
+
+class _StubModel:
+    """Picklable stand-in for the XGBoost classifier: P(Win) grows with elo_diff."""
+    classes_ = np.array([0, 1, 2])
+    calls: list[list[str]] = []
+
+    def __init__(self, draw: float = 0.2) -> None:
+        self.draw = draw
+
+    def predict_proba(self, X):
+        _StubModel.calls.append(list(X.columns))
+        win = np.clip(0.4 + X["elo_diff"].to_numpy() / 1000, 0.0, 1.0 - self.draw)
+        return np.column_stack([1.0 - self.draw - win, np.full(len(X), self.draw), win])
+
+
+def _fixture(match_id: int, home: int, away: int, utc_date: str = "2024-03-09T15:00:00Z") -> dict:
+    return {"id": match_id, "utcDate": utc_date, "status": "TIMED",
+            "homeTeam": {"id": home, "name": f"Team {home}"}, "awayTeam": {"id": away, "name": f"Team {away}"}}
+
+
+def _history(results: list[tuple[int, int, int, int]]) -> dict:
+    kickoff = datetime(2024, 1, 6, 15, 0)
+    rows = {key: [] for key in ["id", "utc_date", "season_year", "home_team_id", "away_team_id", "winner",
+                                "score_home", "score_away", "home_xg", "away_xg",
+                                "odds_home", "odds_draw", "odds_away"]}
+    for idx, (home, away, goals_home, goals_away) in enumerate(results, start=1):
+        winner = "HOME_TEAM" if goals_home > goals_away else "AWAY_TEAM" if goals_away > goals_home else "DRAW"
+        values = [idx, kickoff + timedelta(weeks=idx), "2023", home, away, winner,
+                  goals_home, goals_away, float(goals_home), float(goals_away), None, None, None]
+        for key, value in zip(rows, values):
+            rows[key].append(value)
+    return rows
+
+
+class TestTeamStates(unittest.TestCase):
+    def test_state_uses_the_last_window_and_post_match_elo(self) -> None:
+        # Team 1 wins six in a row; only the last five count for the rolling stats
+        results = [(1, 2, 3, 0)] + [(1, 2, 1, 0)] * 5
+        states = team_states_from_matches(_history(results))
+
+        self.assertEqual(states[1].rolling_goals, 1.0)
+        self.assertEqual(states[1].rolling_wins, 5.0)
+        self.assertEqual(states[2].rolling_points, 0.0)
+        self.assertGreater(states[1].elo, 1500)
+        self.assertAlmostEqual(states[1].elo + states[2].elo, 3000)
+        self.assertEqual(states[1].last_played, datetime(2024, 2, 17, 15, 0))
+
+    def test_no_history_gives_no_states(self) -> None:
+        self.assertEqual(team_states_from_matches(_history([])), {})
+
+
+class TestPredictionService(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.state_calls = 0
+        self.redis = _DictTier()
+        self.service = PredictionService(
+            self.tmp.name, competitions={"PL": 2021, "PD": 2014}, state_source=self._states,
+            cache=self._cache(),
+        )
+        joblib.dump(_StubModel(), self.service.model_path("PL"))
+        _StubModel.calls.clear()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _cache(self) -> PredictionCache:
+        return PredictionCache(tiers=TieredCache(local=LocalCache(), remote=self.redis))
+
+    def _states(self, competition_id: int, seasons) -> dict:
+        self.state_calls += 1
+        return {1: TeamState(elo=1600.0, last_played=datetime(2024, 3, 2, 15, 0)), 2: TeamState(elo=1400.0)}
+
+    def test_fixtures_are_scored_in_one_batch_per_competition(self) -> None:
+        predictions = self.service.predict_fixtures({
+            "PL": [_fixture(1, 1, 2), _fixture(2, 2, 1), _fixture(3, 3, 4)],
+            "PD": [_fixture(4, 1, 2)],
+        })
+        self.service.predict_fixtures({"PL": [_fixture(5, 1, 3)]})
+
+        self.assertEqual(len(_StubModel.calls), 2)
+        self.assertEqual(_StubModel.calls[0], FeatureEngineer().features)
+        self.assertEqual(self.state_calls, 1)
+        self.assertEqual([p.fixture["id"] for p in predictions], [1, 2, 3])
+        self.assertAlmostEqual(predictions[0].probabilities["Win"], 0.6)
+        self.assertAlmostEqual(predictions[1].probabilities["Win"], 0.2)
+        self.assertEqual(predictions[0].verdict(), "HOME WIN")
+        self.assertEqual(predictions[1].verdict(), "AWAY WIN")
+
+    def test_features_fall_back_to_defaults_and_track_rest(self) -> None:
+        frame = self.service.feature_frame("PL", [_fixture(1, 1, 99), _fixture(2, 99, 1)])
+
+        self.assertEqual(frame.loc[0, "rest_days"], 7.0)
+        self.assertEqual(frame.loc[0, "opp_elo"], DEFAULT_TEAM_STATE.elo)
+        self.assertEqual(frame.loc[0, "elo_diff"], 100.0)
+        self.assertEqual(frame.loc[1, "rest_days"], 7.0)
+        self.assertEqual(frame.loc[1, "team_elo"], 1500.0)
+        self.assertFalse(frame.isna().any().any())
+
+    def test_model_is_reloaded_when_its_file_changes(self) -> None:
+        first = self.service.model("PL")
+        self.assertIs(self.service.model("PL"), first)
+
+        path = self.service.model_path("PL")
+        joblib.dump(_StubModel(draw=0.5), path)
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+
+        self.assertEqual(self.service.model("PL").draw, 0.5)
+        self.assertEqual(self.service.available_competitions(), ["PL"])
+
+    def test_team_states_are_built_outside_the_lock_and_invalidated_per_competition(self) -> None:
+        lock_free = []
+
+        def source(competition_id: int, seasons) -> dict:
+            def probe():
+                acquired = self.service._lock.acquire(timeout=1)
+                if acquired:
+                    self.service._lock.release()
+                lock_free.append(acquired)
+            thread = threading.Thread(target=probe)
+            thread.start()
+            thread.join()
+            return self._states(competition_id, seasons)
+
+        self.service.state_source = source
+        self.service.team_states("PL")
+        self.service.team_states("PD")
+        self.service.invalidate("PL")
+        self.service.team_states("PL")
+        self.service.team_states("PD")
+
+        self.assertEqual(lock_free, [True, True, True])
+        self.assertEqual(self.state_calls, 3)
+
+    def test_rebuild_racing_an_invalidate_is_not_cached(self) -> None:
+        def source(competition_id: int, seasons) -> dict:
+            if self.state_calls == 0:
+                # The model file changes while the first rebuild reads the database
+                self.service.invalidate("PL")
+            return self._states(competition_id, seasons)
+
+        self.service.state_source = source
+        first = self.service.team_states("PL")
+        self.service.team_states("PL")
+        self.service.team_states("PL")
+
+        self.assertEqual(first[1].elo, 1600.0)
+        self.assertEqual(self.state_calls, 2)
+
+    def test_repeated_feature_rows_are_served_from_the_cache(self) -> None:
+        first = self.service.predict_fixtures({"PL": [_fixture(1, 1, 2), _fixture(2, 2, 1)]})
+        # Same feature rows under other match ids, plus one new row
+        second = self.service.predict_fixtures({"PL": [_fixture(7, 1, 2), _fixture(8, 3, 4), _fixture(9, 2, 1)]})
+
+        self.assertEqual(len(_StubModel.calls), 2)
+        self.assertEqual([p.probabilities for p in second[::2]], [p.probabilities for p in first])
+        self.assertEqual([p.fixture["id"] for p in second], [7, 8, 9])
+        self.assertEqual(self.service.cache_stats()["hits"], 2)
+        self.assertEqual(self.service.cache_stats()["misses"], 3)
+
+        # A fresh process shares the Redis tier and skips scoring altogether
+        restarted = PredictionService(self.tmp.name, competitions={"PL": 2021}, state_source=self._states,
+                                      cache=self._cache())
+        restarted.predict_fixtures({"PL": [_fixture(1, 1, 2)]})
+        self.assertEqual(len(_StubModel.calls), 2)
+        self.assertEqual(restarted.cache_stats()["redis_hit_ratio"], 1.0)
+
+    def test_retrained_model_does_not_reuse_cached_scores(self) -> None:
+        before = self.service.predict_fixtures({"PL": [_fixture(1, 1, 2)]})[0]
+        fingerprint = self.service.model_fingerprint("PL")
+
+        path = self.service.model_path("PL")
+        joblib.dump(_StubModel(draw=0.3), path)
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+        after = self.service.predict_fixtures({"PL": [_fixture(1, 1, 2)]})[0]
+
+        self.assertNotEqual(self.service.model_fingerprint("PL"), fingerprint)
+        self.assertEqual(len(_StubModel.calls), 2)
+        self.assertAlmostEqual(before.probabilities["Draw"], 0.2)
+        self.assertAlmostEqual(after.probabilities["Draw"], 0.3)
+
+    def test_export_records_keep_the_published_shape(self) -> None:
+        record = export_records(self.service.predict_fixtures({"PL": [_fixture(1, 1, 2)]}))[0]
+
+        self.assertEqual(set(record), {"competition", "utc_date", "home_team", "away_team",
+                                       "prediction", "confidence", "probabilities"})
+        self.assertEqual((record["prediction"], record["home_team"]), ("Win", "Team 1"))
+        self.assertAlmostEqual(sum(record["probabilities"].values()), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
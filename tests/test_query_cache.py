@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.data_service.db.cache.query_cache import QueryCache
+from app.data_service.db.cache.tiered_cache import LocalCache, TieredCache
+from app.data_service.db.database.db_schema import Base, Match
+from app.data_service.db.repositories.match_repository import MatchRepository
+from app.data_service.db.repositories.team_repository import TeamRepository
+
+
+class _DictTier:
+    """In-memory stand-in for the Redis tier."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, object] = {}
+        self.counters: dict[str, int] = {}
+        self.down = False
+
+    def healthy(self) -> bool:
+        return not self.down
+
+    def get_many(self, keys):
+        return {key: self.store[key] for key in keys if key in self.store}
+
+    def set_many(self, values, ttl):
+        self.store.update(values)
+        return len(values)
+
+    def delete(self, key):
+        return self.store.pop(key, None) is not None
+
+    def get_int(self, key):
+        return self.counters.get(key, 0)
+
+    def incr(self, key):
+        self.counters[key] = self.counters.get(key, 0) + 1
+        return self.counters[key]
+
+
+def _match_payload(match_id: int, competition_id: int, home_score: int) -> dict:
+    return {
+        "id": match_id,
+        "competition": {"id": competition_id},
+        "season": {"startDate": "2023-08-11"},
+        "utcDate": f"2023-08-{10 + match_id:02d}T15:00:00Z",
+        "status": "FINISHED",
+        "matchday": 1,
+        "stage": "REGULAR_SEASON",
+        "homeTeam": {"id": 1, "name": "North FC"},
+        "awayTeam": {"id": 2, "name": "South FC"},
+        "score": {
+            "winner": "HOME_TEAM" if home_score > 0 else "DRAW",
+            "fullTime": {"home": home_score, "away": 0},
+            "halfTime": {"home": 0, "away": 0},
+        },
+    }
+
+
+class TestQueryCache(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.remote = _DictTier()
+        self.cache = QueryCache(tiers=TieredCache(local=LocalCache(), remote=self.remote))
+        self.matches = MatchRepository(self.session, self.cache)
+        self.matches.save_bulk([_match_payload(1, 2021, 1), _match_payload(2, 2014, 0)])
+
+    def tearDown(self) -> None:
+        self.session.close()
+
+    def _scores(self, competition_id: int) -> list:
+        return self.matches.get_training_columns(competition_id, ["2023"])["score_home"]
+
+    def test_repeated_reads_are_served_from_cache(self) -> None:
+        first = list(self._scores(2021))
+        self.session.query(Match).filter(Match.id == 1).update({"score_home": 5})
+        self.session.commit()
+        second = self.matches.get_training_columns(2021, ["2023"])
+
+        self.assertEqual(first, [1])
+        self.assertEqual(second["score_home"], [1])
+        self.assertEqual(second["utc_date"], [datetime(2023, 8, 11, 15, 0)])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_matches_by_competition_are_live_rows_with_teams(self) -> None:
+        self._scores(2021)
+        matches = self.matches.get_by_competition(2021, "2023")
+
+        self.assertEqual((matches[0].home_team.name, matches[0].away_team.name), ("North FC", "South FC"))
+        self.assertIn(matches[0], self.session)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_save_bulk_bumps_only_the_written_competition(self) -> None:
+        self._scores(2021)
+        self._scores(2014)
+
+        self.matches.save_bulk([_match_payload(1, 2021, 3)])
+
+        self.assertEqual(self._scores(2021), [3])
+        self._scores(2014)
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["hit_ratio"]), (1, 3, 0.25))
+
+    def test_team_writes_invalidate_team_reads(self) -> None:
+        teams = TeamRepository(self.session, self.cache)
+        self.assertEqual(teams.get_by_id(1).name, "North FC")
+
+        teams.save_team({"id": 1, "name": "North United"})
+
+        self.assertEqual(teams.get_by_id(1).name, "North United")
+
+    def test_versions_are_shared_through_redis(self) -> None:
+        self._scores(2021)
+        other_process = QueryCache(tiers=TieredCache(local=LocalCache(), remote=self.remote))
+        other_process.bump("competition:2021")
+
+        self.cache._versions.clear()
+        self.session.query(Match).filter(Match.id == 1).update({"score_home": 4})
+        self.session.commit()
+
+        self.assertEqual(self._scores(2021), [4])
+
+    def test_degraded_mode_keeps_serving_from_local_tier(self) -> None:
+        self._scores(2021)
+        self.remote.down = True
+
+        matches = self.matches.get_training_columns(2021, ["2023"])
+        self.matches.save_bulk([_match_payload(1, 2021, 2)])
+        refreshed = self._scores(2021)
+
+        self.assertEqual(matches["id"], [1])
+        self.assertEqual(refreshed, [2])
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertGreater(stats["tiers"]["degraded_calls"], 0)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
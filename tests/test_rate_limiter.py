@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import importlib.util
+import threading
+import time
+import unittest
+
+import redis
+
+from app.data_service.fetch.rate_limiter import LocalTokenBucket, RedisRateLimiter
+
+try:
+    import fakeredis
+except ImportError:  # pragma: no cover - test dependency from requirements-dev.txt
+    fakeredis = None  # type: ignore[assignment]
+
+# fakeredis runs Lua scripts through lupa, installed by its "lua" extra
+HAS_FAKE_REDIS_LUA = fakeredis is not None and importlib.util.find_spec("lupa") is not None
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _DownRedis:
+    """Client whose scripts always fail, as when the Redis host is unreachable."""
+
+    def register_script(self, script: str):
+        def run(keys=None, args=None):
+            raise redis.ConnectionError("connection refused")
+        return run
+
+
+class TestLocalTokenBucket(unittest.TestCase):
+    def test_returns_exact_wait_and_refills(self) -> None:
+        clock = _Clock()
+        bucket = LocalTokenBucket(capacity=2, rate=0.5, clock=clock)
+
+        self.assertEqual(bucket.try_acquire(), 0.0)
+        self.assertEqual(bucket.try_acquire(), 0.0)
+        self.assertAlmostEqual(bucket.try_acquire(), 2.0)
+
+        clock.now = 1.0
+        self.assertAlmostEqual(bucket.try_acquire(), 1.0)
+        clock.now = 2.0
+        self.assertEqual(bucket.try_acquire(), 0.0)
+
+    def test_limiter_falls_back_to_local_bucket_without_redis(self) -> None:
+        limiter = RedisRateLimiter(limit=10, window=60, redis_client=_DownRedis())
+
+        self.assertEqual(limiter.try_acquire(), 0.0)
+        self.assertAlmostEqual(limiter.try_acquire(), 6.0, places=1)
+
+
+@unittest.skipUnless(HAS_FAKE_REDIS_LUA, "install requirements-dev.txt for fakeredis with Lua support")
+class TestRedisTokenBucket(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = fakeredis.FakeServer()
+
+    def _limiter(self, **kwargs) -> RedisRateLimiter:
+        return RedisRateLimiter(
+            key_prefix="rate_limit:test",
+            redis_client=fakeredis.FakeRedis(server=self.server),
+            **kwargs,
+        )
+
+    def test_script_reports_the_wait_for_the_next_token(self) -> None:
+        limiter = self._limiter(limit=10, window=60, burst=2)
+
+        self.assertEqual(limiter.try_acquire(), 0.0)
+        self.assertEqual(limiter.try_acquire(), 0.0)
+        wait = limiter.try_acquire()
+
+        self.assertGreater(wait, 5.9)
+        self.assertLessEqual(wait, 6.0)
+
+    def test_concurrent_workers_never_exceed_the_quota(self) -> None:
+        limit, window, total = 20, 1.0, 30
+        # One limiter per "process": separate clients sharing only the Redis server
+        limiters = [self._limiter(limit=limit, window=window) for _ in range(4)]
+        grants: list[float] = []
+        lock = threading.Lock()
+
+        def worker(limiter: RedisRateLimiter) -> None:
+            while True:
+                with lock:
+                    if len(grants) >= total:
+                        return
+                limiter.wait_if_needed()
+                with lock:
+                    grants.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker, args=(limiters[idx % 4],)) for idx in range(8)]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        grants.sort()
+        half = limit // 2
+        for idx in range(len(grants) - half - 1):
+            # half a window can never hold more than half the quota plus the burst token
+            self.assertGreaterEqual(grants[idx + half + 1] - grants[idx], window / 2 - 0.02)
+        # ...while the quota is still used at (close to) its full rate
+        self.assertGreaterEqual(elapsed, (len(grants) - 8) / limit)
+        self.assertLess(elapsed, total / limit + 0.75)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
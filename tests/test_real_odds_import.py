@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.data_service.db.database.db_schema import Base, Match, Team
+from app.data_service.team_identity import TeamResolver
+from app.seeds import seed_real_odds
+from app.seeds.seed_real_odds import import_odds, parse_odds_csv, resolve_teams
+
+CSV = b"""Div,Date,HomeTeam,AwayTeam,FTHG,FTAG,B365H,B365D,B365A
+E0,11/08/2023,Burnley,Man City,0,3,8.00,5.25,1.33
+E0,12/08/23,Arsenal,Nottingham Forest,2,1,1.18,7.50,15.00
+E0,12/08/2023,Man United,Wolves,1,0,1.50,4.50,6.00
+E0,13/08/2023,Atlantis,Arsenal,0,0,2.00,3.00,4.00
+E0,19/08/2023,Arsenal,Man City,1,1,2.50,3.40,2.80
+E0,not a date,Arsenal,Burnley,1,1,2.50,3.40,2.80
+"""
+
+
+class TestRealOddsImport(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.session.add_all([
+            Team(id=328, name="Burnley FC", short_name="Burnley"),
+            Team(id=65, name="Manchester City FC", short_name="Man City"),
+            Team(id=57, name="Arsenal FC", short_name="Arsenal"),
+            Team(id=351, name="Nottingham Forest FC", short_name="Nottingham"),
+            Team(id=66, name="Manchester United FC", short_name="Man United"),
+            Team(id=76, name="Wolverhampton Wanderers FC", short_name="Wolves"),
+        ])
+        self.session.add_all([
+            # Stored in UTC, an evening kickoff lands on the next day
+            Match(id=1, competition_id=2021, season_year="2023", utc_date=datetime(2023, 8, 11, 19, 0),
+                  status="FINISHED", home_team_id=328, away_team_id=65),
+            Match(id=2, competition_id=2021, season_year="2023", utc_date=datetime(2023, 8, 12, 12, 30),
+                  status="FINISHED", home_team_id=57, away_team_id=351),
+            Match(id=3, competition_id=2021, season_year="2023", utc_date=datetime(2023, 8, 12, 19, 0),
+                  status="FINISHED", home_team_id=66, away_team_id=76, odds_home=1.55),
+        ])
+        self.session.commit()
+
+    def tearDown(self) -> None:
+        self.session.close()
+
+    def test_csv_dates_are_parsed_in_both_year_layouts(self) -> None:
+        frame = parse_odds_csv(CSV)
+
+        self.assertEqual(len(frame), 5)
+        self.assertEqual(list(frame['date'].dt.strftime("%Y-%m-%d"))[:3], ["2023-08-11", "2023-08-12", "2023-08-12"])
+
+    def test_missing_odds_are_filled_by_one_join(self) -> None:
+        frame = resolve_teams(parse_odds_csv(CSV), TeamResolver(self.session), 2021)
+
+        report = import_odds(self.session.connection(), frame)
+        self.session.commit()
+
+        odds = {m.id: (m.odds_home, m.odds_draw, m.odds_away) for m in self.session.query(Match).all()}
+        self.assertEqual(odds[1], (8.0, 5.25, 1.33))
+        self.assertEqual(odds[2], (1.18, 7.5, 15.0))
+        # Already priced: kept as stored
+        self.assertEqual(odds[3], (1.55, None, None))
+        self.assertEqual((report.rows, report.unresolved, report.matched, report.unmatched, report.updated),
+                         (5, 1, 3, 1, 2))
+        self.assertEqual(report.unresolved_names, ["Atlantis"])
+
+    def test_failed_import_raises_the_original_error(self) -> None:
+        frame = resolve_teams(parse_odds_csv(CSV), TeamResolver(self.session), 2021)
+
+        with mock.patch.object(seed_real_odds, "bulk_insert", side_effect=RuntimeError("copy failed")):
+            with self.assertRaisesRegex(RuntimeError, "copy failed"):
+                import_odds(self.session.connection(), frame)
+        self.session.rollback()
+
+        self.assertEqual(import_odds(self.session.connection(), frame).updated, 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
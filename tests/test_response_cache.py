@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import date
+from typing import Any
+
+from app.data_service.fetch.fetcher import CURRENT_SEASON_TTL, LIVE_TTL, FootballDataClient, cache_ttl
+from app.data_service.fetch.payload_archive import PayloadArchive
+from app.data_service.fetch.response_cache import ResponseCache
+
+
+class _Response:
+    def __init__(self, status_code: int, payload: Any = None, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+
+    def json(self) -> Any:
+        return self._payload
+
+
+class _Transport:
+    def __init__(self, responses: list[_Response]) -> None:
+        self.responses = responses
+        self.calls: list[dict] = []
+
+    def get(self, url: str, params: dict | None = None, headers: dict | None = None) -> _Response:
+        self.calls.append({"url": url, "params": params, "headers": headers or {}})
+        return self.responses.pop(0)
+
+
+class _Limiter:
+    def __init__(self) -> None:
+        self.requests = 0
+
+    def wait_if_needed(self) -> None:
+        self.requests += 1
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCacheTtl(unittest.TestCase):
+    def test_closed_seasons_never_expire(self) -> None:
+        today = date(2025, 8, 1)
+
+        self.assertIsNone(cache_ttl("competitions/PL/matches", {"season": "2023"}, today))
+        self.assertIsNone(cache_ttl("competitions/PL/standings", {"season": "2024"}, today))
+        self.assertEqual(cache_ttl("competitions/PL/matches", {"season": "2025"}, today), CURRENT_SEASON_TTL)
+
+    def test_date_windows_and_fixtures_are_short_lived(self) -> None:
+        self.assertEqual(cache_ttl("competitions/PL/matches", {"dateFrom": "2025-01-01"}), LIVE_TTL)
+        self.assertEqual(cache_ttl("matches", {"status": "SCHEDULED"}), LIVE_TTL)
+
+
+class TestFootballDataClientCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.clock = _Clock()
+        self.cache = ResponseCache(self.tmp.name, clock=self.clock)
+        self.archive = PayloadArchive(f"{self.tmp.name}/archive")
+        self.client = FootballDataClient(cache=self.cache, archive=self.archive, replay=False)
+        self.client.limiter = _Limiter()
+
+    def tearDown(self) -> None:
+        self.archive.close()
+        self.tmp.cleanup()
+
+    def test_finished_season_is_served_from_disk(self) -> None:
+        payload = {"matches": [{"id": 1, "status": "FINISHED", "score": {"fullTime": {"home": 2}}}]}
+        self.client.transport = _Transport([_Response(200, payload)])
+
+        first = self.client.fetch_multiple_seasons("PL", ["2021"])
+        second = FootballDataClient(
+            cache=self.cache, transport=self.client.transport, archive=self.archive, replay=False
+        ).fetch_multiple_seasons("PL", ["2021"])
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.client.transport.calls), 1)
+        self.assertEqual(self.client.limiter.requests, 1)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_stale_entry_is_revalidated_with_validators(self) -> None:
+        params = {"dateFrom": "2025-01-01", "dateTo": "2025-01-07"}
+        self.client.transport = _Transport([
+            _Response(200, {"matches": []}, {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}),
+            _Response(304),
+        ])
+
+        self.client._get("competitions/PL/matches", params)
+        self.clock.now += LIVE_TTL + 1
+        result = self.client._get("competitions/PL/matches", params)
+
+        self.assertEqual(result, {"matches": []})
+        headers = self.client.transport.calls[1]["headers"]
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(headers["If-Modified-Since"], "Wed, 01 Jan 2025 00:00:00 GMT")
+        self.assertEqual(self.cache.stats()["revalidated"], 1)
+        self.assertTrue(self.cache.load("competitions/PL/matches", params).is_fresh(self.clock()))
+
+    def test_failed_cache_and_archive_writes_keep_the_payload(self) -> None:
+        def fail(*args, **kwargs):
+            raise OSError(28, "No space left on device")
+
+        payload = {"matches": [{"id": 1, "status": "FINISHED"}]}
+        self.client.transport = _Transport([_Response(200, payload)])
+        self.cache.store = fail
+        self.archive.append = fail
+
+        with self.assertLogs("app.data_service.fetch.fetcher", level="WARNING") as logs:
+            result = self.client._get("competitions/PL/matches", {"season": "2021"})
+
+        self.assertEqual(result, payload)
+        self.assertEqual(len(logs.records), 2)
+        self.assertTrue(all("No space left" in line for line in logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import unittest
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.data_service.db.data_service import DataService
+from app.data_service.db.database.db_schema import Base, Player, SeedCheckpoint, Team, TeamStanding
+from app.data_service.db.repositories.checkpoint_repository import SeedCheckpointRepository
+from app.seeds import seed_competitions as competitions_module
+from app.seeds import seed_players as players_module
+from app.seeds.checkpoints import SeedRun, format_duration
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSeedCheckpoints(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.checkpoints = SeedCheckpointRepository(self.session)
+
+    def tearDown(self) -> None:
+        self.session.close()
+
+    def _run(self, refresh: bool = False, now: datetime | None = None) -> SeedRun:
+        return SeedRun(self.checkpoints, "matches", 4, refresh=refresh, clock=_Clock(), now=now)
+
+    def test_rerun_skips_completed_units(self) -> None:
+        first = self._run()
+        for season in ("2021", "2022"):
+            self.assertTrue(first.pending("PL", season))
+            first.complete("PL", season, rows=380)
+        first.fail("PL", "2023")
+
+        rerun = self._run()
+
+        self.assertEqual([s for s in ("2021", "2022", "2023", "2024") if rerun.pending("PL", s)], ["2023", "2024"])
+        self.assertEqual(rerun.skipped, 2)
+        self.assertEqual(self.session.get(SeedCheckpoint, ("matches", "PL", "2021", 0)).rows, 380)
+
+    def test_refresh_clears_the_step(self) -> None:
+        self._run().complete("PL", "2021")
+
+        rerun = self._run(refresh=True)
+
+        self.assertTrue(rerun.pending("PL", "2021"))
+        self.assertEqual(self.session.query(SeedCheckpoint).count(), 0)
+
+    def test_units_that_can_still_change_expire(self) -> None:
+        run = self._run()
+        run.complete("PL", "2021")
+        run.complete(team_id=57)
+
+        next_night = self._run(now=datetime.utcnow() + timedelta(hours=21))
+
+        self.assertFalse(next_night.pending("PL", "2021"))
+        self.assertTrue(next_night.pending(team_id=57))
+
+    def test_eta_extrapolates_from_units_run(self) -> None:
+        run = self._run()
+        run.clock.now = 10.0
+        run.complete("PL", "2022")
+
+        self.assertEqual(run.remaining, 3)
+        self.assertAlmostEqual(run.eta(), 30.0)
+        self.assertEqual(format_duration(run.eta()), "30s")
+        self.assertEqual(format_duration(3725), "1h02m")
+
+
+
+_STANDING = {"position": 1, "team": {"id": 57}, "points": 3, "won": 1, "draw": 0, "lost": 0,
+             "goalsFor": 2, "goalsAgainst": 1, "goalDifference": 1}
+_SCORER = {"player": {"id": 7, "name": "Striker"}, "team": {"id": 57}, "goals": 10}
+
+
+class _Client:
+    """Serves canned payloads per season or team; unknown keys answer None like a failed call."""
+    def __init__(self, standings=None, scorers=None, squads=None) -> None:
+        self.standings = standings or {}
+        self.scorers = scorers or {}
+        self.squads = squads or {}
+        self.transport = SimpleNamespace(stats=lambda: {})
+
+    def fetch_standings(self, code, season):
+        return self.standings.get(season)
+
+    def fetch_top_scorers(self, code, season):
+        return self.scorers.get(season)
+
+    def fetch_team_squad(self, team_id):
+        return self.squads.get(team_id)
+
+    def cache_stats(self):
+        return None
+
+
+class TestSeedsCheckpointOnlyWrittenUnits(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+
+        @contextmanager
+        def service():
+            yield DataService(self.session)
+        self.service = service
+
+    def tearDown(self) -> None:
+        self.session.close()
+
+    def _completed(self, step: str) -> set:
+        return set(SeedCheckpointRepository(self.session).completed(step))
+
+    def test_seasons_with_a_failed_or_missing_write_stay_pending(self) -> None:
+        client = _Client(
+            standings={"2022": {"standings": [{"table": [_STANDING]}]},
+                       # A row missing its points makes the standings write fail
+                       "2023": {"standings": [{"table": [{k: v for k, v in _STANDING.items() if k != "points"}]}]},
+                       "2024": {"standings": [{"table": [_STANDING]}]}},
+            scorers={"2022": {"scorers": [_SCORER]}, "2023": {"scorers": [_SCORER]}, "2024": {"count": 0}},
+        )
+
+        with patch.object(competitions_module, "get_db_service", self.service), \
+                patch.object(competitions_module, "FootballDataClient", lambda: client), \
+                patch.object(competitions_module, "COMPETITIONS_MAP", {"PL": 2021}), \
+                patch.object(competitions_module, "SEASONS", ["2022", "2023", "2024"]):
+            competitions_module.seed_competitions()
+
+        self.assertEqual(self._completed("context"), {("PL", "2022", 0)})
+        self.assertEqual(self.session.query(TeamStanding).filter_by(season_year="2023").count(), 0)
+
+    def test_failed_squad_batch_is_skipped_and_later_batches_are_saved(self) -> None:
+        self.session.add_all([Team(id=team_id, name=f"Team {team_id}") for team_id in (1, 2, 3)])
+        self.session.commit()
+        # A player without a name fails the bulk load of the first batch
+        client = _Client(squads={1: {"squad": [{"id": 10}]}, 2: {"squad": [{"id": 20, "name": "Back"}]},
+                                 3: {"squad": [{"id": 30, "name": "Keeper"}]}})
+
+        with patch.object(players_module, "get_db_service", self.service), \
+                patch.object(players_module, "FootballDataClient", lambda: client), \
+                patch.object(players_module, "SQUAD_FLUSH_SIZE", 2):
+            players_module.seed_players()
+
+        self.assertEqual(self._completed("players"), {("", "", 3)})
+        self.assertEqual([p.id for p in self.session.query(Player).all()], [30])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
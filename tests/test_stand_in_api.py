@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+from datetime import date
+from unittest import mock
+
+from app.data_service.fetch.fetcher import FootballDataClient, default_response_cache, host_namespace
+from app.data_service.fetch.payload_archive import FOOTBALL_DATA, PayloadArchive
+from app.data_service.fetch.response_cache import ResponseCache
+from app.data_service.fetch.stand_in_api import LocalFootballDataServer, StandInApi, SyntheticFootballData
+
+TODAY = date(2024, 1, 15)
+
+
+class _NoLimit:
+    def wait_if_needed(self):
+        pass
+
+
+def _get(url: str) -> tuple[int, dict, dict]:
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.status, json.loads(response.read()), dict(response.headers)
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read()), dict(e.headers)
+
+
+class TestSyntheticFootballData(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = SyntheticFootballData({"PL": 2021}, today=TODAY)
+
+    def test_season_is_a_deterministic_double_round_robin(self) -> None:
+        matches = self.data.matches("PL", 2023)
+        pairs = {(m["homeTeam"]["id"], m["awayTeam"]["id"]) for m in matches}
+
+        self.assertEqual(len(matches), 380)
+        self.assertEqual(len(pairs), 380)
+        self.assertEqual(max(m["matchday"] for m in matches), 38)
+        self.assertEqual(matches, SyntheticFootballData({"PL": 2021}, today=TODAY).matches("PL", 2023))
+        self.assertNotEqual(matches, SyntheticFootballData({"PL": 2021}, today=TODAY, seed=1).matches("PL", 2023))
+
+    def test_only_past_matches_are_finished(self) -> None:
+        for match in self.data.matches("PL", 2023):
+            finished = match["utcDate"][:10] < TODAY.isoformat()
+            self.assertEqual(match["status"], "FINISHED" if finished else "TIMED")
+            self.assertEqual(match["score"]["fullTime"]["home"] is not None, finished)
+
+    def test_standings_add_up_from_the_results(self) -> None:
+        table = self.data.standings("PL", 2022)
+        goals = sum(m["score"]["fullTime"]["home"] + m["score"]["fullTime"]["away"]
+                    for m in self.data.matches("PL", 2022))
+
+        self.assertEqual([row["playedGames"] for row in table], [38] * 20)
+        self.assertEqual(sum(row["goalsFor"] for row in table), goals)
+        self.assertEqual(sum(row["goalDifference"] for row in table), 0)
+        self.assertEqual([row["position"] for row in table], list(range(1, 21)))
+        self.assertTrue(all(a["points"] >= b["points"] for a, b in zip(table, table[1:])))
+
+
+class TestLocalFootballDataServer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.api = StandInApi(SyntheticFootballData({"PL": 2021, "PD": 2014}, today=TODAY))
+        self.server = LocalFootballDataServer(self.api).start()
+        self.archive = PayloadArchive(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        self.archive.close()
+        self.tmp.cleanup()
+
+    def test_client_seeds_from_the_configured_base_url(self) -> None:
+        client = FootballDataClient(cache=ResponseCache(self.tmp.name), archive=self.archive,
+                                    replay=False, base_url=self.server.base_url)
+        client.limiter = _NoLimit()
+
+        seasons = client.fetch_multiple_seasons("PL", ["2022", "2023"])
+        team_id = seasons["2022"][0]["homeTeam"]["id"]
+        squad = client.fetch_team_squad(team_id)
+
+        self.assertEqual(client.base_url, self.server.base_url)
+        self.assertEqual(len(seasons["2022"]), 380)
+        self.assertLess(len(seasons["2023"]), 380)
+        self.assertEqual(squad["id"], team_id)
+        self.assertEqual(len(squad["squad"]), 25)
+        self.assertEqual(client.fetch_competition_details("PD")["id"], 2014)
+        self.assertIsNone(client.fetch_competition_details("XX"))
+        self.assertEqual(self.api.stats()["requests"], 5)
+
+    def test_other_hosts_never_share_the_real_api_cache_or_archive(self) -> None:
+        client = FootballDataClient(cache=ResponseCache(self.tmp.name), archive=self.archive,
+                                    replay=False, base_url=self.server.base_url)
+        client.limiter = _NoLimit()
+        client.fetch_competition_details("PL")
+        netloc = self.server.base_url.split("/")[2]
+
+        self.assertEqual(client.source, f"{FOOTBALL_DATA}@{netloc}")
+        self.assertIsNone(self.archive.latest(FOOTBALL_DATA, "competitions/PL"))
+        self.assertIsNotNone(self.archive.latest(client.source, "competitions/PL"))
+        with mock.patch.dict(os.environ, {"SOCCER_ANALYTICS_HTTP_CACHE_DIR": self.tmp.name}):
+            self.assertNotEqual(default_response_cache(host_namespace(client.base_url)).directory,
+                                default_response_cache().directory)
+
+    def test_filters_and_multi_competition_matches(self) -> None:
+        base = self.server.base_url
+        _, window, _ = _get(f"{base}competitions/PL/matches?dateFrom=2024-01-01&dateTo=2024-01-31")
+        _, both, _ = _get(f"{base}matches?competitions=PL,2014&dateFrom=2024-01-01&dateTo=2024-01-31")
+        _, scheduled, _ = _get(f"{base}competitions/PL/matches?season=2023&status=TIMED")
+        status, _, _ = _get(f"{base}competitions/PL/matches?season=2031")
+
+        self.assertTrue(all("2024-01-01" <= m["utcDate"][:10] <= "2024-01-31" for m in window["matches"]))
+        self.assertEqual(len(both["matches"]), 2 * len(window["matches"]))
+        self.assertEqual({m["competition"]["code"] for m in both["matches"]}, {"PL", "PD"})
+        self.assertTrue(scheduled["matches"] and all(m["status"] == "TIMED" for m in scheduled["matches"]))
+        self.assertEqual(status, 404)
+
+    def test_quota_is_answered_with_429_and_retry_after(self) -> None:
+        self.api.rate_limit = 2
+        url = f"{self.server.base_url}competitions/PL"
+
+        responses = [_get(url) for _ in range(3)]
+
+        self.assertEqual([status for status, _, _ in responses], [200, 200, 429])
+        self.assertEqual(responses[1][2]["X-Requests-Available-Minute"], "0")
+        self.assertGreater(int(responses[2][2]["Retry-After"]), 0)
+        self.assertEqual(responses[2][1]["errorCode"], 429)
+        self.assertEqual(self.api.stats()["throttled"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
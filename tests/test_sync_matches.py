@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import unittest
+from contextlib import contextmanager
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.data_service.db.data_service import DataService
+from app.data_service.db.database.db_schema import Base, Match
+from app.data_service.db.repositories.match_repository import MatchRepository
+from app.data_service.db.repositories.sync_repository import SyncStateRepository
+from app.seeds import sync_matches as sync_module
+from app.seeds.sync_matches import latest_finished_kickoff, seasons_since, sync_window
+
+
+def _payload(match_id: int, competition_id: int = 2021, status: str = "FINISHED", home: int | None = 2,
+             utc_date: str = "2024-03-02T15:00:00Z", odds: dict | None = None) -> dict:
+    return {
+        "id": match_id,
+        "competition": {"id": competition_id},
+        "season": {"startDate": "2023-08-11"},
+        "utcDate": utc_date,
+        "status": status,
+        "matchday": 27,
+        "stage": "REGULAR_SEASON",
+        "homeTeam": {"id": 10, "name": "North FC"},
+        "awayTeam": {"id": 11, "name": "South FC"},
+        "score": {
+            "winner": "HOME_TEAM" if home else None,
+            "fullTime": {"home": home, "away": 0 if home is not None else None},
+            "halfTime": {"home": 1 if home is not None else None, "away": 0 if home is not None else None},
+        },
+        "odds": odds or {},
+    }
+
+
+class _Client:
+    """Records which fetch the sync chose; a None result stands for a failed call."""
+    def __init__(self, window=None, seasons=None) -> None:
+        self.window = window
+        self.seasons = seasons or {}
+        self.calls: list[tuple] = []
+        self.transport = SimpleNamespace(stats=lambda: {})
+
+    def fetch_matches_window(self, code, date_from, date_to):
+        self.calls.append(("window", date_from, date_to))
+        return self.window
+
+    def fetch_multiple_seasons(self, code, seasons):
+        self.calls.append(("seasons", *seasons))
+        return {season: self.seasons[season] for season in seasons if season in self.seasons}
+
+    def fetch_competition_details(self, code):
+        return {"id": 2021, "name": "Premier League", "code": code, "type": "LEAGUE",
+                "area": {"name": "England", "code": "ENG"}}
+
+    def cache_stats(self):
+        return None
+
+
+class TestIncrementalSync(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.repo = MatchRepository(self.session)
+
+    def tearDown(self) -> None:
+        self.session.close()
+
+    def test_only_changed_rows_are_written(self) -> None:
+        self.repo.upsert_changed([
+            _payload(1, odds={"homeWin": 1.9, "draw": 3.4, "awayWin": 4.2}),
+            _payload(2, status="SCHEDULED", home=None),
+            _payload(3, competition_id=2014),
+        ])
+
+        changed = self.repo.upsert_changed([
+            _payload(1),
+            _payload(2),
+            _payload(3, competition_id=2014),
+        ])
+
+        self.assertEqual(changed, {2021: 1})
+        self.assertEqual(self.session.get(Match, 2).status, "FINISHED")
+        self.assertEqual(self.session.get(Match, 1).odds_home, 1.9)
+
+    def test_new_matches_are_inserted(self) -> None:
+        changed = self.repo.upsert_changed([_payload(1), _payload(2, competition_id=2014)])
+
+        self.assertEqual(changed, {2021: 1, 2014: 1})
+        self.assertEqual(self.session.query(Match).count(), 2)
+
+    def test_high_water_mark_only_moves_forward(self) -> None:
+        sync = SyncStateRepository(self.session)
+        sync.mark_synced(2021, datetime(2024, 3, 2, 15))
+        sync.mark_synced(2021, datetime(2024, 2, 1, 15))
+        sync.mark_synced(2021, None)
+
+        self.assertEqual(sync.high_water_mark(2021), datetime(2024, 3, 2, 15))
+        self.assertIsNone(sync.high_water_mark(2014))
+
+    def test_window_and_high_water_mark_helpers(self) -> None:
+        today = date(2024, 3, 10)
+
+        self.assertEqual(sync_window(datetime(2024, 3, 2, 15), today), (date(2024, 2, 28), date(2024, 3, 17)))
+        self.assertIsNone(sync_window(datetime(2024, 1, 20, 15), today))
+        self.assertEqual(seasons_since(datetime(2023, 5, 28, 15), today), ["2022", "2023"])
+        self.assertEqual(
+            latest_finished_kickoff([
+                _payload(1, utc_date="2024-03-02T15:00:00Z"),
+                _payload(2, utc_date="2024-03-09T15:00:00Z", status="SCHEDULED", home=None),
+            ]),
+            datetime(2024, 3, 2, 15),
+        )
+
+    def _sync(self, client: _Client, today: date) -> set:
+        @contextmanager
+        def service():
+            yield DataService(self.session)
+
+        with patch.object(sync_module, "get_db_service", service):
+            return sync_module.sync_matches({"PL": 2021}, today=today, client=client)
+
+    def test_failed_window_keeps_the_high_water_mark(self) -> None:
+        sync = SyncStateRepository(self.session)
+        sync.mark_synced(2021, datetime(2024, 3, 2, 15))
+
+        affected = self._sync(_Client(window=None), date(2024, 3, 10))
+
+        self.assertEqual(affected, set())
+        self.assertEqual(sync.high_water_mark(2021), datetime(2024, 3, 2, 15))
+
+    def test_lapsed_sync_refetches_the_seasons_since_the_mark(self) -> None:
+        sync = SyncStateRepository(self.session)
+        sync.mark_synced(2021, datetime(2023, 12, 30, 15))
+        client = _Client(seasons={"2023": [_payload(1, utc_date="2024-02-10T15:00:00Z")]})
+
+        affected = self._sync(client, date(2024, 3, 10))
+
+        self.assertEqual(client.calls, [("seasons", "2023")])
+        self.assertEqual(affected, {"PL"})
+        self.assertEqual(sync.high_water_mark(2021), datetime(2024, 2, 10, 15))
+
+    def test_partial_first_sync_leaves_the_competition_unsynced(self) -> None:
+        sync = SyncStateRepository(self.session)
+        seasons = ["2021", "2022", "2023", "2024"]
+        finished = [_payload(1, utc_date="2025-05-01T15:00:00Z")]
+
+        with patch.object(sync_module, "SEASONS", seasons):
+            affected = self._sync(_Client(seasons={"2024": finished}), date(2025, 5, 10))
+            self.assertEqual(affected, set())
+            self.assertIsNone(sync.high_water_mark(2021))
+            self.assertEqual(self.session.query(Match).count(), 0)
+
+            retry = _Client(seasons={"2021": [], "2022": [], "2023": [], "2024": finished})
+            self._sync(retry, date(2025, 5, 10))
+
+        self.assertEqual(retry.calls, [("seasons", *seasons)])
+        self.assertEqual(sync.high_water_mark(2021), datetime(2025, 5, 1, 15))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
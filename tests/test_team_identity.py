@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.data_service import team_identity
+from app.data_service.db.database.db_schema import Base, Match, Team, TeamAlias
+from app.data_service.team_identity import ODDS_CSV, SPORTSDB, UNDERSTAT, TeamResolver, normalize_team_name
+from app.web import scores
+
+
+class TestTeamIdentity(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.Session = sessionmaker(bind=engine)
+        self.session = self.Session()
+        self.session.add_all([
+            Team(id=66, name="Manchester United FC", short_name="Man United"),
+            Team(id=65, name="Manchester City FC", short_name="Man City"),
+            Team(id=5, name="FC Bayern München", short_name="Bayern"),
+            Team(id=108, name="FC Internazionale Milano", short_name="Inter"),
+            Team(id=1783, name="SC Internacional", short_name="Internacional"),
+        ])
+        self.session.commit()
+
+    def tearDown(self) -> None:
+        self.session.close()
+
+    def test_normalization_drops_accents_and_club_tokens(self) -> None:
+        self.assertEqual(normalize_team_name("FC Bayern München"), "bayern munchen")
+        self.assertEqual(normalize_team_name("Brighton & Hove Albion FC"), "brighton and hove albion")
+        self.assertEqual(normalize_team_name(None), "")
+
+    def test_names_are_scored_once_and_persisted(self) -> None:
+        resolver = TeamResolver(self.session)
+        candidates = {66: "Manchester United FC", 65: "Manchester City FC", 5: "FC Bayern München"}
+        resolved = resolver.resolve_many(
+            ODDS_CSV, ["Man United", "Man City", "Bayern Munich", "Man United", "Atlantis"], candidates
+        )
+
+        self.assertEqual(resolved, {"Man United": 66, "Man City": 65, "Bayern Munich": 5, "Atlantis": None})
+        self.assertEqual(resolver.fuzzy_scored, 2)
+        self.assertEqual(self.session.query(TeamAlias).count(), 3)
+
+        rerun = TeamResolver(self.Session())
+        with patch.object(team_identity.process, "cdist", side_effect=AssertionError("no scoring expected")):
+            self.assertEqual(rerun.resolve_many(ODDS_CSV, ["Man City", "Bayern Munich"]), {"Man City": 65, "Bayern Munich": 5})
+
+    def test_candidates_narrow_fuzzy_matching(self) -> None:
+        resolver = TeamResolver(self.session)
+
+        serie_a = resolver.resolve(UNDERSTAT, "Inter", candidates={108: "FC Internazionale Milano", 65: "Manchester City FC"})
+        brazil = resolver.resolve("other_source", "Internacional", candidates={1783: "SC Internacional"})
+
+        self.assertEqual((serie_a, brazil), (108, 1783))
+
+    def test_unscoped_lookups_are_exact_and_not_persisted(self) -> None:
+        self.session.add(Team(id=7000, name="Real Madrid CF", short_name="Real Madrid"))
+        self.session.commit()
+        resolver = TeamResolver(self.session)
+
+        resolved = resolver.resolve_many(UNDERSTAT, ["Real Madrid", "Real Madrid Castilla", "Man City"])
+
+        self.assertEqual(resolved, {"Real Madrid": 7000, "Real Madrid Castilla": None, "Man City": 65})
+        self.assertEqual(resolver.fuzzy_scored, 0)
+        self.assertEqual(self.session.query(TeamAlias).count(), 0)
+        self.assertIsNone(resolver.resolve(UNDERSTAT, "Real Madrid Castilla", candidates={}))
+
+    def test_sources_keep_separate_aliases(self) -> None:
+        self.session.add(TeamAlias(source=UNDERSTAT, alias="inter", team_id=1783))
+        self.session.commit()
+
+        resolver = TeamResolver(self.session)
+
+        self.assertEqual(resolver.resolve(UNDERSTAT, "Inter"), 1783)
+        self.assertEqual(resolver.resolve(ODDS_CSV, "Inter"), 108)
+
+    def test_daily_scores_are_resolved_per_league(self) -> None:
+        self.session.add(Match(id=1, competition_id=2021, home_team_id=66, away_team_id=65))
+        self.session.commit()
+        events = [
+            {"idLeague": "4328", "strLeague": "English Premier League", "strHomeTeam": "Man United",
+             "strAwayTeam": "Man City", "intHomeScore": "1", "intAwayScore": "2"},
+            {"idLeague": "9999", "strLeague": "Friendlies", "strHomeTeam": "FC Internazionale Milano",
+             "strAwayTeam": "Inter Miami"},
+        ]
+        response = SimpleNamespace(raise_for_status=lambda: None, json=lambda: {"events": events})
+
+        with patch.object(scores, "transport", SimpleNamespace(get=lambda *args, **kwargs: response)):
+            rows = scores.fetch_daily_scores(resolver=TeamResolver(self.session))
+
+        self.assertEqual([(row["home_team_id"], row["away_team_id"]) for row in rows], [(66, 65), (108, None)])
+        self.assertEqual(
+            {alias for alias, in self.session.query(TeamAlias.alias).filter_by(source=SPORTSDB)},
+            {"man united", "man city"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
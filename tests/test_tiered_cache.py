@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+import unittest
+
+from app.data_service.db.cache.tiered_cache import LocalCache, TieredCache, make_key
+from tests.test_query_cache import _DictTier
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLocalCache(unittest.TestCase):
+    def test_evicts_expired_entries_before_live_ones(self) -> None:
+        clock = _Clock()
+        cache = LocalCache(max_entries=2, clock=clock)
+        cache.set("old", 1, ttl=1)
+        cache.set("live", 2, ttl=100)
+        clock.now = 5
+        cache.set("new", 3, ttl=100)
+
+        self.assertEqual(cache.lookup("live"), (True, 2, False))
+        self.assertEqual(cache.lookup("old"), (False, None, False))
+        self.assertEqual(len(cache), 2)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = LocalCache(max_entries=2)
+        cache.set("a", 1, ttl=100)
+        cache.set("b", 2, ttl=100)
+        cache.lookup("a")
+        cache.set("c", 3, ttl=100)
+
+        self.assertFalse(cache.lookup("b")[0])
+        self.assertTrue(cache.lookup("a")[0])
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+
+class TestTieredCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        self.remote = _DictTier()
+        self.cache = TieredCache(local=LocalCache(clock=self.clock), remote=self.remote, local_ttl=10, stale_ttl=30)
+
+    def test_remote_hits_populate_local_tier(self) -> None:
+        key = make_key("team", 66)
+        self.remote.store[key] = {"name": "North FC"}
+
+        self.assertEqual(self.cache.get(key), {"name": "North FC"})
+        self.remote.store.clear()
+        self.assertEqual(self.cache.get(key), {"name": "North FC"})
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["redis"]["hits"], 1)
+        self.assertEqual(stats["local"]["hits"], 1)
+
+    def test_stale_entries_are_served_while_revalidating(self) -> None:
+        refreshed = threading.Event()
+        calls: list[int] = []
+
+        def loader() -> int:
+            calls.append(1)
+            if len(calls) > 1:
+                refreshed.set()
+            return len(calls)
+
+        self.assertEqual(self.cache.get_or_load("competition:PL", loader, ttl=60), 1)
+        self.clock.now = 15
+        self.assertEqual(self.cache.get_or_load("competition:PL", loader, ttl=60), 1)
+        self.assertTrue(refreshed.wait(2))
+        for _ in range(50):
+            if self.cache.local.lookup("competition:PL")[1] == 2:
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual(self.cache.get_or_load("competition:PL", loader, ttl=60), 2)
+        self.assertEqual(len(calls), 2)
+
+    def test_degraded_mode_runs_on_local_tier(self) -> None:
+        self.remote.down = True
+
+        self.cache.set("teams:names", ["North FC"])
+
+        self.assertEqual(self.cache.get("teams:names"), ["North FC"])
+        self.assertEqual(self.remote.store, {})
+        self.assertTrue(self.cache.degraded)
+        self.assertGreater(self.cache.stats()["degraded_calls"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
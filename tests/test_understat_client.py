@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+
+from app.data_service.fetch.payload_archive import PayloadArchive
+from app.data_service.fetch.response_cache import ResponseCache
+from app.data_service.fetch.understat_client import UnderstatClient, extract_blobs
+
+
+def _escape(data) -> str:
+    """Encode a blob the way Understat embeds it: every non-alphanumeric byte as \\xNN."""
+    return "".join(ch if ch.isalnum() else f"\\x{ord(ch):02x}" for ch in json.dumps(data))
+
+
+DATES = [{"id": "1", "datetime": "2023-08-11 19:00:00", "xG": {"h": "1.2", "a": "0.4"}}]
+TEAMS = {"87": {"id": "87", "title": "Burnley"}}
+PLAYERS = [{"id": "1", "player_name": "Erling Haaland", "team_title": "Manchester City"}]
+
+PAGE = f"""
+<html><body>
+<script>
+    var datesData = JSON.parse('{_escape(DATES)}');
+    var teamsData	= JSON.parse('{_escape(TEAMS)}');
+</script>
+<div>lots of markup</div>
+<script>var playersData = JSON.parse('{_escape(PLAYERS)}');</script>
+</body></html>
+"""
+
+
+class _Response:
+    status_code = 200
+    text = PAGE
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class _Transport:
+    def __init__(self) -> None:
+        self.urls: list[str] = []
+
+    def get(self, url: str, **kwargs) -> _Response:
+        self.urls.append(url)
+        return _Response()
+
+
+class TestUnderstatClient(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(self.tmp.name)
+        self.archive = PayloadArchive(f"{self.tmp.name}/archive")
+
+    def tearDown(self) -> None:
+        self.archive.close()
+        self.tmp.cleanup()
+
+    def test_extracts_every_blob_in_one_pass(self) -> None:
+        blobs = extract_blobs(PAGE)
+
+        self.assertEqual(blobs, {"datesData": DATES, "teamsData": TEAMS, "playersData": PLAYERS})
+
+    def test_matches_and_players_share_a_single_download(self) -> None:
+        transport = _Transport()
+        client = UnderstatClient(transport=transport, cache=self.cache, archive=self.archive, replay=False)
+
+        self.assertEqual(client.fetch_season_data("EPL", "2023"), DATES)
+        self.assertEqual(client.fetch_player_season_data("EPL", "2023"), PLAYERS)
+        self.assertEqual(client.fetch_team_season_data("EPL", "2023"), TEAMS)
+        self.assertEqual(transport.urls, ["https://understat.com/league/EPL/2023"])
+
+    def test_past_season_pages_are_served_from_disk(self) -> None:
+        UnderstatClient(transport=_Transport(), cache=self.cache, archive=self.archive, replay=False).fetch_season_data("EPL", "2021")
+
+        transport = _Transport()
+        rerun = UnderstatClient(transport=transport, cache=self.cache, archive=self.archive, replay=False)
+
+        self.assertEqual(rerun.fetch_player_season_data("EPL", "2021"), PLAYERS)
+        self.assertEqual(transport.urls, [])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_failed_cache_and_archive_writes_keep_the_page(self) -> None:
+        def fail(*args, **kwargs):
+            raise OSError(28, "No space left on device")
+
+        self.cache.store = fail
+        self.archive.append = fail
+        client = UnderstatClient(transport=_Transport(), cache=self.cache, archive=self.archive, replay=False)
+
+        with self.assertLogs("app.data_service.fetch.understat_client", level="WARNING") as logs:
+            self.assertEqual(client.fetch_season_data("EPL", "2023"), DATES)
+
+        self.assertEqual(len(logs.records), 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
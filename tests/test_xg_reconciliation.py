@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.data_service.db.database.db_schema import Base, Match, Team
+from app.seeds.seed_understat import reconcile_xg
+
+
+def _understat(match_id: str, when: str, home: str, away: str, xg: tuple[str, str] | None = ("1.5", "0.7")) -> dict:
+    return {
+        "id": match_id,
+        "isResult": xg is not None,
+        "datetime": when,
+        "h": {"title": home},
+        "a": {"title": away},
+        "xG": {"h": xg[0], "a": xg[1]} if xg else {"h": None, "a": None},
+    }
+
+
+class TestXgReconciliation(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.session.add_all([
+            Team(id=66, name="Manchester United FC"),
+            Team(id=65, name="Manchester City FC"),
+            Team(id=57, name="Arsenal FC"),
+            Team(id=61, name="Chelsea FC"),
+            Team(id=86, name="Real Madrid CF"),
+        ])
+        kickoff = datetime(2023, 9, 2, 14, 0)
+        self.session.add_all([
+            Match(id=1, competition_id=2021, season_year="2023", utc_date=kickoff, status="FINISHED",
+                  home_team_id=66, away_team_id=57),
+            Match(id=2, competition_id=2021, season_year="2023", utc_date=kickoff, status="FINISHED",
+                  home_team_id=65, away_team_id=61),
+            Match(id=3, competition_id=2021, season_year="2023", utc_date=datetime(2023, 9, 16, 23, 30),
+                  status="FINISHED", home_team_id=57, away_team_id=65),
+            # Same day, other competition: must never receive Premier League xG
+            Match(id=4, competition_id=2014, season_year="2023", utc_date=kickoff, status="FINISHED",
+                  home_team_id=86, away_team_id=61),
+        ])
+        self.session.commit()
+
+    def tearDown(self) -> None:
+        self.session.close()
+
+    def test_rows_join_on_date_and_both_teams(self) -> None:
+        report = reconcile_xg(self.session, 2021, "2023", [
+            _understat("a", "2023-09-02 15:00:00", "Manchester City", "Chelsea", ("2.4", "0.3")),
+            _understat("b", "2023-09-02 15:00:00", "Manchester United", "Arsenal", ("1.1", "1.9")),
+            _understat("c", "2023-09-17 00:30:00", "Arsenal", "Manchester City"),
+            _understat("d", "2023-09-30 15:00:00", "Luton", "Arsenal"),
+            _understat("e", "2024-05-19 15:00:00", "Arsenal", "Chelsea", xg=None),
+        ])
+
+        xg = {m.id: (m.home_xg, m.away_xg) for m in self.session.query(Match).all()}
+        self.assertEqual(xg[1], (1.1, 1.9))
+        self.assertEqual(xg[2], (2.4, 0.3))
+        self.assertEqual(xg[3], (1.5, 0.7))
+        self.assertEqual(xg[4], (None, None))
+        self.assertEqual((report.total, report.matched), (4, 3))
+        self.assertEqual(report.unmatched, ["2023-09-30 Luton vs Arsenal"])
+        self.assertAlmostEqual(report.match_rate, 0.75)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)